@@ -0,0 +1,184 @@
+""" bootprof - Where the time and the heap go between power on and the first menu frame.
+
+Version 00
+James M. Reneau Ph.D.
+http://www.picohhg.com
+
+This work is licensed under the Creative Commons Attribution-ShareAlike 2.0 Generic License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/2.0/ or send
+a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+
+With a bootprof.cfg file on the Pico main.py starts a Profiler before anything else.  The
+Profiler wraps builtins.__import__ so the first import of every module is timed with
+time.ticks_us() and the heap it left allocated (gc.mem_alloc()) is kept.  main.py marks the
+end of each of its phases.  The first show() of the menu ends the profile and the report is
+written to boot.prof:
+
+    boot <total us> <heap>
+    <depth> <name> <us> <heap>
+
+Depth 0 lines are the main.py phases, in order, and they include the imports made during
+them.  Those imports are listed just above their phase at depth 1, the imports they make at
+depth 2 and so on.  Their times include the imports nested under them.
+
+On a workstation "python3 bootprof.py [report]" boots main.py on the emulator with the real
+clock.  It stops at the first frame and writes the same report for trending.  There the heap
+is what tracemalloc counts, so the heap numbers only compare with other workstation runs.
+
+V
+00		2026-10-18	jmr		original coding
+"""
+
+import sys
+import time
+import gc
+import builtins
+from array import array
+
+FILENAME = "boot.prof"
+
+## heap in use, tracemalloc stands in for gc.mem_alloc off the Pico
+if hasattr(gc, "mem_alloc"):
+    memAlloc = gc.mem_alloc
+else:
+    import tracemalloc
+    tracemalloc.start()
+    def memAlloc():
+        return tracemalloc.get_traced_memory()[0]
+
+class FirstFrame(Exception):
+    """ raised by the first show() when the Profiler stops the boot (workstation mode) """
+    pass
+
+class Profiler():
+
+    ## the profiler of this boot, main.py uses it when one has already been started
+    current = None
+
+    def __init__(self, filename=FILENAME, size=64):
+        self.filename = filename
+        self.names = []
+        self.depths = bytearray(size)
+        self.us = array('l', [0] * size)
+        self.heap = array('l', [0] * size)
+        self.depth = 0
+        self.done = False
+        self.stop = False ## raise FirstFrame after the report is written
+        self.oled = None
+        self.saved = None
+        self.start = time.ticks_us()
+        self.startHeap = memAlloc()
+        self.last = self.start
+        self.lastHeap = self.startHeap
+        ## bind once
+        self._importCb = self._import
+
+    @staticmethod
+    def begin():
+        """ the current profiler, a new one timing imports when there is none """
+        if Profiler.current is None:
+            Profiler.current = Profiler().wrapImports()
+        return Profiler.current
+
+    def _add(self, name, depth):
+        ## slot for an entry, None when full
+        n = len(self.names)
+        if n >= len(self.us):
+            return None
+        self.names.append(name)
+        self.depths[n] = depth
+        return n
+
+    def mark(self, name):
+        """ the phase called name ended now """
+        if self.done:
+            return
+        now = time.ticks_us()
+        heap = memAlloc()
+        i = self._add(name, 0)
+        if i is not None:
+            self.us[i] = time.ticks_diff(now, self.last)
+            self.heap[i] = heap - self.lastHeap
+        self.last = now
+        self.lastHeap = heap
+
+    def _import(self, name, *args):
+        ## builtins.__import__, only the first import of a module is timed
+        if name in sys.modules or self.done:
+            return self.saved(name, *args)
+        self.depth += 1
+        i = self._add(name, self.depth)
+        start = time.ticks_us()
+        heap = memAlloc()
+        try:
+            return self.saved(name, *args)
+        finally:
+            if i is not None:
+                self.us[i] = time.ticks_diff(time.ticks_us(), start)
+                self.heap[i] = memAlloc() - heap
+            self.depth -= 1
+
+    def wrapImports(self):
+        self.saved = builtins.__import__
+        builtins.__import__ = self._importCb
+        return self
+
+    def unwrapImports(self):
+        if self.saved:
+            builtins.__import__ = self.saved
+            self.saved = None
+
+    def firstFrame(self, oled):
+        """ end the profile when oled's next show() is done """
+        self.oled = oled
+        oled.add_probe(self)
+
+    ## oled probe
+
+    def draw(self):
+        pass
+
+    def show_start(self):
+        pass
+
+    def show_end(self):
+        self.mark("first frame")
+        self.finish()
+        if self.stop:
+            raise FirstFrame()
+
+    def finish(self):
+        """ stop profiling and write the report """
+        if self.done:
+            return
+        self.done = True
+        self.unwrapImports()
+        if self.oled:
+            self.oled.remove_probe(self)
+            self.oled = None
+        with open(self.filename, "w") as f:
+            for l in self.lines():
+                f.write(l + "\n")
+
+    def lines(self):
+        """ the report as text lines """
+        l = ["boot " + str(time.ticks_diff(self.last, self.start)) + " " + str(self.lastHeap - self.startHeap)]
+        for i in range(len(self.names)):
+            l.append(str(self.depths[i]) + " " + self.names[i] + " " + str(self.us[i]) + " " + str(self.heap[i]))
+        return l
+
+if __name__ == "__main__":
+    ## boot main.py on the emulator, with the real clock, up to the first frame
+    import emulator
+    emulator.install(fast=False, record=False)
+    prof = Profiler(sys.argv[1] if len(sys.argv) > 1 else FILENAME)
+    prof.stop = True
+    Profiler.current = prof.wrapImports()
+    ## main.py imports this module as bootprof to find the profiler
+    sys.modules["bootprof"] = sys.modules["__main__"]
+    try:
+        exec(open("main.py").read(), {"__name__": "__main__"})
+    except FirstFrame:
+        pass
+    for l in prof.lines():
+        print(l)
@@ -0,0 +1,105 @@
+""" build - Cross compile the PicoHHG modules to .mpy on a workstation.
+
+Version 00
+James M. Reneau Ph.D.
+http://www.picohhg.com
+
+This work is licensed under the Creative Commons Attribution-ShareAlike 2.0 Generic License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/2.0/ or send
+a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+
+Runs mpy-cross (pip install mpy-cross) on every module in the folder and writes the .mpy files
+and a manifest (module name and the sha256 of the source it was built from) to mpy/.  main.py
+stays a .py because it is what the Pico runs at boot.  Copy the mpy folder to the Pico with the
+sources; loader.py imports a module from its .mpy while the source on the Pico still matches
+the manifest.
+
+    python3 build.py            ## every module
+    python3 build.py sst pong   ## only these, the rest of the manifest is kept
+
+V
+00		2026-10-18	jmr		original coding
+"""
+
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+DIR = "mpy"
+MANIFEST = DIR + "/manifest.txt"
+SKIP = ("main", "boot", "build", "loader")
+## the RP2040 is a Cortex-M0+, so @micropython.native code is built for armv6m
+MARCH = "-march=armv6m"
+
+def sha256(filename):
+    h = hashlib.sha256()
+    with open(filename, "rb") as f:
+        h.update(f.read())
+    return h.hexdigest()
+
+def crossCompiler():
+    ## the mpy-cross command, from the path or the pip package
+    if shutil.which("mpy-cross"):
+        return ["mpy-cross"]
+    try:
+        import mpy_cross
+        return [sys.executable, "-m", "mpy_cross"]
+    except ImportError:
+        return None
+
+def modules():
+    ## names of the modules in the folder
+    names = []
+    for f in sorted(os.listdir(".")):
+        if f.endswith(".py") and f[:-3] not in SKIP:
+            names.append(f[:-3])
+    return names
+
+def readManifest():
+    ## name -> source hash of the last build
+    manifest = {}
+    try:
+        with open(MANIFEST) as f:
+            for line in f:
+                words = line.split()
+                if len(words) == 2:
+                    manifest[words[0]] = words[1]
+    except OSError:
+        pass
+    return manifest
+
+def build(names=None):
+    """ compile the modules (all of them when names is None), return the number that failed """
+    mpyCross = crossCompiler()
+    if mpyCross is None:
+        print("mpy-cross not found, install it with: pip install mpy-cross")
+        return 1
+    if not os.path.isdir(DIR):
+        os.mkdir(DIR)
+    manifest = readManifest()
+    failed = 0
+    for name in names or modules():
+        source = name + ".py"
+        start = time.perf_counter()
+        result = subprocess.run(mpyCross + [MARCH, "-o", DIR + "/" + name + ".mpy", source],
+            capture_output=True, text=True)
+        ms = (time.perf_counter() - start) * 1000
+        if result.returncode:
+            print(name, "failed")
+            print(result.stderr)
+            manifest.pop(name, None)
+            failed += 1
+        else:
+            manifest[name] = sha256(source)
+            print(name, str(os.path.getsize(source)) + " -> " +
+                str(os.path.getsize(DIR + "/" + name + ".mpy")) + " bytes", str(round(ms)) + " ms")
+    with open(MANIFEST, "w") as f:
+        for name in sorted(manifest):
+            f.write(name + " " + manifest[name] + "\n")
+    return failed
+
+if __name__ == "__main__":
+    sys.exit(1 if build(sys.argv[1:] or None) else 0)
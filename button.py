@@ -2,7 +2,7 @@
 Running of the buttonConfigure program will set the configuration
 file and will be needed if the default (pull up) does not work.
 
-Version 02
+Version 04
 James M. Reneau Ph.D.
 http://www.picohhg.com
 
@@ -10,18 +10,43 @@ This work is licensed under the Creative Commons Attribution-ShareAlike 2.0 Gene
 To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/2.0/ or send
 a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
 
+Button(GPIO) polls the pin like it always has.  Button(GPIO, irq=True) watches both edges with
+a pin interrupt, debounces with a machine.Timer and queues timestamped PRESS, RELEASE, LONG
+and DOUBLE events in a preallocated ring.  pressed() and event() never wait in this mode.
+
 V
 00		2023-05-08	jmr		original coding
 01		2023-05-09	jmr		split onfig out to buttonConfigure
 02		2023-05-14	jmr		added wait
+03		2026-10-18	jmr		added interrupt mode with debounce timer and event queue
+04		2026-10-18	jmr		added listener for the InputBus
 """
 
 import os
+from micropython import const
 from machine import Pin
+from machine import Timer
+from array import array
 import time
 
 class Button():
-    def __init__(self, GPIO):
+    
+    ## event codes
+    PRESS = const(1)
+    RELEASE = const(2)
+    LONG = const(3)
+    DOUBLE = const(4)
+    
+    def __init__(self, GPIO, irq=False, debounce=20, long=800, double=300, size=16):
+        """ create a button
+        Parameters:
+        :GPIO: pin number
+        :irq: True to use the pin interrupt and event queue
+        :debounce: ms the pin has to be steady before an edge counts (irq)
+        :long: ms held before a LONG event (irq)
+        :double: ms from one press to the next for a DOUBLE event (irq)
+        :size: events kept in the ring, the oldest are dropped when full (irq)
+        """
         filename = "pulldown"+str(GPIO)+".cfg"
         if filename in os.listdir():
             pull = Pin.PULL_DOWN
@@ -31,9 +56,94 @@ class Button():
 
         self.pin = Pin(GPIO, Pin.IN, pull)
         self.unpressed = self.pin.value()
+        self.irqMode = irq
+        if irq:
+            self.debounce = debounce
+            self.long = long
+            self.double = double
+            self.down = False ## debounced state
+            self.lastPress = time.ticks_add(time.ticks_ms(), -double)
+            ## ring of events, nothing is allocated in the callbacks
+            self.size = size
+            self.codes = bytearray(size)
+            self.times = array('L', [0] * size)
+            self.head = 0
+            self.tail = 0
+            self.listener = None ## called with each event code (irq)
+            self.settleTimer = Timer(-1)
+            self.longTimer = Timer(-1)
+            ## bind the callbacks once
+            self._edgeCb = self._edge
+            self._settleCb = self._settle
+            self._longCb = self._longPress
+            self.pin.irq(handler=self._edgeCb, trigger=Pin.IRQ_FALLING | Pin.IRQ_RISING)
+            
+    def _edge(self, pin):
+        ## every bounce restarts the timer, it only fires once the pin is steady
+        self.settleTimer.init(mode=Timer.ONE_SHOT, period=self.debounce, callback=self._settleCb)
+        
+    def _settle(self, t):
+        down = self.pin.value() != self.unpressed
+        if down == self.down:
+            return
+        self.down = down
+        now = time.ticks_ms()
+        if down:
+            self._push(Button.PRESS, now)
+            if time.ticks_diff(now, self.lastPress) < self.double:
+                self._push(Button.DOUBLE, now)
+                ## a third quick press starts a new pair
+                self.lastPress = time.ticks_add(now, -self.double)
+            else:
+                self.lastPress = now
+            self.longTimer.init(mode=Timer.ONE_SHOT, period=self.long, callback=self._longCb)
+        else:
+            self.longTimer.deinit()
+            self._push(Button.RELEASE, now)
+            
+    def _longPress(self, t):
+        if self.down:
+            self._push(Button.LONG, time.ticks_ms())
+            
+    def _push(self, code, when):
+        self.codes[self.head] = code
+        self.times[self.head] = when
+        self.head = (self.head + 1) % self.size
+        if self.head == self.tail:
+            ## full, drop the oldest
+            self.tail = (self.tail + 1) % self.size
+        if self.listener:
+            self.listener(code)
+            
+    def event(self):
+        ## return the next (code, ticks_ms) or None, never waits (irq)
+        if self.head == self.tail:
+            return None
+        e = (self.codes[self.tail], self.times[self.tail])
+        self.tail = (self.tail + 1) % self.size
+        return e
+    
+    def clear(self):
+        ## drop any queued events (irq)
+        self.tail = self.head
+        
+    def deinit(self):
+        ## stop the interrupt and timers (irq)
+        if self.irqMode:
+            self.pin.irq(handler=None)
+            self.settleTimer.deinit()
+            self.longTimer.deinit()
             
     def pressed(self):
         ## return True/False after debounce
+        if self.irqMode:
+            ## consume events up to the next press
+            while True:
+                e = self.event()
+                if e is None:
+                    return False
+                if e[0] == Button.PRESS:
+                    return True
         if self.pin.value() != self.unpressed:
             while self.pin.value() != self.unpressed:
                 time.sleep(.1)
@@ -49,8 +159,12 @@ class Button():
         
     def waitRelease(self):
         ## wait til press
+        if self.irqMode:
+            while self.down:
+                time.sleep(.01)
+            self.clear()
+            return
         while True:
             if not self.pressed():
                 break
             time.sleep(.1)
-            
\ No newline at end of file
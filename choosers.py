@@ -1,7 +1,7 @@
 """ Choosers - A collection of UI Widgets for the Pico (that will also
 work on a console).
 
-Version 02
+Version 15
 James M. Reneau Ph.D.
 http://www.picohhg.com
 
@@ -13,16 +13,35 @@ V
 00		2023-04-30	jmr		original coding
 01		2023-05-08	jmr		changed button to use new button object
 02		2023-05-14	jmr		adde choose ui widget
+03		2026-10-18	jmr		hardware scrolling mode for TextScroll
+04		2026-10-18	jmr		retained widget tree with damage tracking
+05		2026-10-18	jmr		repeated strings drawn through a TextCache
+06		2026-10-18	jmr		choosers wait on the InputBus when there is one
+07		2026-10-18	jmr		number choosers can use rotary acceleration
+08		2026-10-18	jmr		dial faces cached as sprites, only the hand and value redrawn
+09		2026-10-18	jmr		dials use the trig tables
+10		2026-10-18	jmr		ChooseList window of several rows with a highlight bar
+11		2026-10-18	jmr		TextScroll lazy mode wraps a list, generator or file as it is shown
+12		2026-10-18	jmr		TextScroll and MessageBox take text numbers from a StringTable
+13		2026-10-18	jmr		widgets are flat again, ChooseUI repaints them after the oled is filled
+14		2026-10-18	jmr		ChooseList rejects an empty list of options
+15		2026-10-18	jmr		lazy file text keeps wrapping from where it stopped after scrolling back
 """
 
 import time
 import math
 import sys
+import trig
+from array import array
+from strtable import Text
 
 if sys.implementation.name == 'micropython':
     from ssd1306 import SSD1306_I2C
     from machine import Pin
     from rotaryIRQ import RotaryIRQ
+    from textcache import TextCache
+    from symbols import Sprite
+    import framebuf
 
 class ChooserBaseClass():
     """ ChooserBaseClass - Holds the UI classed for the pico. """
@@ -30,12 +49,70 @@ class ChooserBaseClass():
     CHARH = 10
     CHARW = 8
     
+    ## text strip cache shared by all of the choosers (and available to games)
+    textCache = TextCache() if sys.implementation.name == 'micropython' else None
+    ## InputBus to wait on between polls (set by main.py), None sleeps a tenth of a second
+    inputBus = None
+    ## StringTable that text numbers given to TextScroll and MessageBox are read from (set by a game)
+    strings = None
+    
     def __init__(self, oled, rotary, button, prompt):
         self.oled = oled ## OLED Object
         self.rotary = rotary ## RotaryIRQ object
         self.button = button ## Button object for rotary button
         self.prompt = prompt
         
+    def cachedText(self, s, x, y, c=1, fb=None):
+        """ draw text that will be drawn again (prompts, options, labels) through the cache, on the
+        oled or on fb """
+        if fb is None:
+            fb = self.oled
+        if ChooserBaseClass.textCache is not None:
+            ChooserBaseClass.textCache.text(fb, s, x, y, c)
+        else:
+            fb.text(s, x, y, c)
+            
+    def idle(self):
+        """ wait for the rotary or button to change, the choosers then poll them as before """
+        if ChooserBaseClass.inputBus is not None:
+            if ChooserBaseClass.inputBus.wait(100) is not None:
+                ChooserBaseClass.inputBus.clear()
+        else:
+            time.sleep(.1)
+            
+    def faceSprite(self):
+        """ the dial face drawn once into a Sprite, cached by geometry and marks.  Returns the
+        sprite and the screen position of its top left corner """
+        key = (self.facex, self.facey, self.facer, self.marks)
+        f = self.faces.get(key)
+        if f is None:
+            ox, oy, w, h = self.faceBox()
+            sprite = Sprite(bytearray(w * ((h + 7) // 8)), w, h)
+            self.face(sprite, ox, oy)
+            f = (sprite, ox, oy)
+            self.faces[key] = f
+        return f
+    
+    def drawDial(self, old, v):
+        """ draw the dial for value v.  The first time (old is None) everything is drawn, after that
+        the old hand and value are erased and only what changed is damaged and sent """
+        sprite, ox, oy = self.faceSprite()
+        y = ChooserBaseClass.CHARH if self.prompt else 0
+        if old is None:
+            self.oled.fill(0)
+            self.oled.blit(sprite, ox, oy, 0)
+        else:
+            self.oled.fill_rect(0, y, len(str(old)) * ChooserBaseClass.CHARW, 8, 0)
+            self.hand(old, 0)
+            ## put back the marks under the erased hand and value, the blit does not damage
+            ## anything else because the rest of the face is already on the screen
+            framebuf.FrameBuffer.blit(self.oled, sprite, ox, oy, 0)
+        if self.prompt:
+            self.cachedText(str(self.prompt), 0, 0)
+        self.oled.text(str(v), 0, y)
+        self.hand(v)
+        self.oled.show()
+        
     def consoleNumber(self):
         """ get a number from the console """
         if self.prompt:
@@ -50,7 +127,20 @@ class ChooserBaseClass():
                 pass
             print('A number between', self.minval, 'and', self.maxval)
             
+def unionRect(a, b):
+    """ smallest (x, y, w, h) holding both rectangles, either may be None """
+    if a is None:
+        return b
+    if b is None:
+        return a
+    x = min(a[0], b[0])
+    y = min(a[1], b[1])
+    return (x, y, max(a[0]+a[2], b[0]+b[2]) - x, max(a[1]+a[3], b[1]+b[3]) - y)
+
 class ChooserUIBase():
+    """ ChooserUIBase - a retained widget.  Changing a property that alters the look marks the
+    widget dirty and paint() redraws it only when it is dirty. """
+    
     def __init__(self, oled, x, y, text, w, h):
         self.oled = oled
         self.x = x
@@ -58,8 +148,44 @@ class ChooserUIBase():
         self.w = w
         self.h = h
         self.text = text
-        self.hasFocus = False ## big border
-        self.inverse = False ## inverse colors
+        self._hasFocus = False ## big border
+        self._inverse = False ## inverse colors
+        self.dirty = True ## needs to be painted
+        
+    @property
+    def hasFocus(self):
+        return self._hasFocus
+    
+    @hasFocus.setter
+    def hasFocus(self, value):
+        if value != self._hasFocus:
+            self._hasFocus = value
+            self.invalidate()
+            
+    @property
+    def inverse(self):
+        return self._inverse
+    
+    @inverse.setter
+    def inverse(self, value):
+        if value != self._inverse:
+            self._inverse = value
+            self.invalidate()
+            
+    def invalidate(self):
+        self.dirty = True
+        
+    def bbox(self):
+        return (self.x, self.y, self.w, self.h)
+    
+    def paint(self):
+        """ draw this widget if dirty, return the damaged rectangle (x, y, w, h) or None if
+        nothing was drawn """
+        if not self.dirty:
+            return None
+        self.draw()
+        self.dirty = False
+        return self.bbox()
           
     def fgColor(self):
         if self.inverse:
@@ -206,13 +332,72 @@ class ChooseString(ChooserBaseClass):
 
 class ChooseList(ChooserBaseClass):
     """ ChooseList - Allow the user to scroll through a list of items and select one with a click
-    of thr button. """
+    of thr button.  With rows > 1 a window of that many options is shown with a highlight bar.  Moving
+    the bar redraws only the two rows that changed, scrolling the window shifts it one row and draws
+    only the new row. """
     
-    def __init__(self, oled, rotary, button, options, x=0, y=0, prompt="??"):
+    def __init__(self, oled, rotary, button, options, x=0, y=0, prompt="??", rows=1, w=None):
         super().__init__(oled, rotary, button, prompt)
+        if not options:
+            ## nothing to choose, get() could not return an option
+            raise ValueError("ChooseList needs at least one option")
         self.options = options # list of pbtions
         self.x = x
         self.y = y
+        self.rows = rows ## options shown at once
+        if w is None and sys.implementation.name == 'micropython':
+            ## wide enough for the longest option
+            w = min(max(len(o) for o in options) * ChooserBaseClass.CHARW, oled.width - x)
+        self.w = w ## window width (rows > 1)
+        
+    def drawRow(self, fb, ox, oy, r, i, c):
+        ## option i in row r of the window at (ox, oy) on fb, c is the background colour
+        y = oy + r * ChooserBaseClass.CHARH
+        fb.fill_rect(ox, y, self.w, ChooserBaseClass.CHARH, c)
+        self.cachedText(self.options[i], ox, y, 1 - c, fb)
+        
+    def getWindow(self, txt):
+        ## the rows > 1 chooser, txt is the prompt still on the screen
+        H = ChooserBaseClass.CHARH
+        n = len(self.options)
+        rows = min(self.rows, n)
+        if txt:
+            self.oled.fill_rect(self.x,self.y,len(txt)*ChooserBaseClass.CHARW,H,0)
+        ## the rows without the highlight
+        view = Sprite(bytearray(self.w * ((rows * H + 7) // 8)), self.w, rows * H)
+        offset = self.rotary.value()
+        top = 0 ## option in the first row
+        sel = -1 ## highlighted option
+        while True:
+            newsel = (offset - self.rotary.value()) % n
+            if newsel != sel:
+                newtop = top
+                if newsel < top:
+                    newtop = newsel
+                elif newsel >= top + rows:
+                    newtop = newsel - rows + 1
+                if sel < 0 or newtop != top:
+                    if sel >= 0 and abs(newtop - top) == 1:
+                        ## shift the window a row and draw the row that came into view
+                        view.scroll(0, (top - newtop) * H)
+                        r = 0 if newtop < top else rows - 1
+                        self.drawRow(view, 0, 0, r, newtop + r, 0)
+                    else:
+                        for r in range(rows):
+                            self.drawRow(view, 0, 0, r, newtop + r, 0)
+                    top = newtop
+                    self.oled.blit(view, self.x, self.y)
+                else:
+                    self.drawRow(self.oled, self.x, self.y, sel - top, sel, 0)
+                self.drawRow(self.oled, self.x, self.y, newsel - top, newsel, 1)
+                sel = newsel
+                self.oled.show()
+            # return current command after debounce
+            if self.button.pressed():
+                self.oled.fill_rect(self.x, self.y, self.w, rows * H, 0)
+                self.oled.show()
+                return self.options[sel]
+            self.idle()
         
     def get(self):
         txt = '' ## last displayed
@@ -221,17 +406,19 @@ class ChooseList(ChooserBaseClass):
             if sys.implementation.name == 'micropython':
                 txt = self.prompt
                 self.oled.fill_rect(self.x,self.y,len(txt)*ChooserBaseClass.CHARW,ChooserBaseClass.CHARH,1)
-                self.oled.text(txt, self.x, self.y, 0)
+                self.cachedText(txt, self.x, self.y, 0)
                 self.oled.show()
                 v = self.rotary.value()
                 while True:
                     if v != self.rotary.value() or self.button.pressed():
                         break
-                    time.sleep(.1)
+                    self.idle()
             else:
                 ### Do it on the terminal
                 print(self.prompt)
         ## now get option
+        if sys.implementation.name == 'micropython' and self.rows > 1:
+            return self.getWindow(txt)
         if sys.implementation.name == 'micropython':
             offset = self.rotary.value()
             v = math.inf
@@ -242,7 +429,7 @@ class ChooseList(ChooserBaseClass):
                         self.oled.fill_rect(self.x,self.y,len(txt)*ChooserBaseClass.CHARW,ChooserBaseClass.CHARH,0)
                     txt = self.options[(offset-v)%len(self.options)]
                     self.oled.fill_rect(self.x,self.y,len(txt)*ChooserBaseClass.CHARW,ChooserBaseClass.CHARH,1)
-                    self.oled.text(txt, self.x, self.y, 0)
+                    self.cachedText(txt, self.x, self.y, 0)
                     self.oled.show()
                 # return current command after debounce
                 if self.button.pressed():
@@ -250,7 +437,7 @@ class ChooseList(ChooserBaseClass):
                         self.oled.fill_rect(self.x,self.y,len(txt)*ChooserBaseClass.CHARW,ChooserBaseClass.CHARH,0)
                         self.oled.show()
                     return txt
-                time.sleep(.1)
+                self.idle()
         else:
             print(self.options)
             while True:
@@ -262,14 +449,35 @@ class ChooseList(ChooserBaseClass):
 
 class ChooseUI(ChooserBaseClass):
     """ ChooseList - Allow the user to scroll through a list of UI widgets and select one with a click
-    of thr button. Return the index in widget array. """
+    of thr button. Return the index in widget array.  Every widget is painted the first time and
+    after the oled has been filled, otherwise only widgets whose focus or look changed are
+    repainted and sent to the display. """
     
     def __init__(self, oled, rotary, button, widgets=[]):
         super().__init__(oled, rotary, button, "")
         self.widgets = widgets
+        self.fills = -1 ## oled.fills at the last paint, -1 paints every widget
+        
+    def invalidate(self):
+        ## force a full repaint on the next paint
+        self.fills = -1
+        
+    def paint(self):
+        fills = getattr(self.oled, 'fills', 0)
+        if fills != self.fills:
+            ## the screen was cleared since the last paint
+            for w in self.widgets:
+                w.invalidate()
+            self.fills = fills
+        damage = None
+        for w in self.widgets:
+            damage = unionRect(damage, w.paint())
+        if damage:
+            if hasattr(self.oled, 'damage'):
+                self.oled.damage(*damage)
+            self.oled.show()
         
     def get(self):
-        offset = self.rotary.value()
         v = math.inf
         while True:
             newv = (- self.rotary.value()) % len(self.widgets)
@@ -277,67 +485,66 @@ class ChooseUI(ChooserBaseClass):
                 v = newv
                 for i in range(len(self.widgets)):
                     self.widgets[i].hasFocus = i == v
-                    self.widgets[i].draw()
-                self.oled.show()
+                self.paint()
             # return current index
             if self.button.pressed():
                 return v
-            time.sleep(.1)
+            self.idle()
 
 class ChooseRoundNumber(ChooserBaseClass):
     """ ChooseRoundNumber - Sshow a 360 degree face and allow the rotary to spin a hand.  The value
     is returned when the button is pressed. """
-    def __init__(self, oled, rotary, button, prompt = '', minval = 0, maxval = 100, stepval = 1, marks=10):
+    
+    faces = {} ## face sprites by geometry and marks
+    def __init__(self, oled, rotary, button, prompt = '', minval = 0, maxval = 100, stepval = 1, marks=10, accel=1):
         super().__init__(oled, rotary, button, prompt)
         self.minval = minval
         self.maxval = maxval
         self.stepval = stepval
         self.marks = marks
+        self.accel = accel ## rotary acceleration while choosing, 1 is off
         ## center or face
         if sys.implementation.name == 'micropython':
             self.facex = int(oled.width*.75)
             self.facey = int(oled.height*.5)
             self.facer = int(oled.height*.5)
     
-    def hand(self, v):
+    def hand(self, v, c=1):
         """ draw the hand """
-        pct = v/self.maxval - .25
-        x = math.cos(pct*math.pi*2)*self.facer+self.facex
-        y = math.sin(pct*math.pi*2)*self.facer+self.facey
-        self.oled.line(self.facex, self.facer,int(x),int(y),1)
+        deg = int(v * 360 // self.maxval) - 90
+        x, y = trig.polar(self.facex, self.facey, self.facer, deg)
+        self.oled.line(self.facex, self.facer,x,y,c)
 
-    def face(self):
-        """ draw the face of the dial """
+    def faceBox(self):
+        ## screen x, y, w, h covered by the face
+        return (self.facex - self.facer, self.facey - self.facer, self.facer * 2 + 1, self.facer * 2 + 1)
+        
+    def face(self, fb, ox, oy):
+        """ draw the face of the dial on fb, (ox, oy) is the screen point at fb's top left """
         for t in range(self.marks):
-            pct = t/self.marks-.25
-            x = math.cos(pct*math.pi*2)*self.facer+self.facex
-            y = math.sin(pct*math.pi*2)*self.facer+self.facey
-            x2 = math.cos(pct*math.pi*2)*self.facer*.9+self.facex
-            y2 = math.sin(pct*math.pi*2)*self.facer*.9+self.facey
-            self.oled.line(int(x2),int(y2),int(x),int(y),1)
+            deg = (t * 360 + self.marks // 2) // self.marks - 90
+            x, y = trig.polar(self.facex, self.facey, self.facer, deg)
+            x2, y2 = trig.polar(self.facex, self.facey, self.facer * 9 // 10, deg)
+            fb.line(x2-ox,y2-oy,x-ox,y-oy,1)
         
     def get(self):
         ## now get option
         if sys.implementation.name == 'micropython':
+            if self.accel > 1:
+                self.rotary.set(accel=self.accel)
             v = math.inf
             start = self.rotary.value()
             while True:
                 newv = round((start - self.rotary.value()) % ((self.maxval - self.minval)/self.stepval)) * self.stepval + self.minval
                 if v != newv:
+                    self.drawDial(None if v == math.inf else v, newv)
                     v = newv
-                    self.oled.fill(0)
-                    self.face()
-                    y = 0
-                    if self.prompt:
-                        self.oled.text(str(self.prompt),0,y)
-                        y = y + ChooserBaseClass.CHARH
-                    self.oled.text(str(v),0,y)
-                    self.hand(v)
-                    self.oled.show()
                 # return current command after debounce
                 if self.button.pressed():
+                    if self.accel > 1:
+                        self.rotary.set(accel=1)
                     return v
-                time.sleep(.1)
+                self.idle()
         else:
             return self.consoleNumber()
  
@@ -345,36 +552,43 @@ class ChooseRoundNumber(ChooserBaseClass):
 class ChooseFaceNumber(ChooserBaseClass):
     """ ChooseFaceNumber shows a 1/2 face dial and allows a user to use the rotary and button to select a number. """
     
-    def __init__(self, oled, rotary, button, prompt = "", minval = 0, maxval = 100, stepval = 1, marks=10):
+    faces = {} ## face sprites by geometry and marks
+    
+    def __init__(self, oled, rotary, button, prompt = "", minval = 0, maxval = 100, stepval = 1, marks=10, accel=1):
         super().__init__(oled, rotary, button, prompt)
         self.minval = minval
         self.maxval = maxval
         self.stepval = stepval
         self.marks = marks
+        self.accel = accel ## rotary acceleration while choosing, 1 is off
         ## center or face
         if sys.implementation.name == 'micropython':
             self.facex = int(oled.width*.5)
             self.facey = int(oled.height-1)
             self.facer = int(oled.height)
     
-    def hand(self, v):
-        pct = v/self.maxval/2 - .5
-        x = math.cos(pct*math.pi*2)*self.facer+self.facex
-        y = math.sin(pct*math.pi*2)*self.facer+self.facey
-        self.oled.line(self.facex, self.facer,int(x),int(y),1)
+    def hand(self, v, c=1):
+        deg = int(v * 180 // self.maxval) - 180
+        x, y = trig.polar(self.facex, self.facey, self.facer, deg)
+        self.oled.line(self.facex, self.facer,x,y,c)
 
-    def face(self):
+    def faceBox(self):
+        ## screen x, y, w, h covered by the face
+        return (self.facex - self.facer, self.facey - self.facer, self.facer * 2 + 1, self.facer + 1)
+        
+    def face(self, fb, ox, oy):
+        """ draw the face of the dial on fb, (ox, oy) is the screen point at fb's top left """
         for t in range(self.marks + 1):
-            pct = t/(self.marks)/2-.5
-            x = math.cos(pct*math.pi*2)*self.facer+self.facex
-            y = math.sin(pct*math.pi*2)*self.facer+self.facey
-            x2 = math.cos(pct*math.pi*2)*self.facer*.9+self.facex
-            y2 = math.sin(pct*math.pi*2)*self.facer*.9+self.facey
-            self.oled.line(int(x2),int(y2),int(x),int(y),1)
+            deg = (t * 180 + self.marks // 2) // self.marks - 180
+            x, y = trig.polar(self.facex, self.facey, self.facer, deg)
+            x2, y2 = trig.polar(self.facex, self.facey, self.facer * 9 // 10, deg)
+            fb.line(x2-ox,y2-oy,x-ox,y-oy,1)
         
     def get(self):
         ## now get option
         if sys.implementation.name == 'micropython':
+            if self.accel > 1:
+                self.rotary.set(accel=self.accel)
             v = math.inf
             start = self.rotary.value()
             while True:
@@ -384,61 +598,191 @@ class ChooseFaceNumber(ChooserBaseClass):
                 if newv > self.maxval:
                     newv = self.maxval
                 if v != newv:
+                    self.drawDial(None if v == math.inf else v, newv)
                     v = newv
-                    self.oled.fill(0)
-                    self.face()
-                    y = 0
-                    if self.prompt:
-                        self.oled.text(str(self.prompt),0,y)
-                        y = y + 10
-                    self.oled.text(str(v),0,y)
-                    self.hand(v)
-                    self.oled.show()
                 # return current command after debounce
                 if self.button.pressed():
+                    if self.accel > 1:
+                        self.rotary.set(accel=1)
                     return v
-                time.sleep(.1)
+                self.idle()
         else:
             return self.consoleNumber()
 
+class WrappedText():
+    """ WrappedText - the lines of a TextScroll wrapped a paragraph at a time as they are reached.
+    The source is a list of paragraphs (or a string table Text), a generator of paragraphs or an
+    open text file (one paragraph per line).  Only the first line number of each paragraph is kept, plus the last
+    few wrapped paragraphs.  A list is indexed in place, a file is re-read from the offset of
+    the paragraph and a generator's paragraphs are kept as read. """
+    
+    WIDTH = 15
+    WINDOW = 4 ## wrapped paragraphs kept
+    
+    def __init__(self, source, minimum=5):
+        self.minimum = minimum ## pad with blank lines to at least this many
+        self.source = source
+        self.file = hasattr(source, 'readline')
+        self.list = isinstance(source, (list, tuple, Text))
+        self.iter = None if self.file or self.list else iter(source)
+        self.paras = [] ## paragraphs read from a generator
+        self.offsets = array('L') ## file offset of each paragraph
+        self.scan = source.tell() if self.file else 0 ## file offset of the next new paragraph
+        self.starts = array('H') ## first line of each paragraph
+        self.known = 0 ## lines wrapped so far
+        self.done = False
+        self.cache = {} ## paragraph -> wrapped lines
+        self.order = []
+        
+    @staticmethod
+    def wrap(p):
+        ## wrap one paragraph by space, followed by a blank line
+        lines = []
+        l = ""
+        for w in p.split(' '):
+            if len(l) + len(w) <= WrappedText.WIDTH:
+                if l:
+                    l = l + " "
+                l = l + w
+            else:
+                lines.append(l)
+                l = w
+        if l:
+            lines.append(l)
+        lines.append('')
+        return lines
+    
+    def read(self, i):
+        ## paragraph i from the source, None past the end
+        if self.list:
+            return self.source[i] if i < len(self.source) else None
+        if self.file:
+            if i < len(self.offsets):
+                self.source.seek(self.offsets[i])
+            p = self.source.readline()
+            if not p:
+                return None
+            return p.rstrip('\r\n')
+        if i < len(self.paras):
+            return self.paras[i]
+        try:
+            p = next(self.iter)
+        except StopIteration:
+            return None
+        self.paras.append(p)
+        return p
+    
+    def paragraph(self, i):
+        ## wrapped lines of paragraph i, through the window
+        lines = self.cache.get(i)
+        if lines is None:
+            lines = WrappedText.wrap(self.read(i))
+            if len(self.order) >= WrappedText.WINDOW:
+                del self.cache[self.order.pop(0)]
+            self.cache[i] = lines
+            self.order.append(i)
+        return lines
+    
+    def ensure(self, n):
+        """ wrap paragraphs until n lines are known or the source ends, return the line count """
+        while not self.done and self.known < n:
+            i = len(self.starts)
+            if self.file:
+                ## reading an earlier paragraph again moved the file
+                self.source.seek(self.scan)
+            p = self.read(i)
+            if p is None:
+                self.done = True
+                break
+            if self.file:
+                self.offsets.append(self.scan)
+                self.scan = self.source.tell()
+            lines = WrappedText.wrap(p)
+            if len(self.order) >= WrappedText.WINDOW:
+                del self.cache[self.order.pop(0)]
+            self.cache[i] = lines
+            self.order.append(i)
+            self.starts.append(self.known)
+            self.known += len(lines)
+        return len(self)
+    
+    def __len__(self):
+        if self.done:
+            return max(self.known, self.minimum)
+        return self.known
+    
+    def __getitem__(self, n):
+        self.ensure(n + 1)
+        if n >= self.known:
+            if n < len(self):
+                return ""
+            raise IndexError
+        ## last paragraph starting at or before line n
+        lo = 0
+        hi = len(self.starts) - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self.starts[mid] <= n:
+                lo = mid
+            else:
+                hi = mid - 1
+        return self.paragraph(lo)[n - self.starts[lo]]
+    
+    def __iter__(self):
+        n = 0
+        while n < self.ensure(n + 1):
+            yield self[n]
+            n += 1
+
 class TextScroll(ChooserBaseClass):
     """ TextScroll displays text (wrapped by space) on the oled screen.  User can scroll up and down using
-    the rotary.  Clickling the button exits. """
-    def __init__(self, oled, rotary, button, text):
+    the rotary.  Clickling the button exits.  With hwscroll the display start line is moved one page per
+    line and only the header and the newly exposed line are drawn and sent.  With lazy the text (a list,
+    generator or open file of paragraphs) is wrapped as the view reaches it, a generator or file is
+    always lazy.  A number is a text in ChooserBaseClass.strings, read as it is shown. """
+    def __init__(self, oled, rotary, button, text, hwscroll=False, lazy=None):
         super().__init__(oled, rotary, button, "")
-        self.text = self.chopText(text)
+        if isinstance(text, int):
+            text = ChooserBaseClass.strings.text(text)
+        if lazy is None:
+            lazy = not isinstance(text, (list, tuple))
+        self.text = WrappedText(text) if lazy else self.chopText(text)
+        self.hwscroll = hwscroll
         
     def chopText(self, text):
         chop = []
         for p in text:
-            l = ""
-            p = p.split(' ')
-            for w in p:
-                if len(l) + len(w) <= 15:
-                    if l:
-                        l = l + " "
-                    l = l + w
-                else:
-                    chop.append(l)
-                    l = w
-            if l:
-                chop.append(l)
-            chop.append('')
+            chop.extend(WrappedText.wrap(p))
         #print(len(chop))
         while len(chop) < 5:
             chop.append("")
         return chop
     
+    def count(self, n):
+        ## lines known once n are needed (all of them for a list)
+        if isinstance(self.text, WrappedText):
+            return self.text.ensure(n)
+        return len(self.text)
+    
+    def header(self, v, rows):
+        ## position in the header, the end is unknown until a lazy text has been read
+        if isinstance(self.text, WrappedText) and not self.text.done:
+            return str(v) + '/?'
+        return str(v) + '/' + str(len(self.text)-rows)
+    
     def display(self):
+        if sys.implementation.name == 'micropython' and self.hwscroll and hasattr(self.oled, 'start_line'):
+            return self.displayHW()
         if sys.implementation.name == 'micropython':
             rows = 5
             v = math.inf
             start = self.rotary.value()
             while True:
                 newv = start - self.rotary.value()
-                if newv > len(self.text)-rows:
-                    newv = len(self.text)-rows
-                    start = self.rotary.value() + len(self.text)-rows
+                last = self.count(newv + rows) - rows
+                if newv > last:
+                    newv = last
+                    start = self.rotary.value() + last
                 if newv < 0:
                     newv = 0
                     start = self.rotary.value()
@@ -446,22 +790,90 @@ class TextScroll(ChooserBaseClass):
                     v = newv
                     self.oled.fill(0)
                     self.oled.fill_rect(0, 0 ,self.oled.width, 10, 1)
-                    self.oled.text("< close > " + str(v) + '/' + str(len(self.text)-rows), 0, 0, 0)
+                    self.cachedText("< close > ", 0, 0, 0)
+                    self.oled.text(self.header(v, rows), 80, 0, 0)
                     for l in range(rows):
                         self.oled.text(self.text[v+l],0,l *10+10)
                     self.oled.show()
                 # return current command after debounce
                 if self.button.pressed():
                     return True
-                time.sleep(.1)
+                self.idle()
         else:
             for l in self.text:
                 print(l)    
 
+    def displayHW(self):
+        ## one line per 8 pixel page, the header is page 0
+        pages = self.oled.height // 8
+        rows = pages - 1
+        if isinstance(self.text, WrappedText):
+            self.text.minimum = max(self.text.minimum, rows)
+        else:
+            while len(self.text) < rows:
+                self.text.append("")
+        self.top = self.oled.start // 8 ## RAM page shown at the top of the panel
+        v = math.inf
+        start = self.rotary.value()
+        while True:
+            newv = start - self.rotary.value()
+            last = self.count(newv + rows) - rows
+            if newv > last:
+                newv = last
+                start = self.rotary.value() + last
+            if newv < 0:
+                newv = 0
+                start = self.rotary.value()
+            if v != newv:
+                if newv - v == 1:
+                    ## panel moves up a line, old header page becomes the bottom line
+                    self.top = (self.top + 1) % pages
+                    self.oled.start_line(self.top * 8)
+                    self.drawPage(0, newv, rows)
+                    self.drawPage(rows, newv, rows)
+                elif newv - v == -1:
+                    ## panel moves down a line, old bottom page becomes the header
+                    self.top = (self.top - 1) % pages
+                    self.oled.start_line(self.top * 8)
+                    self.drawPage(0, newv, rows)
+                    self.drawPage(1, newv, rows)
+                else:
+                    for k in range(pages):
+                        self.drawPage(k, newv, rows)
+                v = newv
+                self.oled.show()
+            # return current command after debounce
+            if self.button.pressed():
+                self.unscroll()
+                return True
+            self.idle()
+
+    def drawPage(self, k, v, rows):
+        ## draw line k of the panel (0 is the header) into the RAM page currently shown there
+        y = ((self.top + k) % (self.oled.height // 8)) * 8
+        if k == 0:
+            self.oled.fill_rect(0, y, self.oled.width, 8, 1)
+            self.cachedText("< close > ", 0, y, 0)
+            self.oled.text(self.header(v, rows), 80, y, 0)
+        else:
+            self.oled.fill_rect(0, y, self.oled.width, 8, 0)
+            self.oled.text(self.text[v+k-1], 0, y)
+
+    def unscroll(self):
+        ## put the framebuffer back in panel order and reset the start line
+        if self.top:
+            n = self.top * self.oled.width
+            buf = self.oled.buffer
+            buf[:] = buf[n:] + buf[:n]
+            self.top = 0
+        self.oled.start_line(0)
+        self.oled.show(full=True)
+
            
 class MessageBox(ChooserBaseClass):
     """ MessageBox displays lines of messages in the center of the screen and allow user to use the
-    ChooseList to select a response to the message. """
+    ChooseList to select a response to the message.  The prompt may be the number of a text in
+    ChooserBaseClass.strings. """
     
     def __init__(self, oled, rotary, button, prompt='messagebox', options=['YES','NO']):
         super().__init__(oled, rotary, button, prompt)
@@ -469,15 +881,18 @@ class MessageBox(ChooserBaseClass):
         self.chooser = ChooseList(oled, rotary, button, options, 50, 50)
     
     def get(self):
+        prompt = self.prompt
+        if isinstance(prompt, int):
+            prompt = ChooserBaseClass.strings.lines(prompt)
         if sys.implementation.name == 'micropython':
             self.oled.fill(0)
             self.oled.rect(0, 0, self.oled.width, self.oled.height, 1)
-            for i in range(len(self.prompt)):
-                x = (128-len(self.prompt[i])*ChooserBaseClass.CHARW)//2
+            for i in range(len(prompt)):
+                x = (128-len(prompt[i])*ChooserBaseClass.CHARW)//2
                 y = i * 10 + 5
-                self.oled.text(self.prompt[i], x, y)
+                self.cachedText(prompt[i], x, y)
             ans = self.chooser.get()
             return ans
         else:
-            print(self.prompt)
+            print(prompt)
             return self.chooser.get()
@@ -1,6 +1,6 @@
 """ Clockywoky - Tribute to tommy
 
-Version 00
+Version 02
 James M. Reneau Ph.D.
 http://www.picohhg.com
 
@@ -10,83 +10,81 @@ a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
 
 V
 00		2023-04-30	jmr		original coding
+01		2026-10-18	jmr		hands and face from the trig tables
+02		2026-10-18	jmr		run(ctx) with the menu's display, press to exit
 """
 
 ## set displaydevice = ["OLED","LCD"]
 displaydevice = "OLED"
 showTH = False
 
-if displaydevice=="OLED":
-    from machine import SoftI2C
-    from machine import Pin
-    from ssd1306 import SSD1306_I2C
-
 if displaydevice == "LCD":
     from Pico_LCD_114_V2 import LCD_1inch14
     from machine import Pin,SPI,PWM
 
 if showTH:
+    from machine import SoftI2C
+    from machine import Pin
     from sht31 import SHT31
 
 import time
-import math
+import trig
+from context import Context
 
 def j2(n):
     return ("00" + str(n))[-2:]
 
+def hand(display, white, t, u, l):
+    ## l is the length in percent of the radius
+    xc = yc = display.height//2
+    x, y = trig.polar(xc, yc, xc*l//100, t*360//u-90)
+    display.line(xc,yc,x,y,white)
 
-if displaydevice == "OLED":
-    i2c_oled = SoftI2C(scl=Pin(17), sda=Pin(16))
-    display = SSD1306_I2C(128, 64, i2c_oled)
-    black = 0
-    white = 1
-    
-if displaydevice == "LCD":
-    display = LCD_1inch14()
-    black = 0x0000
-    white = 0xffff
-    
-xc = display.height//2
-yc = display.height//2
-    
-if showTH:
-    i2c_thsens = SoftI2C(scl=Pin(15), sda=Pin(14))
-    thsens = SHT31(i2c_thsens)
-
-def hand(t, u, l):
-    pct = t/u-.25
-    x = math.cos(pct*math.pi*2)*xc*l+xc
-    y = math.sin(pct*math.pi*2)*yc*l+yc
-    display.line(xc,yc,int(x),int(y),white)
-
-def face():
+def face(display, white):
+    xc = yc = display.height//2
     for t in range(12):
-        pct = t/12-.25
-        x = math.cos(pct*math.pi*2)*xc+xc
-        y = math.sin(pct*math.pi*2)*yc+yc
-        x2 = math.cos(pct*math.pi*2)*xc+xc
-        y2 = math.sin(pct*math.pi*2)*yc+yc
-        display.line(int(x2),int(y2),int(x),int(y),white)
+        x, y = trig.polar(xc, yc, xc, t*30-90)
+        x2, y2 = trig.polar(xc, yc, xc, t*30-90)
+        display.line(x2,y2,x,y,white)
 
-while True:
-    time.sleep(.5)
-    
-    lt = time.localtime()
-    display.fill(black)
-    face()
-    hand(lt[3], 12, .6)
-    hand(lt[4], 60, .75)
-    hand(lt[5], 60, 1)
-    
-    display.text(j2(lt[3])+':'+j2(lt[4])+':'+j2(lt[5]), display.width-8*8, 0, white)
-   
+def run(ctx):
+    if displaydevice == "OLED":
+        display = ctx.oled
+        black = 0
+        white = 1
+        
+    if displaydevice == "LCD":
+        display = LCD_1inch14()
+        black = 0x0000
+        white = 0xffff
+        
     if showTH:
-        th = thsens.get_temp_humi()
-        s = str(int(th[0])) + "c"
-        display.text(s, 128-len(s)*8, 10, white)
-        s = str(int(th[0]*9/5+32)) + "f"
-        display.text(s, 128-len(s)*8, 20, white)
-        s = str(int(th[1])) + "%rh"
-        display.text(s, 128-len(s)*8, 30, white)
+        i2c_thsens = SoftI2C(scl=Pin(15), sda=Pin(14))
+        thsens = SHT31(i2c_thsens)
+
+    ## runs until the button is pressed
+    while not ctx.button.pressed():
+        time.sleep(.5)
+        
+        lt = time.localtime()
+        display.fill(black)
+        face(display, white)
+        hand(display, white, lt[3], 12, 60)
+        hand(display, white, lt[4], 60, 75)
+        hand(display, white, lt[5], 60, 100)
+        
+        display.text(j2(lt[3])+':'+j2(lt[4])+':'+j2(lt[5]), display.width-8*8, 0, white)
+       
+        if showTH:
+            th = thsens.get_temp_humi()
+            s = str(int(th[0])) + "c"
+            display.text(s, 128-len(s)*8, 10, white)
+            s = str(int(th[0]*9/5+32)) + "f"
+            display.text(s, 128-len(s)*8, 20, white)
+            s = str(int(th[1])) + "%rh"
+            display.text(s, 128-len(s)*8, 30, white)
+
+        display.show()
 
-    display.show()
+if __name__ == "__main__":
+    run(Context.create())
@@ -0,0 +1,81 @@
+""" Context - The display and input objects shared by the menu and the games.
+
+Version 02
+James M. Reneau Ph.D.
+http://www.picohhg.com
+
+This work is licensed under the Creative Commons Attribution-ShareAlike 2.0 Generic License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/2.0/ or send
+a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+
+The I2C bus, the SSD1306 (and its init_display), the rotary and the button are set up once
+by main.py and handed to each game's run(ctx).  A game is a module that is imported, run and
+unloaded again, so it does not set up the hardware or keep its objects on the heap after it
+is done.  A game can still be run by itself:
+
+    if __name__ == "__main__":
+        run(Context.create())
+
+On a console every object is False and the choosers print and read from the terminal.
+
+V
+00		2026-10-18	jmr		original coding
+01		2026-10-18	jmr		create() can mark each step for the boot profiler
+02		2026-10-18	jmr		using() takes the input bus of the new rotary and button
+"""
+
+import sys
+
+class Context():
+
+    ## Hardware GPIO Pins used for Raspberry PI Pico
+    I2CSDA = 16
+    I2CSCL = 17
+    ROTARY_CLOCK = 7
+    ROTARY_DATA = 6
+    BUTTON = 26
+
+    def __init__(self, oled=False, rotary=False, button=False, inputBus=None):
+        self.oled = oled ## SSD1306_I2C
+        self.rotary = rotary ## RotaryIRQ
+        self.button = button ## Button
+        self.inputBus = inputBus ## InputBus listening to rotary and button or None
+
+    @staticmethod
+    def create(irq=True, mark=None):
+        """ set up the PicoHHG display, rotary and button (irq makes an interrupt Button).  mark is
+        called with the name of each step as it is done (Profiler.mark) """
+        if sys.implementation.name != 'micropython':
+            return Context()
+        if mark is None:
+            mark = Context.nomark
+        from machine import Pin
+        from machine import I2C
+        from rotaryIRQ import RotaryIRQ
+        from ssd1306 import SSD1306_I2C
+        from button import Button
+        mark("context imports")
+        i2c = I2C(0, sda=Pin(Context.I2CSDA), scl=Pin(Context.I2CSCL), freq=400000)
+        mark("i2c")
+        oled = SSD1306_I2C(128, 64, i2c)
+        mark("display init")
+        rotary = RotaryIRQ(Context.ROTARY_CLOCK, Context.ROTARY_DATA)
+        mark("rotary")
+        button = Button(Context.BUTTON, irq=irq)
+        mark("button")
+        return Context(oled, rotary, button)
+
+    @staticmethod
+    def nomark(name):
+        pass
+
+    def using(self, rotary, button, inputBus=None):
+        """ the same display with another rotary and button (a replay) and their input bus """
+        return Context(self.oled, rotary, button, inputBus)
+
+    def reset(self):
+        """ drop input left over from the menu before a game starts """
+        if getattr(self.button, 'irqMode', False):
+            self.button.clear()
+        if self.inputBus:
+            self.inputBus.clear()
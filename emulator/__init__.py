@@ -0,0 +1,62 @@
+""" emulator - Run the PicoHHG code on a desktop Python (CPython).
+
+Version 00
+James M. Reneau Ph.D.
+http://www.picohhg.com
+
+This work is licensed under the Creative Commons Attribution-ShareAlike 2.0 Generic License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/2.0/ or send
+a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+
+Provides framebuf, micropython and machine modules and a recording SSD1306_I2C
+so the choosers, symbols, playing cards and the games import and draw on a
+workstation.  Run from the PicoHHG folder:
+
+    import emulator
+    emulator.install()
+    import choosers
+    ...
+    emulator.displays[-1].save("frame.png")
+
+V
+00		2026-10-18	jmr		original coding
+"""
+
+import builtins
+import sys
+import types
+
+from . import clock
+from . import framebuf
+from . import machine
+from . import micropython
+
+displays = []  # every recording display created, newest last
+
+
+def install(device=True, fast=True, record=True, numpy=False):
+    """
+    Parameters:
+    :device: report sys.implementation.name as 'micropython' so the code takes the oled paths
+    :fast: run on a virtual clock, sleeping returns immediately
+    :record: ssd1306.SSD1306_I2C keeps every show() as a frame
+    :numpy: use the NumPy vectorised FrameBuffer (MONO_VLSB only) for bulk rendering
+    """
+    if numpy:
+        from . import npframebuf
+        sys.modules["framebuf"] = npframebuf
+    else:
+        sys.modules["framebuf"] = framebuf
+    sys.modules["micropython"] = micropython
+    sys.modules["machine"] = machine
+    # const() is a compiler builtin on the Pico
+    builtins.const = micropython.const
+    clock.install(fast)
+    if device and sys.implementation.name != "micropython":
+        impl = types.SimpleNamespace(**vars(sys.implementation))
+        impl.name = "micropython"
+        sys.implementation = impl
+    if record:
+        import ssd1306
+        from . import oled
+        ssd1306.SSD1306_I2C = oled.SSD1306_I2C
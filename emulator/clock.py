@@ -0,0 +1,100 @@
+""" clock - Time for the emulator.
+
+Supplies the MicroPython time functions (ticks_ms, ticks_us, ticks_diff,
+ticks_add, sleep_ms, sleep_us) on the host.  In fast mode time is virtual:
+sleeping just moves the clock forward so games run as fast as the host
+can draw, while every timestamp still reads as if it ran in real time.
+Timers from the fake machine module fire as the clock passes them.
+"""
+
+import time as _time
+
+TICKS_PERIOD = 1 << 30
+TICKS_MAX = TICKS_PERIOD - 1
+TICKS_HALFPERIOD = TICKS_PERIOD // 2
+
+_realsleep = _time.sleep
+
+
+class Clock():
+    def __init__(self, fast=True):
+        self.fast = fast
+        self.us = 0  # virtual microseconds since start
+        self.origin = _time.perf_counter()
+        self.timers = []
+
+    def now(self):
+        if self.fast:
+            return self.us
+        return int((_time.perf_counter() - self.origin) * 1000000)
+
+    def advance(self, us):
+        if self.fast:
+            target = self.us + int(us)
+            # fire timers in order as the clock passes them
+            while True:
+                due = None
+                for t in self.timers:
+                    if t.due is not None and t.due <= target and (due is None or t.due < due.due):
+                        due = t
+                if due is None:
+                    break
+                self.us = max(self.us, due.due)
+                due.fire()
+            self.us = target
+        else:
+            _realsleep(us / 1000000)
+            self.poll()
+
+    def poll(self):
+        now = self.now()
+        for t in list(self.timers):
+            if t.due is not None and t.due <= now:
+                t.fire()
+
+
+clock = Clock()
+
+
+def ticks_add(ticks, delta):
+    return (ticks + delta) & TICKS_MAX
+
+
+def ticks_diff(ticks1, ticks2):
+    return ((ticks1 - ticks2 + TICKS_HALFPERIOD) & TICKS_MAX) - TICKS_HALFPERIOD
+
+
+def ticks_us():
+    return clock.now() & TICKS_MAX
+
+
+def ticks_ms():
+    return (clock.now() // 1000) & TICKS_MAX
+
+
+def ticks_cpu():
+    return ticks_us()
+
+
+def sleep(s):
+    clock.advance(s * 1000000)
+
+
+def sleep_ms(ms):
+    clock.advance(ms * 1000)
+
+
+def sleep_us(us):
+    clock.advance(us)
+
+
+def install(fast=True):
+    # add the MicroPython extras to the host time module, in fast mode
+    # time.sleep moves the virtual clock instead of blocking
+    clock.fast = fast
+    for f in (ticks_add, ticks_diff, ticks_us, ticks_ms, ticks_cpu, sleep_ms, sleep_us):
+        setattr(_time, f.__name__, f)
+    if fast:
+        _time.sleep = sleep
+    else:
+        _time.sleep = _realsleep
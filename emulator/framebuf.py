@@ -0,0 +1,297 @@
+""" framebuf - Pure Python stand-in for MicroPython's framebuf module.
+
+Implements the monochrome formats with the same pixel layout, clipping and
+drawing rules as the C module so buffers compare byte for byte with the
+ones drawn on the Pico.
+"""
+
+from .font import FONT, glyph
+
+MONO_VLSB = 0
+MVLSB = MONO_VLSB
+RGB565 = 1
+GS4_HMSB = 2
+MONO_HLSB = 3
+MONO_HMSB = 4
+GS2_HMSB = 5
+GS8 = 6
+
+
+class FrameBuffer():
+    def __init__(self, buffer, width, height, format, stride=None):
+        if format not in (MONO_VLSB, MONO_HLSB, MONO_HMSB):
+            raise ValueError("invalid format")
+        if stride is None:
+            stride = width
+        if format != MONO_VLSB:
+            stride = (stride + 7) & ~7
+        self._buf = buffer
+        self._width = width
+        self._height = height
+        self._format = format
+        self._stride = stride
+
+    # pixel access
+
+    def _get(self, x, y):
+        if self._format == MONO_VLSB:
+            return (self._buf[(y >> 3) * self._stride + x] >> (y & 7)) & 1
+        i = (x + y * self._stride) >> 3
+        if self._format == MONO_HLSB:
+            return (self._buf[i] >> (7 - (x & 7))) & 1
+        return (self._buf[i] >> (x & 7)) & 1
+
+    def _set(self, x, y, c):
+        if self._format == MONO_VLSB:
+            i = (y >> 3) * self._stride + x
+            bit = 1 << (y & 7)
+        else:
+            i = (x + y * self._stride) >> 3
+            if self._format == MONO_HLSB:
+                bit = 0x80 >> (x & 7)
+            else:
+                bit = 1 << (x & 7)
+        if c & 1:
+            self._buf[i] |= bit
+        else:
+            self._buf[i] &= ~bit & 0xFF
+
+    def _fill_rect(self, x, y, w, h, c):
+        # already clipped
+        if self._format == MONO_VLSB:
+            buf = self._buf
+            stride = self._stride
+            yend = y + h
+            while y < yend:
+                page = y >> 3
+                last = min(yend, (page + 1) << 3)
+                mask = ((1 << (last - y)) - 1) << (y & 7)
+                i = page * stride + x
+                if c & 1:
+                    for j in range(i, i + w):
+                        buf[j] |= mask
+                else:
+                    mask = ~mask & 0xFF
+                    for j in range(i, i + w):
+                        buf[j] &= mask
+                y = last
+        else:
+            for yy in range(y, y + h):
+                for xx in range(x, x + w):
+                    self._set(xx, yy, c)
+
+    # public drawing api
+
+    def fill(self, c):
+        self._fill_rect(0, 0, self._width, self._height, c)
+
+    def pixel(self, x, y, c=-1):
+        if 0 <= x < self._width and 0 <= y < self._height:
+            if c == -1:
+                return self._get(x, y)
+            self._set(x, y, c)
+
+    def fill_rect(self, x, y, w, h, c):
+        if h < 1 or w < 1 or x + w <= 0 or y + h <= 0 or y >= self._height or x >= self._width:
+            return
+        xend = min(self._width, x + w)
+        yend = min(self._height, y + h)
+        x = max(x, 0)
+        y = max(y, 0)
+        self._fill_rect(x, y, xend - x, yend - y, c)
+
+    def hline(self, x, y, w, c):
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x, y, h, c):
+        self.fill_rect(x, y, 1, h, c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            self.fill_rect(x, y, w, h, c)
+        else:
+            self.fill_rect(x, y, w, 1, c)
+            self.fill_rect(x, y + h - 1, w, 1, c)
+            self.fill_rect(x, y, 1, h, c)
+            self.fill_rect(x + w - 1, y, 1, h, c)
+
+    def line(self, x1, y1, x2, y2, c):
+        # Bresenham, same stepping as the C implementation
+        dx = x2 - x1
+        sx = 1 if dx > 0 else -1
+        dx = abs(dx)
+        dy = y2 - y1
+        sy = 1 if dy > 0 else -1
+        dy = abs(dy)
+        steep = dy > dx
+        if steep:
+            x1, y1 = y1, x1
+            dx, dy = dy, dx
+            sx, sy = sy, sx
+        e = 2 * dy - dx
+        width = self._width
+        height = self._height
+        for i in range(dx):
+            if steep:
+                if 0 <= y1 < width and 0 <= x1 < height:
+                    self._set(y1, x1, c)
+            else:
+                if 0 <= x1 < width and 0 <= y1 < height:
+                    self._set(x1, y1, c)
+            while e >= 0:
+                y1 += sy
+                e -= 2 * dx
+            x1 += sx
+            e += 2 * dy
+        if 0 <= x2 < width and 0 <= y2 < height:
+            self._set(x2, y2, c)
+
+    def text(self, s, x0, y0, c=1):
+        # like the C code this walks the UTF-8 bytes, so anything outside
+        # ASCII draws one glyph 127 per byte
+        for ch in str(s).encode().split(b"\0")[0]:
+            g = glyph(ch)
+            for j in range(8):
+                x = x0 + j
+                if 0 <= x < self._width:
+                    col = FONT[g + j]
+                    y = y0
+                    while col:
+                        if col & 1 and 0 <= y < self._height:
+                            self._set(x, y, c)
+                        col >>= 1
+                        y += 1
+            x0 += 8
+
+    def scroll(self, xstep, ystep):
+        if xstep < 0:
+            sx = 0
+            xend = self._width + xstep
+            if xend <= 0:
+                return
+            dx = 1
+        else:
+            sx = self._width - 1
+            xend = xstep - 1
+            if xend >= sx:
+                return
+            dx = -1
+        if ystep < 0:
+            y = 0
+            yend = self._height + ystep
+            if yend <= 0:
+                return
+            dy = 1
+        else:
+            y = self._height - 1
+            yend = ystep - 1
+            if yend >= y:
+                return
+            dy = -1
+        while y != yend:
+            x = sx
+            while x != xend:
+                self._set(x, y, self._get(x - xstep, y - ystep))
+                x += dx
+            y += dy
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        if isinstance(fbuf, tuple):
+            fbuf = FrameBuffer(*fbuf)
+        if x >= self._width or y >= self._height or -x >= fbuf._width or -y >= fbuf._height:
+            return
+        x0 = max(0, x)
+        y0 = max(0, y)
+        x1 = max(0, -x)
+        y1 = max(0, -y)
+        x0end = min(self._width, x + fbuf._width)
+        y0end = min(self._height, y + fbuf._height)
+        while y0 < y0end:
+            cx1 = x1
+            for cx0 in range(x0, x0end):
+                col = fbuf._get(cx1, y1)
+                if palette is not None:
+                    col = palette._get(col, 0)
+                if col != key:
+                    self._set(cx0, y0, col)
+                cx1 += 1
+            y1 += 1
+            y0 += 1
+
+    def ellipse(self, x, y, xr, yr, c, f=False, m=0x0F):
+        # midpoint ellipse, quadrant mask m as in MicroPython (bit 0 = Q1)
+        def plot(px, py):
+            if 0 <= px < self._width and 0 <= py < self._height:
+                self._set(px, py, c)
+
+        def quadrants(cx, cy):
+            if f:
+                if m & 0x03:
+                    lo = x - cx if m & 0x02 else x
+                    hi = x + cx if m & 0x01 else x
+                    for px in range(lo, hi + 1):
+                        plot(px, y - cy)
+                if m & 0x0C:
+                    lo = x - cx if m & 0x04 else x
+                    hi = x + cx if m & 0x08 else x
+                    for px in range(lo, hi + 1):
+                        plot(px, y + cy)
+            else:
+                if m & 0x01:
+                    plot(x + cx, y - cy)
+                if m & 0x02:
+                    plot(x - cx, y - cy)
+                if m & 0x04:
+                    plot(x - cx, y + cy)
+                if m & 0x08:
+                    plot(x + cx, y + cy)
+
+        if xr == 0 and yr == 0:
+            if m & 0x0F:
+                plot(x, y)
+            return
+        two_a2 = 2 * xr * xr
+        two_b2 = 2 * yr * yr
+        cx = xr
+        cy = 0
+        xchange = yr * yr * (1 - 2 * xr)
+        ychange = xr * xr
+        err = 0
+        stopx = two_b2 * xr
+        stopy = 0
+        while stopx >= stopy:
+            quadrants(cx, cy)
+            cy += 1
+            stopy += two_a2
+            err += ychange
+            ychange += two_a2
+            if 2 * err + xchange > 0:
+                cx -= 1
+                stopx -= two_b2
+                err += xchange
+                xchange += two_b2
+        cx = 0
+        cy = yr
+        xchange = yr * yr
+        ychange = xr * xr * (1 - 2 * yr)
+        err = 0
+        stopx = 0
+        stopy = two_a2 * yr
+        while stopx <= stopy:
+            quadrants(cx, cy)
+            cx += 1
+            stopx += two_b2
+            err += xchange
+            xchange += two_b2
+            if 2 * err + ychange > 0:
+                cy -= 1
+                stopy -= two_a2
+                err += ychange
+                ychange += two_a2
+
+    def poly(self, x, y, coords, c, f=False):
+        # outline only, filled polygons are not emulated
+        n = len(coords) // 2
+        for i in range(n):
+            j = (i + 1) % n
+            self.line(x + coords[2 * i], y + coords[2 * i + 1], x + coords[2 * j], y + coords[2 * j + 1], c)
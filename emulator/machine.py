@@ -0,0 +1,194 @@
+""" machine - Host stand-in for the MicroPython machine module.
+
+Pins hold a level that host code can drive (Pin.drive) to fire the
+registered irq handler.  The buses accept and count writes, Timers run off
+the emulator clock.
+"""
+
+from .clock import clock
+
+
+def freq(hz=None):
+    return 125000000
+
+
+def reset():
+    raise SystemExit("machine.reset()")
+
+
+def soft_reset():
+    raise SystemExit("machine.soft_reset()")
+
+
+def unique_id():
+    return b"PICOHHG!"
+
+
+def idle():
+    # nothing can interrupt us on the host, let a millisecond go by
+    clock.advance(1000)
+
+
+def lightsleep(ms=None):
+    clock.advance(1000 * (ms if ms is not None else 1))
+
+
+def disable_irq():
+    return 0
+
+
+def enable_irq(state=0):
+    pass
+
+
+class Pin():
+    IN = 0
+    OUT = 1
+    OPEN_DRAIN = 2
+    PULL_UP = 1
+    PULL_DOWN = 2
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
+
+    def __init__(self, id, mode=-1, pull=-1, value=None):
+        self.id = id
+        self.handler = None
+        self.trigger = 0
+        self.level = 0
+        self.init(mode, pull, value)
+
+    def init(self, mode=-1, pull=-1, value=None):
+        if mode != -1:
+            self.mode = mode
+        if pull != -1:
+            self.pull = pull
+            # an idle input rests at its pull level
+            self.level = 1 if pull == Pin.PULL_UP else 0
+        if value is not None:
+            self.level = 1 if value else 0
+
+    def value(self, v=None):
+        if v is None:
+            return self.level
+        self.level = 1 if v else 0
+
+    def __call__(self, v=None):
+        return self.value(v)
+
+    def on(self):
+        self.level = 1
+
+    def off(self):
+        self.level = 0
+
+    def low(self):
+        self.level = 0
+
+    def high(self):
+        self.level = 1
+
+    def toggle(self):
+        self.level ^= 1
+
+    def irq(self, handler=None, trigger=IRQ_FALLING | IRQ_RISING, hard=False):
+        self.handler = handler
+        self.trigger = trigger if handler else 0
+
+    def drive(self, v):
+        # change the level from outside (a button, an encoder) and fire the irq
+        v = 1 if v else 0
+        if v == self.level:
+            return
+        self.level = v
+        edge = Pin.IRQ_RISING if v else Pin.IRQ_FALLING
+        if self.handler and self.trigger & edge:
+            self.handler(self)
+
+
+class I2C():
+    def __init__(self, id=0, scl=None, sda=None, freq=400000, timeout=50000):
+        self.id = id
+        self.freq = freq
+        self.transactions = 0
+        self.bytes = 0
+
+    def scan(self):
+        return [0x3C]
+
+    def writeto(self, addr, buf, stop=True):
+        self.transactions += 1
+        self.bytes += len(buf)
+        return 1
+
+    def writevto(self, addr, vector, stop=True):
+        self.transactions += 1
+        for buf in vector:
+            self.bytes += len(buf)
+        return 1
+
+    def readfrom(self, addr, nbytes, stop=True):
+        return bytes(nbytes)
+
+    def readfrom_into(self, addr, buf, stop=True):
+        for i in range(len(buf)):
+            buf[i] = 0
+
+
+class SoftI2C(I2C):
+    def __init__(self, scl=None, sda=None, freq=400000, timeout=50000):
+        super().__init__(-1, scl, sda, freq, timeout)
+
+
+class SPI():
+    def __init__(self, id=0, baudrate=1000000, polarity=0, phase=0, **kw):
+        self.id = id
+        self.baudrate = baudrate
+        self.transactions = 0
+        self.bytes = 0
+
+    def init(self, baudrate=1000000, polarity=0, phase=0, **kw):
+        self.baudrate = baudrate
+
+    def deinit(self):
+        pass
+
+    def write(self, buf):
+        self.transactions += 1
+        self.bytes += len(buf)
+
+    def read(self, nbytes, write=0x00):
+        return bytes(nbytes)
+
+
+class Timer():
+    ONE_SHOT = 0
+    PERIODIC = 1
+
+    def __init__(self, id=-1, mode=PERIODIC, freq=-1, period=-1, callback=None):
+        self.due = None
+        self.callback = None
+        if callback is not None:
+            self.init(mode=mode, freq=freq, period=period, callback=callback)
+
+    def init(self, mode=PERIODIC, freq=-1, period=-1, callback=None):
+        if freq > 0:
+            period = 1000 // freq
+        self.mode = mode
+        self.period_us = max(period, 0) * 1000
+        self.callback = callback
+        self.due = clock.now() + self.period_us
+        if self not in clock.timers:
+            clock.timers.append(self)
+
+    def deinit(self):
+        self.due = None
+        if self in clock.timers:
+            clock.timers.remove(self)
+
+    def fire(self):
+        if self.mode == Timer.PERIODIC:
+            self.due += max(self.period_us, 1)
+        else:
+            self.deinit()
+        if self.callback:
+            self.callback(self)
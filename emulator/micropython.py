@@ -0,0 +1,46 @@
+""" micropython - Host stand-in for the MicroPython micropython module. """
+
+
+def const(value):
+    return value
+
+
+def native(f):
+    return f
+
+
+def viper(f):
+    return f
+
+
+def asm_thumb(f):
+    raise NotImplementedError("inline assembler is not emulated")
+
+
+def schedule(func, arg):
+    # there is no interrupt context on the host so run it now
+    func(arg)
+
+
+def alloc_emergency_exception_buf(size):
+    pass
+
+
+def opt_level(level=None):
+    return 0
+
+
+def mem_info(verbose=False):
+    # the host gc has no heap counts, used is what tracemalloc traces (0 when it is off)
+    import tracemalloc
+    used = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+    print("stack: 0 out of 0")
+    print("GC: total: 0, used:", used, "free: 0")
+
+
+def heap_lock():
+    return 0
+
+
+def heap_unlock():
+    return 0
@@ -0,0 +1,220 @@
+""" npframebuf - framebuf on NumPy for rendering frames in bulk on the host.
+
+A MONO_VLSB FrameBuffer whose fill_rect, hline, vline, rect, line, blit,
+scroll and text run as array operations.  The FrameBuffer works directly on
+the caller's buffer through a (pages, stride) byte view, so after every call
+the buffer is byte for byte what the pure Python emulator (and the Pico)
+would produce.  Install it with emulator.install(numpy=True).
+"""
+
+import numpy as np
+
+from . import framebuf as _py
+from .font import FONT, FIRST, LAST
+from .framebuf import MONO_VLSB, MVLSB, RGB565, GS4_HMSB, MONO_HLSB, MONO_HMSB, GS2_HMSB, GS8
+
+# glyph column bytes, one row of 8 per character
+_FONT = np.frombuffer(FONT, dtype=np.uint8).reshape(LAST - FIRST + 1, 8)
+
+
+class FrameBuffer():
+    def __init__(self, buffer, width, height, format, stride=None):
+        if format != MONO_VLSB:
+            raise ValueError("only MONO_VLSB is vectorised")
+        if stride is None:
+            stride = width
+        self._buf = buffer
+        self._width = width
+        self._height = height
+        self._format = format
+        self._stride = stride
+        self._pages = (height + 7) >> 3
+        self._bytes = np.frombuffer(buffer, dtype=np.uint8, count=self._pages * stride).reshape(self._pages, stride)
+        # bits of each page that are inside the buffer height
+        rows = np.arange(self._pages * 8) < height
+        self._valid = np.packbits(rows.reshape(self._pages, 8), axis=1, bitorder="little").ravel()
+
+    # bit plane helpers
+
+    def _plane(self):
+        # (pages * 8, width) array of 0/1 pixels
+        return np.unpackbits(self._bytes[:, :self._width], axis=0, bitorder="little")
+
+    def _store(self, plane):
+        self._bytes[:, :self._width] = np.packbits(plane, axis=0, bitorder="little")
+
+    def _row_masks(self, y, h):
+        # per page byte mask selecting rows y .. y+h-1
+        rows = np.arange(self._pages * 8)
+        sel = (rows >= y) & (rows < y + h)
+        return np.packbits(sel.reshape(self._pages, 8), axis=1, bitorder="little").ravel()
+
+    def _set_pixels(self, xs, ys, c):
+        # xs, ys already clipped, duplicates allowed
+        pages = ys >> 3
+        bits = (1 << (ys & 7)).astype(np.uint8)
+        if c & 1:
+            np.bitwise_or.at(self._bytes, (pages, xs), bits)
+        else:
+            np.bitwise_and.at(self._bytes, (pages, xs), ~bits)
+
+    def _slow(self):
+        # the pure Python FrameBuffer on the same buffer, for the rare calls
+        return _py.FrameBuffer(self._buf, self._width, self._height, self._format, self._stride)
+
+    def _fill_rect(self, x, y, w, h, c):
+        # already clipped
+        masks = self._row_masks(y, h)[:, None]
+        if c & 1:
+            self._bytes[:, x:x + w] |= masks
+        else:
+            self._bytes[:, x:x + w] &= ~masks
+
+    # public drawing api
+
+    def fill(self, c):
+        self._fill_rect(0, 0, self._width, self._height, c)
+
+    def pixel(self, x, y, c=-1):
+        if 0 <= x < self._width and 0 <= y < self._height:
+            i = y >> 3
+            bit = 1 << (y & 7)
+            if c == -1:
+                return 1 if self._bytes[i, x] & bit else 0
+            if c & 1:
+                self._bytes[i, x] |= bit
+            else:
+                self._bytes[i, x] &= ~bit & 0xFF
+
+    def fill_rect(self, x, y, w, h, c):
+        if h < 1 or w < 1 or x + w <= 0 or y + h <= 0 or y >= self._height or x >= self._width:
+            return
+        xend = min(self._width, x + w)
+        yend = min(self._height, y + h)
+        x = max(x, 0)
+        y = max(y, 0)
+        self._fill_rect(x, y, xend - x, yend - y, c)
+
+    def hline(self, x, y, w, c):
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x, y, h, c):
+        self.fill_rect(x, y, 1, h, c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            self.fill_rect(x, y, w, h, c)
+        else:
+            self.fill_rect(x, y, w, 1, c)
+            self.fill_rect(x, y + h - 1, w, 1, c)
+            self.fill_rect(x, y, 1, h, c)
+            self.fill_rect(x + w - 1, y, 1, h, c)
+
+    def line(self, x1, y1, x2, y2, c):
+        # the C Bresenham loop in closed form: at step i the minor axis has
+        # moved (2*dy*i - dx) // (2*dx) + 1 times
+        dx = x2 - x1
+        sx = 1 if dx > 0 else -1
+        dx = abs(dx)
+        dy = y2 - y1
+        sy = 1 if dy > 0 else -1
+        dy = abs(dy)
+        steep = dy > dx
+        if steep:
+            x1, y1 = y1, x1
+            dx, dy = dy, dx
+            sx, sy = sy, sx
+        if dx > 0:
+            i = np.arange(dx, dtype=np.int64)
+            major = x1 + sx * i
+            minor = y1 + sy * ((2 * dy * i - dx) // (2 * dx) + 1)
+            if steep:
+                xs, ys = minor, major
+            else:
+                xs, ys = major, minor
+            xs = np.append(xs, x2)
+            ys = np.append(ys, y2)
+        else:
+            xs = np.array([x2], dtype=np.int64)
+            ys = np.array([y2], dtype=np.int64)
+        keep = (xs >= 0) & (xs < self._width) & (ys >= 0) & (ys < self._height)
+        self._set_pixels(xs[keep], ys[keep], c)
+
+    def text(self, s, x0, y0, c=1):
+        s = str(s)
+        # UTF-8 bytes like the C code, drawing stops at a NUL
+        codes = np.frombuffer(s.encode().split(b"\0")[0], dtype=np.uint8).astype(np.int64)
+        if not len(codes):
+            return
+        codes[(codes < FIRST) | (codes > LAST)] = LAST
+        cols = _FONT[codes - FIRST].ravel()
+        # clip columns
+        xs = x0 + np.arange(len(cols))
+        keep = (xs >= 0) & (xs < self._width)
+        if not keep.any():
+            return
+        xs = xs[keep]
+        # each column byte straddles at most two pages
+        wide = cols[keep].astype(np.uint16) << (y0 & 7)
+        page = y0 >> 3
+        for p, part in ((page, wide & 0xFF), (page + 1, wide >> 8)):
+            if 0 <= p < self._pages:
+                bits = part.astype(np.uint8) & self._valid[p]
+                if c & 1:
+                    self._bytes[p, xs] |= bits
+                else:
+                    self._bytes[p, xs] &= ~bits
+
+    def scroll(self, xstep, ystep):
+        w = self._width
+        h = self._height
+        if xstep < 0:
+            if w + xstep <= 0:
+                return
+            dx0, dx1 = 0, w + xstep
+        else:
+            if xstep >= w:
+                return
+            dx0, dx1 = xstep, w
+        if ystep < 0:
+            if h + ystep <= 0:
+                return
+            dy0, dy1 = 0, h + ystep
+        else:
+            if ystep >= h:
+                return
+            dy0, dy1 = ystep, h
+        plane = self._plane()
+        plane[dy0:dy1, dx0:dx1] = plane[dy0 - ystep:dy1 - ystep, dx0 - xstep:dx1 - xstep].copy()
+        self._store(plane)
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        if isinstance(fbuf, tuple):
+            fbuf = FrameBuffer(*fbuf)
+        if x >= self._width or y >= self._height or -x >= fbuf._width or -y >= fbuf._height:
+            return
+        x0 = max(0, x)
+        y0 = max(0, y)
+        x1 = max(0, -x)
+        y1 = max(0, -y)
+        x0end = min(self._width, x + fbuf._width)
+        y0end = min(self._height, y + fbuf._height)
+        w = x0end - x0
+        h = y0end - y0
+        if w <= 0 or h <= 0:
+            return
+        cols = fbuf._plane()[y1:y1 + h, x1:x1 + w].astype(np.int64)
+        if palette is not None:
+            lut = np.array([palette.pixel(0, 0), palette.pixel(1, 0)], dtype=np.int64)
+            cols = lut[cols]
+        plane = self._plane()
+        dest = plane[y0:y0end, x0:x0end]
+        draw = cols != key
+        dest[draw] = cols[draw] & 1
+        self._store(plane)
+
+    def ellipse(self, x, y, xr, yr, c, f=False, m=0x0F):
+        self._slow().ellipse(x, y, xr, yr, c, f, m)
+
+    def poly(self, x, y, coords, c, f=False):
+        self._slow().poly(x, y, coords, c, f)
@@ -0,0 +1,81 @@
+""" oled - Recording SSD1306_I2C for the emulator.
+
+The real driver runs unchanged on top of the emulated framebuf and I2C, and
+every show() is kept as a frame that can be saved as PBM or PNG.
+"""
+
+import struct
+import zlib
+
+import ssd1306
+from . import displays
+from .machine import I2C
+
+
+class SSD1306_I2C(ssd1306.SSD1306_I2C):
+    def __init__(self, width, height, i2c=None, addr=0x3C, external_vcc=False):
+        self.frames = []  # (buffer, start line) per show()
+        self.recording = True
+        if i2c is None:
+            i2c = I2C(0)
+        super().__init__(width, height, i2c, addr, external_vcc)
+        displays.append(self)
+
+    def show(self, full=False):
+        super().show(full)
+        if self.recording:
+            self.frames.append((bytes(self.buffer), self.start))
+
+    def rows(self, frame=-1):
+        # the frame as the panel shows it, a list of rows of 0/1 pixels
+        buf, start = self.frames[frame]
+        rows = []
+        for r in range(self.height):
+            y = (r + start) % self.height
+            i = (y >> 3) * self.width
+            bit = y & 7
+            rows.append([(buf[i + x] >> bit) & 1 for x in range(self.width)])
+        return rows
+
+    def pbm(self, frame=-1):
+        # binary PBM, lit pixels white as on the panel
+        out = bytearray(b"P4\n%d %d\n" % (self.width, self.height))
+        for row in self.rows(frame):
+            for x in range(0, self.width, 8):
+                b = 0
+                for bit in range(8):
+                    b <<= 1
+                    if x + bit < self.width and not row[x + bit]:
+                        b |= 1
+                out.append(b)
+        return bytes(out)
+
+    def png(self, frame=-1, scale=1):
+        raw = bytearray()
+        for row in self.rows(frame):
+            line = bytearray()
+            for p in row:
+                line.extend(b"\xff" * scale if p else b"\x00" * scale)
+            for i in range(scale):
+                raw.append(0)  # filter type none
+                raw.extend(line)
+
+        def chunk(kind, data):
+            return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+        header = struct.pack(">IIBBBBB", self.width * scale, self.height * scale, 8, 0, 0, 0, 0)
+        return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) +
+                chunk(b"IDAT", zlib.compress(bytes(raw))) + chunk(b"IEND", b""))
+
+    def save(self, filename, frame=-1, scale=1):
+        # format from the extension, .pbm or .png
+        if filename.lower().endswith(".png"):
+            data = self.png(frame, scale)
+        else:
+            data = self.pbm(frame)
+        with open(filename, "wb") as f:
+            f.write(data)
+
+    def save_all(self, prefix, ext=".png", scale=1):
+        for i in range(len(self.frames)):
+            self.save("%s%04d%s" % (prefix, i, ext), i, scale)
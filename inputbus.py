@@ -0,0 +1,130 @@
+""" InputBus - One queue of rotary and button events to wait on.
+
+Version 00
+James M. Reneau Ph.D.
+http://www.picohhg.com
+
+This work is licensed under the Creative Commons Attribution-ShareAlike 2.0 Generic License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/2.0/ or send
+a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+
+The rotary listener and the button (created with irq=True) hand their events to
+micropython.schedule and the scheduled callback queues them here.  wait() idles the
+processor (or light sleeps) until an event arrives instead of polling every tenth of
+a second.
+
+    bus = InputBus(rotary, button)
+    ChooserBaseClass.inputBus = bus
+
+V
+00		2026-10-18	jmr		original coding
+"""
+
+import time
+import machine
+import micropython
+from micropython import const
+from array import array
+
+class InputBus():
+    
+    ## event codes, the button codes are the Button ones
+    PRESS = const(1)
+    RELEASE = const(2)
+    LONG = const(3)
+    DOUBLE = const(4)
+    ROTATE = const(5)
+    
+    def __init__(self, rotary=None, button=None, size=16, sleep=0):
+        """ create the bus
+        Parameters:
+        :rotary: Rotary to listen to
+        :button: Button created with irq=True to listen to (a polling button is ignored)
+        :size: events kept, the oldest are dropped when full
+        :sleep: ms to lightsleep between checks in wait(), 0 uses machine.idle()
+        """
+        self.size = size
+        self.codes = bytearray(size)
+        self.args = array('i', [0] * size)
+        self.head = 0
+        self.tail = 0
+        self.sleep = sleep
+        self.rotary = None
+        self.button = None
+        ## bind the callbacks once
+        self._rotaryCb = self._rotaryChanged
+        self._rotarySchedCb = self._rotaryScheduled
+        self._buttonCb = self._buttonEvent
+        self._buttonSchedCb = self._buttonScheduled
+        self.attach(rotary, button)
+        
+    def attach(self, rotary=None, button=None):
+        """ listen to a new rotary and button, the old ones are let go """
+        self.detach()
+        if rotary:
+            rotary.add_listener(self._rotaryCb)
+            self.rotary = rotary
+        if button and getattr(button, 'irqMode', False):
+            button.listener = self._buttonCb
+            self.button = button
+        self.clear()
+        
+    def detach(self):
+        if self.rotary:
+            self.rotary.remove_listener(self._rotaryCb)
+            self.rotary = None
+        if self.button:
+            self.button.listener = None
+            self.button = None
+        
+    def _rotaryChanged(self):
+        ## called from the pin interrupt
+        try:
+            micropython.schedule(self._rotarySchedCb, 0)
+        except RuntimeError:
+            pass ## schedule queue full, the next edge will wake us
+        
+    def _rotaryScheduled(self, arg):
+        if self.rotary:
+            self.push(InputBus.ROTATE, self.rotary.value())
+        
+    def _buttonEvent(self, code):
+        ## called from the button timer callback
+        try:
+            micropython.schedule(self._buttonSchedCb, code)
+        except RuntimeError:
+            pass
+        
+    def _buttonScheduled(self, code):
+        self.push(code, time.ticks_ms())
+        
+    def push(self, code, arg=0):
+        self.codes[self.head] = code
+        self.args[self.head] = arg
+        self.head = (self.head + 1) % self.size
+        if self.head == self.tail:
+            ## full, drop the oldest
+            self.tail = (self.tail + 1) % self.size
+            
+    def event(self):
+        ## return the next (code, arg) or None, never waits
+        if self.head == self.tail:
+            return None
+        e = (self.codes[self.tail], self.args[self.tail])
+        self.tail = (self.tail + 1) % self.size
+        return e
+    
+    def clear(self):
+        self.tail = self.head
+        
+    def wait(self, timeout=None):
+        ## wait for the next (code, arg), None if timeout ms pass first
+        start = time.ticks_ms()
+        while self.head == self.tail:
+            if timeout is not None and time.ticks_diff(time.ticks_ms(), start) >= timeout:
+                return None
+            if self.sleep:
+                machine.lightsleep(self.sleep)
+            else:
+                machine.idle()
+        return self.event()
@@ -1,6 +1,6 @@
 """ JacksOrBetter - Simple Poker Game
 
-Version 00
+Version 02
 James M. Reneau Ph.D.
 http://www.picohhg.com
 
@@ -10,6 +10,8 @@ a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
 
 V
 00		2023-05-19	jmr		original coding
+01		2026-10-18	jmr		bet dial uses rotary acceleration
+02		2026-10-18	jmr		run(ctx) with the menu's display and input
 """
 
 VERSION = "00"
@@ -18,11 +20,7 @@ import random
 import math
 import time
 import sys
-from machine import I2C
-from machine import Pin
-from rotaryIRQ import RotaryIRQ
-from ssd1306 import SSD1306_I2C
-from button import Button
+from context import Context
 from choosers import *
 from playingcards import *
 
@@ -68,89 +66,92 @@ def jacksOrBetterScore(hand):
     return (0, hand[4], "0x you loose")
 
     
-i2c = I2C(0, sda=Pin(16), scl=Pin(17), freq=400000)
-oled = SSD1306_I2C(128, 64, i2c)
-rotary = RotaryIRQ(7, 6)
-button = Button(26)
+def run(ctx):
+    oled = ctx.oled
+    rotary = ctx.rotary
+    button = ctx.button
         
-uiWidgets = [PlayingCardButton(oled, 0, 10, None),
-      PlayingCardButton(oled, 24, 10, None),
-      PlayingCardButton(oled, 48, 10, None),
-      PlayingCardButton(oled, 72, 10, None),
-      PlayingCardButton(oled, 96, 10, None),
-      ChooserUIText(oled, 10, 50, "Deal")
-      ]
-
-balance = 10
-hand = [None, None, None, None, None] 
-
-TextScroll(oled, rotary, button, [
-    "Jacks or better.",
-    "Version "+VERSION,
-    "This is a simple game of 5 card draw poker where you play against the house.  Bet is returned with a pair of jacks or higher. Better hands are paid, better."
-    ]).display()
-
-while True:
-    ## show backs
-    oled.fill(0)
-    oled.text("Jacks or Better!",0,0)
-    oled.text("You have $" + str(balance), 0, 40)
-    oled.text("Click to bet.",0,50)
-    for i in range(5):
-        uiWidgets[i].card = None
-        hand[i] = None
-        uiWidgets[i].invese = False
-        uiWidgets[i].draw()
-    oled.show()
-    button.wait()
-    
-    bet =  ChooseFaceNumber(oled, rotary, button, "Bet. Balance " + str(balance), 1, balance, 1, 10).get()
-
-    # deal initialhand
-    deck = PlayingCardDeck()
-    deck.shuffle()
-    for i in range(5):
-        hand[i] = deck.deal()
-        uiWidgets[i].card = hand[i]
-    ui = ChooseUI(oled, rotary, button, uiWidgets)
-    
-    # allos user to mark carda and choose deal
-    v = -1
-    oled.fill(0)
-    oled.text("Jacks or Better!",0,0)
-    oled.text("Mark your hand.",0,40)
+    uiWidgets = [PlayingCardButton(oled, 0, 10, None),
+          PlayingCardButton(oled, 24, 10, None),
+          PlayingCardButton(oled, 48, 10, None),
+          PlayingCardButton(oled, 72, 10, None),
+          PlayingCardButton(oled, 96, 10, None),
+          ChooserUIText(oled, 10, 50, "Deal")
+          ]
+
+    balance = 10
+    hand = [None, None, None, None, None] 
+
+    TextScroll(oled, rotary, button, [
+        "Jacks or better.",
+        "Version "+VERSION,
+        "This is a simple game of 5 card draw poker where you play against the house.  Bet is returned with a pair of jacks or higher. Better hands are paid, better."
+        ]).display()
+
     while True:
-        v = ui.get()
-        if v >=0 and v < 5:
-            uiWidgets[v].inverse = not uiWidgets[v].inverse
-        elif v == 5:
-            break
-    
-    # deal new cards
-    for i in range(5):
-        if uiWidgets[i].inverse:
-            uiWidgets[i].inverse = False
-        else:
+        ## show backs
+        oled.fill(0)
+        oled.text("Jacks or Better!",0,0)
+        oled.text("You have $" + str(balance), 0, 40)
+        oled.text("Click to bet.",0,50)
+        for i in range(5):
+            uiWidgets[i].card = None
+            hand[i] = None
+            uiWidgets[i].invese = False
+            uiWidgets[i].draw()
+        oled.show()
+        button.wait()
+
+        bet =  ChooseFaceNumber(oled, rotary, button, "Bet. Balance " + str(balance), 1, balance, 1, 10, accel=5).get()
+
+        # deal initialhand
+        deck = PlayingCardDeck()
+        deck.shuffle()
+        for i in range(5):
             hand[i] = deck.deal()
             uiWidgets[i].card = hand[i]
-            
-    # show cards
-    oled.fill(0)
-    oled.text("Jacks or Better!",0,0)
-    for i in range(5):
-        uiWidgets[i].draw()
-    score = jacksOrBetterScore(hand)
-    balance = balance - bet
-    balance = balance + score[0] * bet
-    
-    oled.text(score[2],0,40)
-    oled.text("You have $" + str(balance), 0, 50)
-    
-    oled.show()
-    button.wait()
+        ui = ChooseUI(oled, rotary, button, uiWidgets)
+
+        # allos user to mark carda and choose deal
+        v = -1
+        oled.fill(0)
+        oled.text("Jacks or Better!",0,0)
+        oled.text("Mark your hand.",0,40)
+        while True:
+            v = ui.get()
+            if v >=0 and v < 5:
+                uiWidgets[v].inverse = not uiWidgets[v].inverse
+            elif v == 5:
+                break
+
+        # deal new cards
+        for i in range(5):
+            if uiWidgets[i].inverse:
+                uiWidgets[i].inverse = False
+            else:
+                hand[i] = deck.deal()
+                uiWidgets[i].card = hand[i]
 
-    if balance <= 0:
+        # show cards
         oled.fill(0)
-        oled.text("game over.",0,20)
+        oled.text("Jacks or Better!",0,0)
+        for i in range(5):
+            uiWidgets[i].draw()
+        score = jacksOrBetterScore(hand)
+        balance = balance - bet
+        balance = balance + score[0] * bet
+
+        oled.text(score[2],0,40)
+        oled.text("You have $" + str(balance), 0, 50)
+
         oled.show()
-        break
+        button.wait()
+
+        if balance <= 0:
+            oled.fill(0)
+            oled.text("game over.",0,20)
+            oled.show()
+            break
+
+if __name__ == "__main__":
+    run(Context.create())
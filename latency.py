@@ -0,0 +1,154 @@
+""" Latency - Input to photon timing for the rotary and the display.
+
+Version 01
+James M. Reneau Ph.D.
+http://www.picohhg.com
+
+This work is licensed under the Creative Commons Attribution-ShareAlike 2.0 Generic License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/2.0/ or send
+a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+
+A rotary listener stamps each change with time.ticks_us() (with a soft irq that is when the
+handler runs, with hard_irq=True it is the edge).  The oled probe hands the oldest waiting
+stamp to the next frame that starts drawing and, when that frame's show() is done on the bus,
+records the latency.  Render (first drawing call to show) and transmit (show) times are kept
+for every frame.  The last size samples of each give min, mean and p99.
+
+    lat = Latency(oled, rotary)
+    ...
+    lat.overlay(rotary, button) ## TextScroll of the stats
+    lat.dump() ## print over serial
+
+V
+00		2026-10-18	jmr		original coding
+01		2026-10-18	jmr		removed install() and uninstall(), the menu attaches to its own oled and rotary
+"""
+
+import time
+from array import array
+
+class Stat():
+    """ ring of the last size samples in us """
+    
+    def __init__(self, size):
+        self.samples = array('L', [0] * size)
+        self.n = 0 ## samples taken
+        
+    def add(self, us):
+        self.samples[self.n % len(self.samples)] = us
+        self.n += 1
+        
+    def summary(self):
+        ## (min, mean, p99) in us, None before the first sample
+        count = min(self.n, len(self.samples))
+        if not count:
+            return None
+        s = sorted(self.samples[:count])
+        return (s[0], sum(s) // count, s[(count * 99 - 1) // 100])
+    
+class Latency():
+    
+    def __init__(self, oled=None, rotary=None, size=64):
+        self.latency = Stat(size)
+        self.render = Stat(size)
+        self.transmit = Stat(size)
+        self.waiting = False ## an input has not been drawn yet
+        self.stamp = 0 ## ticks_us of the oldest waiting input
+        self.tagged = False ## the frame being drawn consumes an input
+        self.tag = 0
+        self.drawStart = 0
+        self.drawn = False
+        self.showStart = 0
+        self.oled = None
+        self.rotary = None
+        ## bind the listener once
+        self._inputCb = self.input
+        self.attach(oled, rotary)
+        
+    def attach(self, oled=None, rotary=None):
+        """ time this oled and rotary, the old ones are let go """
+        self.detach()
+        if oled:
+            oled.add_probe(self)
+            self.oled = oled
+        if rotary:
+            rotary.add_listener(self._inputCb)
+            self.rotary = rotary
+            
+    def detach(self):
+        if self.oled:
+            self.oled.remove_probe(self)
+            self.oled = None
+        if self.rotary:
+            self.rotary.remove_listener(self._inputCb)
+            self.rotary = None
+            
+    def input(self):
+        ## an input happened (rotary listener, or call it for other inputs)
+        if not self.waiting:
+            self.stamp = time.ticks_us()
+            self.waiting = True
+            
+    def _consume(self):
+        self.tagged = self.waiting
+        self.tag = self.stamp
+        self.waiting = False
+            
+    ## oled probe
+    
+    def draw(self):
+        self.drawStart = time.ticks_us()
+        self.drawn = True
+        self._consume()
+        
+    def show_start(self):
+        self.showStart = time.ticks_us()
+        if self.drawn:
+            self.render.add(time.ticks_diff(self.showStart, self.drawStart))
+        else:
+            ## show() without drawing, it still carries the input out
+            self._consume()
+        
+    def show_end(self):
+        now = time.ticks_us()
+        self.transmit.add(time.ticks_diff(now, self.showStart))
+        if self.tagged:
+            self.latency.add(time.ticks_diff(now, self.tag))
+            self.tagged = False
+        self.drawn = False
+        
+    ## reporting
+    
+    def lines(self):
+        l = []
+        for name, stat in (("input", self.latency), ("render", self.render), ("send", self.transmit)):
+            s = stat.summary()
+            if s is None:
+                l.append(name + " none")
+            else:
+                l.append(name + " n " + str(stat.n) + " min " + Latency.ms(s[0]) +
+                    " avg " + Latency.ms(s[1]) + " p99 " + Latency.ms(s[2]) + " ms")
+        return l
+    
+    @staticmethod
+    def ms(us):
+        ## us as ms with one decimal
+        return str(us // 1000) + "." + str(us % 1000 // 100)
+    
+    def overlay(self, rotary, button):
+        """ show the stats in a TextScroll on the timed oled """
+        from choosers import TextScroll
+        text = self.lines()
+        oled = self.oled
+        timed = self.rotary
+        self.detach() ## do not time the overlay itself
+        TextScroll(oled, rotary, button, text).display()
+        self.attach(oled, timed)
+        
+    def dump(self):
+        """ print the stats and the raw samples (us) over serial """
+        for l in self.lines():
+            print(l)
+        for name, stat in (("input", self.latency), ("render", self.render), ("send", self.transmit)):
+            count = min(stat.n, len(stat.samples))
+            print(name, list(stat.samples[:count]))
@@ -0,0 +1,132 @@
+""" loader - Import modules from the cross compiled .mpy files while they are up to date.
+
+Version 02
+James M. Reneau Ph.D.
+http://www.picohhg.com
+
+This work is licensed under the Creative Commons Attribution-ShareAlike 2.0 Generic License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/2.0/ or send
+a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+
+build.py on the workstation writes mpy/ with a .mpy for each module and a manifest of the
+sha256 of the source each one was built from.  At boot validate() hashes the sources on the
+Pico, removes the .mpy files that no longer match (a .py was copied over after the build) or
+whose header does not match sys.implementation._mpy (mpy-cross of another MicroPython version
+or arch) and puts mpy/ at the front of sys.path, so import finds an up to date .mpy before the .py and
+falls back to the .py for the rest.  load() imports a game and keeps how long the import
+(compile and run of the module body) took and which file it came from.  An .mpy that still
+fails to import with a ValueError is removed and the .py imported instead.
+
+    loader = Loader()
+    loader.validate() ## before the other imports
+    ...
+    game = loader.load("sst")
+
+V
+00		2026-10-18	jmr		original coding
+01		2026-10-18	jmr		load times are only printed when verbose
+02		2026-10-18	jmr		.mpy files built for another MicroPython are removed, load() falls back to the .py
+"""
+
+import os
+import sys
+import time
+import hashlib
+import binascii
+
+class Loader():
+
+    def __init__(self, dir="mpy", verbose=False):
+        self.dir = dir
+        self.verbose = verbose ## print each load over serial, lines() has them either way
+        self.manifest = dir + "/manifest.txt"
+        self.fresh = 0 ## .mpy files in use
+        self.stale = [] ## modules whose .mpy was removed
+        self.times = {} ## module -> (ms, "mpy" or "py")
+        self.buf = bytearray(512)
+
+    def sha256(self, filename):
+        ## hex digest of a file, read through one buffer
+        h = hashlib.sha256()
+        mv = memoryview(self.buf)
+        with open(filename, "rb") as f:
+            while True:
+                n = f.readinto(self.buf)
+                if not n:
+                    break
+                h.update(mv[0:n])
+        return binascii.hexlify(h.digest()).decode()
+
+    def compatible(self, filename):
+        ## the .mpy header ("M", version, sub version and arch) against this MicroPython
+        mpy = getattr(sys.implementation, "_mpy", None)
+        if mpy is None:
+            return True ## too old to tell, load() falls back on the import error
+        with open(filename, "rb") as f:
+            head = f.read(3)
+        if len(head) < 3 or head[0] != ord("M"):
+            return False
+        arch = head[2] >> 2
+        return (head[1] == mpy & 0xff and head[2] & 3 == (mpy >> 8) & 3 and
+            (arch == 0 or arch == mpy >> 10))
+
+    def validate(self):
+        """ remove stale .mpy files and put the folder on sys.path, returns the number in use """
+        try:
+            f = open(self.manifest)
+        except OSError:
+            return 0
+        files = os.listdir()
+        compiled = os.listdir(self.dir)
+        with f:
+            for line in f:
+                words = line.split()
+                if len(words) != 2 or words[0] + ".mpy" not in compiled:
+                    continue
+                name, digest = words
+                path = self.dir + "/" + name + ".mpy"
+                ## without the source the .mpy is all there is
+                if ((name + ".py" in files and self.sha256(name + ".py") != digest) or
+                        not self.compatible(path)):
+                    os.remove(path)
+                    self.stale.append(name)
+                else:
+                    self.fresh += 1
+        if self.fresh and self.dir not in sys.path:
+            sys.path.insert(0, self.dir)
+        return self.fresh
+
+    def load(self, name):
+        """ import a module, keeping the load time """
+        start = time.ticks_ms()
+        try:
+            m = __import__(name)
+        except ValueError as e:
+            ## an .mpy this MicroPython can not load, import the source instead
+            try:
+                compiled = os.listdir(self.dir)
+            except OSError:
+                compiled = []
+            if name + ".mpy" not in compiled:
+                raise e
+            os.remove(self.dir + "/" + name + ".mpy")
+            self.stale.append(name)
+            if name in sys.modules:
+                del sys.modules[name]
+            m = __import__(name)
+        ms = time.ticks_diff(time.ticks_ms(), start)
+        kind = "mpy" if getattr(m, "__file__", "").endswith(".mpy") else "py"
+        self.times[name] = (ms, kind)
+        if self.verbose:
+            print("loaded", name, "from", kind, "in", ms, "ms")
+        return m
+
+    def lines(self):
+        """ the load times as text lines """
+        l = []
+        for name in sorted(self.times):
+            ms, kind = self.times[name]
+            l.append(name + " " + kind + " " + str(ms) + " ms")
+        if self.stale:
+            l.append("stale: " + " ".join(self.stale))
+        return l
@@ -1,6 +1,6 @@
 """ Menu (use as main.py)
 
-Version 03
+Version 16
 James M. Reneau Ph.D.
 http://www.picohhg.com
 
@@ -14,30 +14,76 @@ V
 02		2023-05-19	jmr		added jacks or better
 03		2023-05-20	jmr		added one hand solitare
 04		2023-05-23	jmr		added the oracle
+05		2026-10-18	jmr		interrupt button and InputBus for the choosers
+06		2026-10-18	jmr		record.cfg records each game, added Replay
+07		2026-10-18	jmr		latency.cfg times input to display, added Latency
+08		2026-10-18	jmr		menu shows four rows
+09		2026-10-18	jmr		games are modules run with a Context, unloaded after
+10		2026-10-18	jmr		modules load from up to date mpy/ files, About shows load times
+11		2026-10-18	jmr		bootprof.cfg profiles the boot up to the first menu frame
+12		2026-10-18	jmr		memmon.cfg keeps heap high-water marks for each game, added Memory
+13		2026-10-18	jmr		Replay plays the session at its own pace, not the encoder's
+14		2026-10-18	jmr		recorder and siminput are imported only for record.cfg and Replay
+15		2026-10-18	jmr		latency is imported only for latency.cfg
+16		2026-10-18	jmr		the recording is closed when a game fails too
 """
 import sys
+import os
+
+## profile the boot (bootprof.py on a workstation has already started one)
+prof = None
+if "bootprof" in sys.modules or "bootprof.cfg" in os.listdir():
+    from bootprof import Profiler
+    prof = Profiler.begin()
+    mark = prof.mark
+else:
+    def mark(name):
+        pass
+
 import time
 import math
-import os
+import gc
+
+## use the cross compiled modules before anything else is imported
+from loader import Loader
+loader = Loader()
+if sys.implementation.name == 'micropython':
+    loader.validate()
+mark("loader")
 
 from choosers import ChooseList
 from choosers import TextScroll
+from choosers import ChooserBaseClass
+from context import Context
+mark("imports")
 
+ctx = Context.create(mark=mark)
+latency = None
+memmon = None
 if sys.implementation.name == 'micropython':
-    from machine import Pin
-    from machine import I2C
-    from rotaryIRQ import RotaryIRQ
-    from ssd1306 import SSD1306_I2C
-    from button import Button
-    
-    i2c = I2C(0, sda=Pin(16), scl=Pin(17), freq=400000)
-    oled = SSD1306_I2C(128, 64, i2c)
-    rotary = RotaryIRQ(7, 6)
-    button = Button(26)
+    ## the choosers idle on the bus, the recorder is only imported when it is used
+    from inputbus import InputBus
+    RECORDING = "session.rec" ## recorder.FILENAME
+    ctx.inputBus = InputBus(ctx.rotary, ctx.button)
+    ChooserBaseClass.inputBus = ctx.inputBus
+    if "latency.cfg" in os.listdir():
+        ## stays on the menu's oled and rotary, so the games are timed too
+        from latency import Latency
+        latency = Latency(ctx.oled, ctx.rotary)
+    if "memmon.cfg" in os.listdir():
+        ## overlay in the file turns on the free heap in the corner
+        from memmon import MemMonitor
+        with open("memmon.cfg") as f:
+            memmon = MemMonitor(ctx.oled, "overlay" in f.read())
 else:
-    oled = False
-    rotary = False
-    rotarybutton = False
+    RECORDING = ""
+
+oled = ctx.oled
+rotary = ctx.rotary
+button = ctx.button
+mark("input")
+if prof:
+    prof.firstFrame(oled)
 
 def find(l, s):
     try:
@@ -45,24 +91,61 @@ def find(l, s):
     except:
         return -1
 
+def launch(i, ctx, record=False):
+    ## import the game, run it (recording its input) and unload it again
+    name = menufiles[i][:-3]
+    ctx.reset()
+    error = False
+    recorder = None
+    if record:
+        from recorder import Recorder
+        recorder = Recorder(app=i).attach(ctx)
+    if memmon:
+        memmon.begin(name)
+    try:
+        loader.load(name).run(ctx)
+    except MemoryError:
+        ## with the monitor on it is kept and shown instead of ending the menu
+        if not memmon:
+            raise
+        error = True
+    finally:
+        ## session.rec is kept and button.pressed given back however the game ended
+        if recorder:
+            recorder.close()
+        if name in sys.modules:
+            del sys.modules[name]
+        gc.collect()
+    if memmon:
+        memmon.end(error)
+        if error:
+            TextScroll(oled, rotary, button, ["Out of memory in " + name] + memmon.lines()).display()
+
     
-VERSION = "03"
-menufiles = ["pong04.py", "sst.py", "jacksorbetter.py", "onehandedsolitare.py", "theoracle.py", "clockywocky.py", "", ""]
+VERSION = "16"
+menufiles = ["pong.py", "sst.py", "jacksorbetter.py", "onehandedsolitare.py", "theoracle.py", "clockywocky.py", "", ""]
 menunames = ["PicoPong", "Super Trekie", "Jacks or Better", "OneHand Solitare", "The Oracle", "Clocky Woky", "About", "Quit"]
 
 while True:
     files = os.listdir()
+    mark("listdir")
     installed = []
     for f in files:
         i = find(menufiles, f)
         if i >=0:
             installed.append(menunames[i])
+    if RECORDING in files:
+        installed.append("Replay")
+    if latency:
+        installed.append("Latency")
+    if memmon:
+        installed.append("Memory")
     installed.append(menunames[-2])
     installed.append(menunames[-1])
 
     oled.fill(0)
     oled.text("PicoHHG Menu " + VERSION, 0, 0)
-    s = ChooseList(oled, rotary, button, installed, 0, 20, "choose...").get()
+    s = ChooseList(oled, rotary, button, installed, 0, 20, "choose...", rows=4).get()
     if s == menunames[-1]:
         break
     elif s == menunames[-2]:
@@ -70,13 +153,34 @@ while True:
             "PicoHHG Menu",
             "Version "+VERSION,
             "Program Menu by J.M.Reneau."
-            ]).display()
+            ] + loader.lines()).display()
+    elif s == "Latency":
+        latency.dump()
+        latency.overlay(rotary, button)
+    elif s == "Memory":
+        memmon.show(rotary, button)
+    elif s == "Replay":
+        ## play the last recorded session back into the same game
+        from recorder import Replay
+        from siminput import ScriptEnd
+        replay = Replay()
+        replayCtx = replay.context(ctx)
+        ## the choosers wake for the recorded input, not the encoder
+        ChooserBaseClass.inputBus = replayCtx.inputBus
+        try:
+            launch(replay.app, replayCtx)
+        except ScriptEnd:
+            pass
+        finally:
+            ChooserBaseClass.inputBus = ctx.inputBus
+        replay = None
+        replayCtx = None
     else:
         i = find(menunames, s)
         if i >= 0:
-            exec(open(menufiles[i]).read())
+            launch(i, ctx, "record.cfg" in files)
 
 oled.fill(0)
-oled.text("PicoHHT Menu " + version, 0, 0)
+oled.text("PicoHHG Menu " + VERSION, 0, 0)
 oled.text("Exited.", 0, 10)
 oled.show()
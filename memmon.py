@@ -0,0 +1,184 @@
+""" MemMon - Heap high-water marks and collections for each game, with a free heap overlay.
+
+Version 00
+James M. Reneau Ph.D.
+http://www.picohhg.com
+
+This work is licensed under the Creative Commons Attribution-ShareAlike 2.0 Generic License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/2.0/ or send
+a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+
+An oled probe samples gc.mem_alloc() and gc.mem_free() as each frame is shown, so every
+chooser and every game screen is a sample.  The most heap in use, the least free and the
+number of collections (the heap in use went down between two samples) are kept for the game
+that is running.  When the game ends they are added to mem.txt, one line per game:
+
+    <name> <runs> <frames> <most used> <least free> <collections> <memory errors>
+
+With overlay=True the free heap (in k) is drawn in the top right corner of every frame.
+
+    mon = MemMonitor(oled, overlay=True)
+    mon.begin("sst")
+    ...
+    mon.end() ## or mon.end(error=True) after a MemoryError
+    mon.lines() ## the table as text
+
+V
+00		2026-10-18	jmr		original coding
+"""
+
+import gc
+
+FILENAME = "mem.txt"
+
+## heap in use and free, off the Pico tracemalloc counts what is in use and free is not known
+if hasattr(gc, "mem_alloc"):
+    memAlloc = gc.mem_alloc
+    memFree = gc.mem_free
+else:
+    import tracemalloc
+    tracemalloc.start()
+    def memAlloc():
+        return tracemalloc.get_traced_memory()[0]
+    def memFree():
+        return 0
+
+class MemStat():
+    """ the samples of one game, merged with the saved totals by add() """
+
+    def __init__(self, name, runs=0, frames=0, used=0, free=-1, collections=0, errors=0):
+        self.name = name
+        self.runs = runs
+        self.frames = frames
+        self.used = used ## most heap in use
+        self.free = free ## least heap free, -1 before the first sample
+        self.collections = collections
+        self.errors = errors ## MemoryError that ended the game
+
+    def add(self, other):
+        self.runs += other.runs
+        self.frames += other.frames
+        self.used = max(self.used, other.used)
+        if self.free < 0 or 0 <= other.free < self.free:
+            self.free = other.free
+        self.collections += other.collections
+        self.errors += other.errors
+
+    def line(self):
+        return (self.name + " " + str(self.runs) + " " + str(self.frames) + " " + str(self.used) +
+            " " + str(self.free) + " " + str(self.collections) + " " + str(self.errors))
+
+    @staticmethod
+    def parse(line):
+        words = line.split()
+        if len(words) != 7:
+            return None
+        return MemStat(words[0], *[int(w) for w in words[1:]])
+
+class MemMonitor():
+
+    def __init__(self, oled=None, overlay=False, filename=FILENAME):
+        self.filename = filename
+        self.overlay = overlay
+        self.menu = MemStat("menu", 1) ## samples outside of a game, not saved
+        self.stat = self.menu
+        self.last = memAlloc()
+        self.oled = None
+        self.attach(oled)
+
+    def attach(self, oled):
+        """ sample this oled's frames, the old one is let go """
+        self.detach()
+        if oled:
+            oled.add_probe(self)
+            self.oled = oled
+
+    def detach(self):
+        if self.oled:
+            self.oled.remove_probe(self)
+            self.oled = None
+
+    def begin(self, name):
+        """ a game called name starts, its samples are kept apart """
+        self.stat = MemStat(name, 1)
+        self.last = memAlloc()
+        self.sample()
+
+    def end(self, error=False):
+        """ the game is done (error after a MemoryError), add its samples to the file """
+        stat = self.stat
+        if stat is self.menu:
+            return
+        if error:
+            stat.errors += 1
+        self.stat = self.menu
+        stats = self.read()
+        for s in stats:
+            if s.name == stat.name:
+                s.add(stat)
+                break
+        else:
+            stats.append(stat)
+        with open(self.filename, "w") as f:
+            for s in stats:
+                f.write(s.line() + "\n")
+
+    def read(self):
+        ## the saved MemStat of every game
+        stats = []
+        try:
+            with open(self.filename, "r") as f:
+                for line in f:
+                    s = MemStat.parse(line)
+                    if s:
+                        stats.append(s)
+        except OSError:
+            pass
+        return stats
+
+    def sample(self):
+        """ take a sample now (the probe takes one every frame), returns the free heap """
+        used = memAlloc()
+        free = memFree()
+        stat = self.stat
+        if used < self.last:
+            stat.collections += 1
+        self.last = used
+        if used > stat.used:
+            stat.used = used
+        if stat.free < 0 or free < stat.free:
+            stat.free = free
+        return free
+
+    ## oled probe
+
+    def draw(self):
+        pass
+
+    def show_start(self):
+        self.stat.frames += 1
+        free = self.sample()
+        ## only on frames that drew, drawing now would start a frame for the other probes
+        if self.overlay and self.oled.drawing:
+            s = str(free // 1024) + "k"
+            x = self.oled.width - len(s) * 8
+            self.oled.fill_rect(x, 0, len(s) * 8, 8, 0)
+            self.oled.text(s, x, 0, 1)
+
+    def show_end(self):
+        pass
+
+    ## reporting
+
+    def lines(self):
+        l = ["game runs frames", "  used free gcs err"]
+        for s in self.read() + [self.menu]:
+            l.append(s.name + " " + str(s.runs) + " " + str(s.frames))
+            l.append("  " + str(s.used // 1024) + "k " + str(s.free // 1024) + "k " +
+                str(s.collections) + " " + str(s.errors))
+        return l
+
+    def show(self, rotary, button):
+        """ show the table in a TextScroll on the monitored oled """
+        from choosers import TextScroll
+        TextScroll(self.oled, rotary, button, self.lines()).display()
@@ -1,6 +1,6 @@
 """ PlayingCards - Card, deck and button objects for playing cards
 
-Version 01
+Version 02
 James M. Reneau Ph.D.
 http://www.picohhg.com
 
@@ -11,6 +11,7 @@ a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
 V
 00		2023-05-08	jmr		original coding
 01		2023-05-22	jmr		Split out symbols
+02		2026-10-18	jmr		card and back mark the button for repaint
 
 """
 
@@ -104,11 +105,31 @@ class PlayingCardDeck():
     
 class PlayingCardButton(ChooserUIButton):
     def __init__(self, oled, x, y, card, back=False):
-        self.card = card
-        self.back = back ## show back
+        self._card = card
+        self._back = back ## show back
         self.symbols = Symbols(oled)
         super().__init__( oled, x, y, "", 20, 24, self.drawCardFace)
         
+    @property
+    def card(self):
+        return self._card
+    
+    @card.setter
+    def card(self, value):
+        if value is not self._card:
+            self._card = value
+            self.invalidate()
+            
+    @property
+    def back(self):
+        return self._back
+    
+    @back.setter
+    def back(self, value):
+        if value != self._back:
+            self._back = value
+            self.invalidate()
+
 
     def drawCardFace(self, oled, x, y):
         fg = self.fgColor()
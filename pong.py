@@ -1,6 +1,6 @@
 """ Pico Pong
 
-Version 4
+Version 5
 James M. Reneau Ph.D.
 http://www.picohhg.com
 
@@ -11,18 +11,15 @@ a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
 V
 03		2023-05-08	jmr		changed button to use new button object
 04      2023-05-08  jmr     removed main loop for better menuing
+05		2026-10-18	jmr		run(ctx) with the menu's display and input
 """
 
-VERSION = "04"
+VERSION = "05"
 
 import math
 import random
 import time
-from machine import I2C
-from machine import Pin
-from rotaryIRQ import RotaryIRQ
-from ssd1306 import SSD1306_I2C
-from button import Button
+from context import Context
 
 class Paddle():
     def __init__(self, oled, rotary):
@@ -84,7 +81,7 @@ class Ball():
         return False
     
     def showScore(self):
-        oled.fill_rect(50, 0 , 16, 10, 0)
+        self.oled.fill_rect(50, 0 , 16, 10, 0)
         self.oled.text(str(self.score),50,0)
         
     def draw(self):
@@ -92,45 +89,46 @@ class Ball():
         self.oled.rect(int(self.x), int(self.y), 3, 3, 1)
         ### self.oled.show()
 
-i2c = I2C(0, sda=Pin(16), scl=Pin(17), freq=400000)
-oled = SSD1306_I2C(128, 64, i2c)
-rotary = RotaryIRQ(7, 6)
-button = Button(26)
-    
+def run(ctx):
+    oled = ctx.oled
+    rotary = ctx.rotary
+    button = ctx.button
 
-paddle = Paddle(oled, rotary)
-ball = Ball(oled)
+    paddle = Paddle(oled, rotary)
+    ball = Ball(oled)
 
-oled.fill(0)
-oled.text("Raspberry Pi", 0, 0)
-oled.text("PICO Pong  V" + VERSION, 0, 10)
-oled.text("J.M.Reneau '23", 0, 20)
-oled.text("Press button", 0, 30)
-oled.show()
-while not button.pressed():
-    time.sleep(.05)        
+    oled.fill(0)
+    oled.text("Raspberry Pi", 0, 0)
+    oled.text("PICO Pong  V" + VERSION, 0, 10)
+    oled.text("J.M.Reneau '23", 0, 20)
+    oled.text("Press button", 0, 30)
+    oled.show()
+    while not button.pressed():
+        time.sleep(.05)        
 
-oled.fill(0)
-paddle.draw(True)	## initial draw
-ball.showScore()
-oled.show()
-while True:
-    paddle.draw()
-    ball.move()
-    if ball.missed(paddle):
-        break;
-    ball.draw()
+    oled.fill(0)
+    paddle.draw(True)	## initial draw
+    ball.showScore()
     oled.show()
-    #print(paddle.y)
-    time.sleep(.05)
+    while True:
+        paddle.draw()
+        ball.move()
+        if ball.missed(paddle):
+            break;
+        ball.draw()
+        oled.show()
+        #print(paddle.y)
+        time.sleep(.05)
 
-## show Game Over and count down
-oled.text("Game Over", 30,30)
-oled.text("Press Button", 30,40)
-ball.showScore()
-oled.show()
+    ## show Game Over and count down
+    oled.text("Game Over", 30,30)
+    oled.text("Press Button", 30,40)
+    ball.showScore()
+    oled.show()
+
+    while not button.pressed():
+        time.sleep(.05) 
 
-while not button.pressed():
-    time.sleep(.05) 
-    
 
+if __name__ == "__main__":
+    run(Context.create())
@@ -0,0 +1,241 @@
+""" recorder - Record a session of rotary and button input and replay it.
+
+Version 02
+James M. Reneau Ph.D.
+http://www.picohhg.com
+
+This work is licensed under the Creative Commons Attribution-ShareAlike 2.0 Generic License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/2.0/ or send
+a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+
+Recorder seeds random, then logs every rotary change and every press a game takes as a
+4 byte record (ms since the last record as uint16, code, signed byte argument) in a
+preallocated bytearray that is appended to a file on flash.  Replay reads the file back,
+seeds random the same and plays the records through siminput, at real time or as fast as
+the code will poll.
+
+File: "PR", format 0, app number, seed (uint32 little endian), then the records.
+
+    rec = Recorder(app=3).attach(ctx) ## the Context's rotary and button are recorded
+    game.run(ctx)
+    rec.close()
+    
+    game.run(Replay().context(ctx)) ## the same display with the session played back
+
+The Replay Context's inputBus is a SimBus, set it as ChooserBaseClass.inputBus while the
+session plays so the choosers wake for the recorded input and not the encoder.
+
+install() and uninstall() do the same for a program that makes its own RotaryIRQ and Button.
+
+V
+00		2026-10-18	jmr		original coding
+01		2026-10-18	jmr		attach to a Context, Replay makes one
+02		2026-10-18	jmr		the Replay Context has a SimBus instead of the encoder's InputBus
+"""
+
+import os
+import time
+import random
+from micropython import const
+
+## record codes
+WAIT = const(0) ## time only, for gaps over 65535 ms
+MOVE = const(1) ## rotary value changed by arg
+PRESS = const(2) ## button.pressed() returned True
+
+FILENAME = "session.rec"
+HEADER = const(8)
+
+class Recorder():
+    
+    def __init__(self, filename=FILENAME, app=0, seed=None, size=256):
+        """ start a recording
+        Parameters:
+        :app: number saved in the header (main.py uses the menu index)
+        :seed: random seed, None makes one
+        :size: records held in memory between writes to flash
+        """
+        if seed is None:
+            seed = int.from_bytes(os.urandom(4), "little") & 0x7FFFFFFF
+        random.seed(seed)
+        self.filename = filename
+        self.seed = seed
+        self.buf = bytearray(size * 4)
+        self.n = 0 ## bytes in buf
+        self.dropped = 0 ## records lost while buf was full
+        self.last = time.ticks_ms()
+        self.rotary = None
+        self.rotaryValue = 0
+        self.button = None
+        self.saved = None
+        ## bind the callbacks once
+        self._rotaryCb = self._rotaryChanged
+        self._pressedCb = self._pressed
+        with open(filename, "wb") as f:
+            f.write(b"PR" + bytes([0, app]) + seed.to_bytes(4, "little"))
+            
+    def attachRotary(self, rotary):
+        self.rotary = rotary
+        self.rotaryValue = rotary._value
+        rotary.add_listener(self._rotaryCb)
+        
+    def attachButton(self, button):
+        ## wrap the instance's pressed(), wait() and waitRelease() use it too
+        self.button = button
+        self.buttonPressed = button.pressed
+        button.pressed = self._pressedCb
+        
+    def attach(self, ctx):
+        """ record the rotary and button of a Context """
+        self.attachRotary(ctx.rotary)
+        self.attachButton(ctx.button)
+        return self
+        
+    def install(self):
+        """ record the RotaryIRQ and Button the next program creates """
+        import rotaryIRQ
+        import button
+        self.saved = (rotaryIRQ.RotaryIRQ, button.Button)
+        rec = self
+        def makeRotary(*args, **kw):
+            r = rec.saved[0](*args, **kw)
+            rec.attachRotary(r)
+            return r
+        def makeButton(*args, **kw):
+            b = rec.saved[1](*args, **kw)
+            rec.attachButton(b)
+            return b
+        rotaryIRQ.RotaryIRQ = makeRotary
+        button.Button = makeButton
+        return self
+    
+    def uninstall(self):
+        if self.saved:
+            import rotaryIRQ
+            import button
+            rotaryIRQ.RotaryIRQ, button.Button = self.saved
+            self.saved = None
+            
+    def _put(self, code, arg, dt):
+        n = self.n
+        if n + 4 > len(self.buf):
+            self.dropped += 1
+            return
+        b = self.buf
+        b[n] = dt & 0xFF
+        b[n + 1] = dt >> 8
+        b[n + 2] = code
+        b[n + 3] = arg & 0xFF
+        self.n = n + 4
+        
+    def record(self, code, arg=0):
+        now = time.ticks_ms()
+        dt = time.ticks_diff(now, self.last)
+        self.last = now
+        while dt > 0xFFFF:
+            self._put(WAIT, 0, 0xFFFF)
+            dt -= 0xFFFF
+        self._put(code, arg, dt)
+        
+    def _rotaryChanged(self):
+        ## rotary listener, in the pin interrupt
+        v = self.rotary._value
+        d = v - self.rotaryValue
+        self.rotaryValue = v
+        while d:
+            step = max(-128, min(127, d))
+            self.record(MOVE, step)
+            d -= step
+            
+    def _pressed(self):
+        p = self.buttonPressed()
+        if p:
+            self.record(PRESS)
+        ## write out from here, not from the interrupt
+        if self.n > len(self.buf) * 3 // 4:
+            self.flush()
+        return p
+    
+    def flush(self):
+        if self.n:
+            with open(self.filename, "ab") as f:
+                f.write(memoryview(self.buf)[:self.n])
+            self.n = 0
+            
+    def close(self):
+        if self.rotary:
+            self.rotary.remove_listener(self._rotaryCb)
+            self.rotary = None
+        if self.button:
+            del self.button.pressed
+            self.button = None
+        self.flush()
+        
+class Replay():
+    
+    def __init__(self, filename=FILENAME):
+        with open(filename, "rb") as f:
+            data = f.read()
+        if data[:2] != b"PR" or len(data) < HEADER:
+            raise ValueError("not a session recording")
+        self.app = data[3]
+        self.seed = int.from_bytes(data[4:8], "little")
+        self.records = data[HEADER:]
+        self.saved = None
+        
+    def script(self, realtime=True):
+        """ the records as a siminput Script, without the waits unless realtime """
+        from siminput import Script
+        s = Script()
+        r = self.records
+        for i in range(0, len(r) - 3, 4):
+            dt = r[i] | (r[i + 1] << 8)
+            code = r[i + 2]
+            arg = r[i + 3]
+            if arg > 127:
+                arg -= 256
+            if realtime and dt:
+                s.add(Script.WAIT, dt)
+            if code == MOVE:
+                s.add(Script.MOVE, arg)
+            elif code == PRESS:
+                s.add(Script.PRESS)
+        return s
+    
+    def start(self, realtime=True):
+        ## seed random and make the rotary and button that play the session
+        from siminput import SimRotary
+        from siminput import SimButton
+        from siminput import SimBus
+        random.seed(self.seed)
+        script = self.script(realtime)
+        self.rotary = SimRotary(script)
+        self.button = SimButton(script)
+        self.bus = SimBus(script)
+        
+    def context(self, ctx, realtime=True):
+        """ seed random, return a Context with ctx's display that plays the session """
+        self.start(realtime)
+        return ctx.using(self.rotary, self.button, self.bus)
+    
+    def install(self, realtime=True):
+        """ seed random and make the next program's RotaryIRQ and Button play the session """
+        import rotaryIRQ
+        import button
+        self.start(realtime)
+        self.saved = (rotaryIRQ.RotaryIRQ, button.Button)
+        replay = self
+        def makeRotary(*args, **kw):
+            return replay.rotary
+        def makeButton(*args, **kw):
+            return replay.button
+        rotaryIRQ.RotaryIRQ = makeRotary
+        button.Button = makeButton
+        return self
+    
+    def uninstall(self):
+        if self.saved:
+            import rotaryIRQ
+            import button
+            rotaryIRQ.RotaryIRQ, button.Button = self.saved
+            self.saved = None
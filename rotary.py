@@ -8,6 +8,7 @@
 #   https://github.com/MikeTeachman/micropython-rotary
 
 import micropython
+import time
 
 _DIR_CW = const(0x10)  # Clockwise step
 _DIR_CCW = const(0x20)  # Counter-clockwise step
@@ -49,6 +50,14 @@ _transition_table_half_step = [
 _STATE_MASK = const(0x07)
 _DIR_MASK = const(0x30)
 
+# Rotary.RANGE_WRAP and RANGE_BOUNDED for the fast ISR
+_RANGE_WRAP = const(2)
+_RANGE_BOUNDED = const(3)
+
+# the same tables flattened to bytes for the fast ISR, index (state << 2) | CLK/DT
+_flat_table = bytes([s for row in _transition_table for s in row])
+_flat_table_half_step = bytes([s for row in _transition_table_half_step for s in row])
+
 
 def _wrap(value, incr, lower_bound, upper_bound):
     range = upper_bound - lower_bound + 1
@@ -75,7 +84,8 @@ class Rotary(object):
     RANGE_WRAP = const(2)
     RANGE_BOUNDED = const(3)
 
-    def __init__(self, min_val, max_val, incr, reverse, range_mode, half_step, invert):
+    def __init__(self, min_val, max_val, incr, reverse, range_mode, half_step, invert,
+                 accel=1, accel_ms=80, fast_isr=False):
         self._min_val = min_val
         self._max_val = max_val
         self._incr = incr
@@ -86,9 +96,21 @@ class Rotary(object):
         self._half_step = half_step
         self._invert = invert
         self._listener = []
+        # acceleration: a step that follows the last one by less than accel_ms
+        # moves up to accel times as far, scaled by how quick it was
+        self._accel = accel
+        self._accel_ms = accel_ms
+        self._last_ms = time.ticks_ms()
+        # the pin handler, bound once so enabling the irq does not allocate
+        if fast_isr:
+            self._table = _flat_table_half_step if half_step else _flat_table
+            self._isr = self._process_rotary_pins_fast
+        else:
+            self._isr = self._process_rotary_pins
 
     def set(self, value=None, min_val=None, incr=None,
-            max_val=None, reverse=None, range_mode=None):
+            max_val=None, reverse=None, range_mode=None,
+            accel=None, accel_ms=None):
         # disable DT and CLK pin interrupts
         self._hal_disable_irq()
 
@@ -104,6 +126,10 @@ class Rotary(object):
             self._reverse = -1 if reverse else 1
         if range_mode is not None:
             self._range_mode = range_mode
+        if accel is not None:
+            self._accel = accel
+        if accel_ms is not None:
+            self._accel_ms = accel_ms
         self._state = _R_START
 
         # enable DT and CLK pin interrupts
@@ -151,6 +177,15 @@ class Rotary(object):
 
         incr *= self._reverse
 
+        if incr:
+            # timestamp the step, fast spins take bigger steps
+            now = time.ticks_ms()
+            if self._accel > 1:
+                dt = time.ticks_diff(now, self._last_ms)
+                if dt < self._accel_ms:
+                    incr *= 1 + (self._accel - 1) * (self._accel_ms - dt) // self._accel_ms
+            self._last_ms = now
+
         if self._range_mode == self.RANGE_WRAP:
             self._value = _wrap(
                 self._value,
@@ -170,4 +205,51 @@ class Rotary(object):
             if old_value != self._value and len(self._listener) != 0:
                 _trigger(self)
         except:
-            pass
\ No newline at end of file
+            pass
+
+    @micropython.native
+    def _process_rotary_pins_fast(self, pin):
+        # same result as _process_rotary_pins without allocating: a flat
+        # bytes table, the wrap and bound inline and no try/except, so it
+        # can run as a hard irq.  Listeners must not allocate either.
+        clk_dt_pins = (self._hal_get_clk_value() << 1) | self._hal_get_dt_value()
+        if self._invert:
+            clk_dt_pins = ~clk_dt_pins & 0x03
+        state = self._table[((self._state & _STATE_MASK) << 2) | clk_dt_pins]
+        self._state = state
+        direction = state & _DIR_MASK
+        if direction == 0:
+            return
+        incr = self._incr
+        if direction == _DIR_CCW:
+            incr = -incr
+        if self._reverse < 0:
+            incr = -incr
+
+        now = time.ticks_ms()
+        if self._accel > 1:
+            dt = time.ticks_diff(now, self._last_ms)
+            if dt < self._accel_ms:
+                incr *= 1 + (self._accel - 1) * (self._accel_ms - dt) // self._accel_ms
+        self._last_ms = now
+
+        value = self._value + incr
+        mode = self._range_mode
+        if mode == _RANGE_WRAP:
+            lower = self._min_val
+            value = lower + (value - lower) % (self._max_val - lower + 1)
+        elif mode == _RANGE_BOUNDED:
+            if value < self._min_val:
+                value = self._min_val
+            elif value > self._max_val:
+                value = self._max_val
+        if value == self._value:
+            return
+        self._value = value
+
+        listeners = self._listener
+        i = 0
+        n = len(listeners)
+        while i < n:
+            listeners[i]()
+            i += 1
\ No newline at end of file
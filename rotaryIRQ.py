@@ -27,9 +27,16 @@ class RotaryIRQ(Rotary):
         range_mode=Rotary.RANGE_UNBOUNDED,
         pull_up=False,
         half_step=False,
-        invert=False
+        invert=False,
+        accel=1,
+        accel_ms=80,
+        fast_isr=False,
+        hard_irq=False
     ):
-        super().__init__(min_val, max_val, incr, reverse, range_mode, half_step, invert)
+        super().__init__(min_val, max_val, incr, reverse, range_mode, half_step, invert,
+                         accel, accel_ms, fast_isr)
+        # a hard irq runs the handler at once, use it with fast_isr
+        self._hard = hard_irq
 
         if pull_up:
             self._pin_clk = Pin(pin_num_clk, Pin.IN, Pin.PULL_UP)
@@ -41,10 +48,10 @@ class RotaryIRQ(Rotary):
         self._hal_enable_irq()
 
     def _enable_clk_irq(self):
-        self._pin_clk.irq(self._process_rotary_pins, IRQ_RISING_FALLING)
+        self._pin_clk.irq(self._isr, IRQ_RISING_FALLING, hard=self._hard)
 
     def _enable_dt_irq(self):
-        self._pin_dt.irq(self._process_rotary_pins, IRQ_RISING_FALLING)
+        self._pin_dt.irq(self._isr, IRQ_RISING_FALLING, hard=self._hard)
 
     def _disable_clk_irq(self):
         self._pin_clk.irq(None, 0)
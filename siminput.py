@@ -0,0 +1,237 @@
+""" siminput - Scripted rotary and button for running the choosers and games without hands.
+
+Version 02
+James M. Reneau Ph.D.
+http://www.picohhg.com
+
+This work is licensed under the Creative Commons Attribution-ShareAlike 2.0 Generic License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/2.0/ or send
+a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+
+A Script is a list of events, "rotate +3, press, wait 500, rotate -1, press".  SimRotary
+(a Rotary with the _hal_* methods filled in) and SimButton share a Script and play it back
+as they are polled:
+
+    rotate n    turn n detents, rotary.value() moves by n (before reverse), fed
+                through the quadrature decoder like a real encoder
+    press       the next button.pressed() returns True
+    move n      add n to rotary.value() directly (what a Recorder logged)
+    wait ms     hold the next event until ms have passed on time.ticks_ms()
+
+A poll plays every rotate and move that is due, whichever of rotary.value() or
+button.pressed() polls first.  A press is played only by the button and not before
+rotary.value() has had a chance to show the turns.  Once the script is played out a button poll
+raises ScriptEnd.  On the emulator with its virtual clock each interaction takes microseconds.
+A SimBus stands in for the InputBus so a chooser waits for the next scripted event instead of
+the encoder.
+
+    script = Script("rotate +2, press")
+    rotary = SimRotary(script)
+    button = SimButton(script)
+    ChooserBaseClass.inputBus = SimBus(script)
+    ChooseList(oled, rotary, button, ["a", "b", "c"]).get()
+
+V
+00		2026-10-18	jmr		original coding
+01		2026-10-18	jmr		added move for replaying recorded sessions
+02		2026-10-18	jmr		a poll plays every event that is due, SimBus wakes the choosers for them
+"""
+
+import time
+from micropython import const
+from rotary import Rotary
+
+class ScriptEnd(Exception):
+    """ raised when the button is polled after the last event """
+    pass
+
+class Script():
+    
+    ## event codes
+    ROTATE = const(1)
+    PRESS = const(2)
+    WAIT = const(3)
+    MOVE = const(4)
+    
+    NAMES = {"rotate": ROTATE, "press": PRESS, "wait": WAIT, "move": MOVE}
+    
+    def __init__(self, text=""):
+        self.events = [] ## (code, arg)
+        self.pos = 0 ## next event
+        self.waitStart = None ## ticks_ms the current wait started
+        self.rotary = None ## SimRotary playing the rotate events
+        self.polls = 0
+        self.parse(text)
+        
+    def parse(self, text):
+        """ append the events in text, separated by commas or new lines """
+        for item in text.replace("\n", ",").split(","):
+            words = item.split()
+            if not words:
+                continue
+            code = Script.NAMES.get(words[0].lower())
+            if code is None:
+                raise ValueError("unknown event " + item.strip())
+            arg = int(words[1]) if len(words) > 1 else 0
+            self.add(code, arg)
+            
+    def add(self, code, arg=0):
+        self.events.append((code, arg))
+        
+    def done(self):
+        return self.pos >= len(self.events)
+    
+    def due(self):
+        """ ms until the next event can be played, 0 when it can be now or the script is done """
+        if self.pos >= len(self.events):
+            return 0
+        code, arg = self.events[self.pos]
+        if code != Script.WAIT:
+            return 0
+        now = time.ticks_ms()
+        if self.waitStart is None:
+            self.waitStart = now
+        return max(0, arg - time.ticks_diff(now, self.waitStart))
+        
+    def poll(self, button):
+        """ play the events that are due, True when a press was taken by the button """
+        self.polls += 1
+        while self.pos < len(self.events):
+            code, arg = self.events[self.pos]
+            if code == Script.WAIT:
+                now = time.ticks_ms()
+                if self.waitStart is None:
+                    self.waitStart = now
+                if time.ticks_diff(now, self.waitStart) < arg:
+                    return False
+                ## a finished wait does not use up the poll
+                self.waitStart = None
+                self.pos += 1
+            elif code == Script.ROTATE:
+                self.pos += 1
+                self.rotary.turn(arg)
+            elif code == Script.MOVE:
+                self.pos += 1
+                self.rotary.move(arg)
+            else:
+                if not button:
+                    return False
+                if self.rotary and self.rotary.unseen:
+                    ## give the caller one more pass to read the turn before the press
+                    self.rotary.unseen = False
+                    return False
+                self.pos += 1
+                return True
+        if button:
+            raise ScriptEnd()
+        return False
+
+## CLK/DT levels for one detent, each ends back at rest (11)
+_CW = ((1, 0), (0, 0), (0, 1), (1, 1))
+_CCW = ((0, 1), (0, 0), (1, 0), (1, 1))
+
+class SimRotary(Rotary):
+    
+    def __init__(self, script, min_val=0, max_val=10, incr=1, reverse=False,
+                 range_mode=Rotary.RANGE_UNBOUNDED, accel=1, accel_ms=80,
+                 fast_isr=False, detent_ms=0):
+        """ a Rotary played from script
+        Parameters:
+        :detent_ms: time.sleep_ms() between detents of a rotate so acceleration sees a real speed
+        """
+        super().__init__(min_val, max_val, incr, reverse, range_mode, False, False,
+                         accel, accel_ms, fast_isr)
+        self.script = script
+        script.rotary = self
+        self.detent_ms = detent_ms
+        self._clk = 1
+        self._dt = 1
+        self._enabled = True
+        self.unseen = False ## turned since value() was last read
+        
+    def value(self):
+        ## the event is played after the read, the caller sees it next time
+        v = self._value
+        self.unseen = False
+        self.script.poll(False)
+        return v
+    
+    def turn(self, n):
+        """ feed n detents through the decoder """
+        steps = _CW if n > 0 else _CCW
+        self.unseen = True
+        for i in range(abs(n)):
+            if i and self.detent_ms:
+                time.sleep_ms(self.detent_ms)
+            for self._clk, self._dt in steps:
+                if self._enabled:
+                    self._isr(None)
+
+    def move(self, n):
+        """ change the value by n without the decoder, range and acceleration """
+        self.unseen = True
+        self._value += n
+        for listener in self._listener:
+            listener()
+
+    def _hal_get_clk_value(self):
+        return self._clk
+
+    def _hal_get_dt_value(self):
+        return self._dt
+
+    def _hal_enable_irq(self):
+        self._enabled = True
+
+    def _hal_disable_irq(self):
+        self._enabled = False
+
+    def _hal_close(self):
+        self._enabled = False
+
+class SimButton():
+    """ a Button played from a script, same methods as the polling Button """
+    
+    def __init__(self, script):
+        self.script = script
+        self.irqMode = False
+        self.presses = 0
+        
+    def pressed(self):
+        if self.script.poll(True):
+            self.presses += 1
+            return True
+        return False
+    
+    def wait(self):
+        ## wait til press
+        while True:
+            if self.pressed():
+                break
+            time.sleep(.1)
+            
+    def waitRelease(self):
+        ## a scripted press is already released
+        pass
+
+class SimBus():
+    """ the InputBus methods the choosers use, wait() returns when the next scripted event is
+    due instead of waiting for the encoder """
+    
+    def __init__(self, script):
+        self.script = script
+        
+    def wait(self, timeout=None):
+        ms = self.script.due()
+        if timeout is not None and ms > timeout:
+            time.sleep_ms(timeout)
+            return None
+        if ms:
+            time.sleep_ms(ms)
+        return (0, 0)
+    
+    def event(self):
+        return None
+    
+    def clear(self):
+        pass
@@ -22,6 +22,20 @@ SET_DISP_CLK_DIV = const(0xD5)
 SET_PRECHARGE = const(0xD9)
 SET_VCOM_DESEL = const(0xDB)
 SET_CHARGE_PUMP = const(0x8D)
+SET_HWSCROLL_OFF = const(0x2E)
+SET_HWSCROLL_ON = const(0x2F)
+SET_HWSCROLL_RIGHT = const(0x26)
+SET_HWSCROLL_LEFT = const(0x27)
+SET_HWSCROLL_VR = const(0x29)
+SET_HWSCROLL_VL = const(0x2A)
+SET_VSCROLL_AREA = const(0xA3)
+
+# approximate bus bytes spent setting up one column/page window, used to
+# decide when a partial update is no longer cheaper than a full frame
+_WINDOW_COST = const(16)
+
+# commands SSD1306_I2C can queue before it has to flush
+_CMD_QUEUE = const(32)
 
 # Subclassing FrameBuffer provides support for graphics primitives
 # http://docs.micropython.org/en/latest/pyboard/library/framebuf.html
@@ -32,11 +46,25 @@ class SSD1306(framebuf.FrameBuffer):
         self.external_vcc = external_vcc
         self.pages = self.height // 8
         self.buffer = bytearray(self.pages * self.width)
+        # per page span of changed columns, x0 > x1 means the page is clean
+        self._dirty_x0 = bytearray(b"\xff" * self.pages)
+        self._dirty_x1 = bytearray(self.pages)
+        # transmit counters
+        self.frame_bytes = 0  # data bytes sent by the last show()
+        self.total_bytes = 0
+        self.frame_count = 0
+        # fill() calls, retained widgets repaint everything after one
+        self.fills = 0
+        # display RAM row shown on the top line of the panel
+        self.start = 0
+        # timing probes, see add_probe()
+        self.probes = []
+        self.drawing = False
         super().__init__(self.buffer, self.width, self.height, framebuf.MONO_VLSB)
         self.init_display()
 
     def init_display(self):
-        for cmd in (
+        self.write_cmds((
             SET_DISP | 0x00,  # off
             # address setting
             SET_MEM_ADDR,
@@ -66,9 +94,8 @@ class SSD1306(framebuf.FrameBuffer):
             # charge pump
             SET_CHARGE_PUMP,
             0x10 if self.external_vcc else 0x14,
-            SET_DISP | 0x01,
-        ):  # on
-            self.write_cmd(cmd)
+            SET_DISP | 0x01,  # on
+        ))
         self.fill(0)
         self.show()
 
@@ -79,26 +106,216 @@ class SSD1306(framebuf.FrameBuffer):
         self.write_cmd(SET_DISP | 0x01)
 
     def contrast(self, contrast):
-        self.write_cmd(SET_CONTRAST)
-        self.write_cmd(contrast)
+        self.write_cmds((SET_CONTRAST, contrast))
 
     def invert(self, invert):
-        self.write_cmd(SET_NORM_INV | (invert & 1))
-
-    def show(self):
-        x0 = 0
-        x1 = self.width - 1
-        if self.width == 64:
-            # displays with width of 64 pixels are shifted by 32
-            x0 += 32
-            x1 += 32
-        self.write_cmd(SET_COL_ADDR)
-        self.write_cmd(x0)
-        self.write_cmd(x1)
-        self.write_cmd(SET_PAGE_ADDR)
-        self.write_cmd(0)
-        self.write_cmd(self.pages - 1)
-        self.write_data(self.buffer)
+        self.write_cmds((SET_NORM_INV | (invert & 1),))
+
+    # hardware scrolling - the panel can show display RAM starting at any
+    # row, so framebuffer row r appears on panel row (r - start) % height
+
+    def start_line(self, line):
+        self.start = line % self.height
+        self.write_cmds((SET_DISP_START_LINE | self.start,))
+
+    def scroll_lines(self, n):
+        # shift the panel up n rows (down if n < 0) without sending pixels
+        self.start_line(self.start + n)
+
+    def hscroll(self, left=False, start_page=0, end_page=None, interval=0, vertical=0):
+        # continuous scroll done by the controller, interval 0-7 selects the
+        # frames per step (0 = 5 frames), vertical adds a row offset per step
+        if end_page is None:
+            end_page = self.pages - 1
+        if vertical:
+            self.write_cmds((
+                SET_HWSCROLL_OFF,
+                SET_VSCROLL_AREA, 0x00, self.height,
+                SET_HWSCROLL_VL if left else SET_HWSCROLL_VR,
+                0x00, start_page, interval, end_page, vertical & 0x3F,
+                SET_HWSCROLL_ON,
+            ))
+        else:
+            self.write_cmds((
+                SET_HWSCROLL_OFF,
+                SET_HWSCROLL_LEFT if left else SET_HWSCROLL_RIGHT,
+                0x00, start_page, interval, end_page, 0x00, 0xFF,
+                SET_HWSCROLL_ON,
+            ))
+
+    def hscroll_stop(self):
+        # the controller leaves display RAM scrambled, push a full frame
+        self.write_cmds((SET_HWSCROLL_OFF,))
+        self.show(full=True)
+
+    def write_cmds(self, cmds):
+        # transports that can batch commands override this
+        for cmd in cmds:
+            self.write_cmd(cmd)
+
+    def add_probe(self, probe):
+        # probe.draw() is called by the first drawing call after a show(),
+        # probe.show_start() and probe.show_end() around each show()
+        self.probes.append(probe)
+
+    def remove_probe(self, probe):
+        self.probes.remove(probe)
+        self.drawing = False
+
+    def _draw_start(self):
+        self.drawing = True
+        for p in self.probes:
+            p.draw()
+
+    def show(self, full=False):
+        if self.probes:
+            for p in self.probes:
+                p.show_start()
+            self.drawing = True  # show(full=True) damages, that is not drawing
+            self._show(full)
+            for p in self.probes:
+                p.show_end()
+            self.drawing = False
+        else:
+            self._show(full)
+
+    def _show(self, full):
+        # only the pages touched since the last push are sent, each as a
+        # column window spanning the changed columns of that page
+        if full:
+            self.damage_all()
+        width = self.width
+        # displays with width of 64 pixels are shifted by 32
+        shift = 32 if width == 64 else 0
+        x0s = self._dirty_x0
+        x1s = self._dirty_x1
+        windows = 0
+        sent = 0
+        for page in range(self.pages):
+            if x0s[page] <= x1s[page]:
+                windows += 1
+                sent += x1s[page] - x0s[page] + 1
+        if windows == 0:
+            self.frame_bytes = 0
+            return
+        if sent + windows * _WINDOW_COST >= len(self.buffer):
+            # cheaper to send the whole frame in one window
+            self.write_window(shift, shift + width - 1, 0, self.pages - 1, self.buffer)
+            sent = len(self.buffer)
+        else:
+            mv = memoryview(self.buffer)
+            for page in range(self.pages):
+                x0 = x0s[page]
+                x1 = x1s[page]
+                if x0 <= x1:
+                    i = page * width
+                    self.write_window(shift + x0, shift + x1, page, page, mv[i + x0:i + x1 + 1])
+        for page in range(self.pages):
+            x0s[page] = 0xFF
+            x1s[page] = 0
+        self.frame_bytes = sent
+        self.total_bytes += sent
+        self.frame_count += 1
+
+    def write_window(self, x0, x1, p0, p1, buf):
+        # x0, x1 are display RAM columns, p0, p1 pages
+        self.write_cmds((SET_COL_ADDR, x0, x1, SET_PAGE_ADDR, p0, p1))
+        self.write_data(buf)
+
+    # dirty tracking - every drawing primitive reports the rectangle it
+    # touched so show() knows which pages and columns changed
+
+    def damage(self, x, y, w, h):
+        if self.probes and not self.drawing:
+            self._draw_start()
+        if w <= 0 or h <= 0:
+            return
+        if x < 0:
+            w += x
+            x = 0
+        if y < 0:
+            h += y
+            y = 0
+        if x + w > self.width:
+            w = self.width - x
+        if y + h > self.height:
+            h = self.height - y
+        if w <= 0 or h <= 0:
+            return
+        x1 = x + w - 1
+        x0s = self._dirty_x0
+        x1s = self._dirty_x1
+        for page in range(y >> 3, ((y + h - 1) >> 3) + 1):
+            if x < x0s[page]:
+                x0s[page] = x
+            if x1 > x1s[page]:
+                x1s[page] = x1
+
+    def damage_all(self):
+        if self.probes and not self.drawing:
+            self._draw_start()
+        for page in range(self.pages):
+            self._dirty_x0[page] = 0
+            self._dirty_x1[page] = self.width - 1
+
+    def fill(self, c):
+        self.damage_all()
+        self.fills += 1
+        super().fill(c)
+
+    def pixel(self, x, y, c=None):
+        if c is None:
+            return super().pixel(x, y)
+        self.damage(x, y, 1, 1)
+        super().pixel(x, y, c)
+
+    def hline(self, x, y, w, c):
+        self.damage(x, y, w, 1)
+        super().hline(x, y, w, c)
+
+    def vline(self, x, y, h, c):
+        self.damage(x, y, 1, h)
+        super().vline(x, y, h, c)
+
+    def line(self, x1, y1, x2, y2, c):
+        self.damage(min(x1, x2), min(y1, y2), abs(x2 - x1) + 1, abs(y2 - y1) + 1)
+        super().line(x1, y1, x2, y2, c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        self.damage(x, y, w, h)
+        if f:
+            super().fill_rect(x, y, w, h, c)
+        else:
+            super().rect(x, y, w, h, c)
+
+    def fill_rect(self, x, y, w, h, c):
+        self.damage(x, y, w, h)
+        super().fill_rect(x, y, w, h, c)
+
+    def ellipse(self, x, y, xr, yr, c, f=False, m=0x0F):
+        self.damage(x - xr, y - yr, 2 * xr + 1, 2 * yr + 1)
+        super().ellipse(x, y, xr, yr, c, f, m)
+
+    def poly(self, x, y, coords, c, f=False):
+        self.damage_all()
+        super().poly(x, y, coords, c, f)
+
+    def text(self, s, x, y, c=1):
+        self.damage(x, y, len(s) * 8, 8)
+        super().text(s, x, y, c)
+
+    def scroll(self, xstep, ystep):
+        self.damage_all()
+        super().scroll(xstep, ystep)
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        # plain FrameBuffers do not expose their size, so fall back to
+        # damaging everything from x, y on
+        self.damage(x, y, getattr(fbuf, "width", self.width), getattr(fbuf, "height", self.height))
+        if palette is None:
+            super().blit(fbuf, x, y, key)
+        else:
+            super().blit(fbuf, x, y, key, palette)
 
 
 class SSD1306_I2C(SSD1306):
@@ -107,20 +324,71 @@ class SSD1306_I2C(SSD1306):
         self.addr = addr
         self.temp = bytearray(2)
         self.write_list = [b"\x40", None]  # Co=0, D/C#=1
+        # queued commands, each one is a Co=1 control byte followed by the
+        # command so a whole sequence (and optionally the data that follows
+        # it) goes out in a single transaction
+        self.cmd_queue = bytearray(2 * _CMD_QUEUE)
+        self.cmd_len = 0
+        self.cmd_list = [None]
+        self.batch_list = [None, b"\x40", None]
+        self.transactions = 0  # I2C transactions started
         super().__init__(width, height, external_vcc)
 
     def write_cmd(self, cmd):
         self.temp[0] = 0x80  # Co=1, D/C#=0
         self.temp[1] = cmd
         self.i2c.writeto(self.addr, self.temp)
+        self.transactions += 1
 
     def write_data(self, buf):
         self.write_list[1] = buf
         self.i2c.writevto(self.addr, self.write_list)
+        self.transactions += 1
+
+    def queue_cmd(self, cmd):
+        if self.cmd_len == len(self.cmd_queue):
+            self.flush_cmds()
+        self.cmd_queue[self.cmd_len] = 0x80  # Co=1, D/C#=0
+        self.cmd_queue[self.cmd_len + 1] = cmd
+        self.cmd_len += 2
+
+    def flush_cmds(self, buf=None):
+        # send the queued commands, followed by buf as display data if given
+        n = self.cmd_len
+        if n == 0:
+            if buf is not None:
+                self.write_data(buf)
+            return
+        self.cmd_len = 0
+        cmds = memoryview(self.cmd_queue)[:n]
+        if buf is None:
+            self.cmd_list[0] = cmds
+            self.i2c.writevto(self.addr, self.cmd_list)
+        else:
+            self.batch_list[0] = cmds
+            self.batch_list[2] = buf
+            self.i2c.writevto(self.addr, self.batch_list)
+        self.transactions += 1
+
+    def write_cmds(self, cmds):
+        for cmd in cmds:
+            self.queue_cmd(cmd)
+        self.flush_cmds()
+
+    def write_window(self, x0, x1, p0, p1, buf):
+        self.queue_cmd(SET_COL_ADDR)
+        self.queue_cmd(x0)
+        self.queue_cmd(x1)
+        self.queue_cmd(SET_PAGE_ADDR)
+        self.queue_cmd(p0)
+        self.queue_cmd(p1)
+        self.flush_cmds(buf)
 
 
 class SSD1306_SPI(SSD1306):
-    def __init__(self, width, height, spi, dc, res, cs, external_vcc=False):
+    def __init__(self, width, height, spi, dc, res, cs, external_vcc=False, persistent=False):
+        # persistent=True configures the bus once and keeps it, use it when
+        # the display is the only device on the SPI bus
         self.rate = 10 * 1024 * 1024
         dc.init(dc.OUT, value=0)
         res.init(res.OUT, value=0)
@@ -129,6 +397,15 @@ class SSD1306_SPI(SSD1306):
         self.dc = dc
         self.res = res
         self.cs = cs
+        self.persistent = persistent
+        # preallocated command buffers so no frame allocates
+        self.cmd_buf = bytearray(1)
+        self.cmd_queue = bytearray(_CMD_QUEUE)
+        # a view of the queue for every fill level, slicing in a frame would allocate
+        q = memoryview(self.cmd_queue)
+        self.cmd_views = [q[:n] for n in range(_CMD_QUEUE + 1)]
+        if persistent:
+            self.spi.init(baudrate=self.rate, polarity=0, phase=0)
         import time
 
         self.res(1)
@@ -138,18 +415,60 @@ class SSD1306_SPI(SSD1306):
         self.res(1)
         super().__init__(width, height, external_vcc)
 
-    def write_cmd(self, cmd):
-        self.spi.init(baudrate=self.rate, polarity=0, phase=0)
+    def begin(self):
+        if not self.persistent:
+            self.spi.init(baudrate=self.rate, polarity=0, phase=0)
         self.cs(1)
+
+    def write_cmd(self, cmd):
+        self.begin()
         self.dc(0)
         self.cs(0)
-        self.spi.write(bytearray([cmd]))
+        self.cmd_buf[0] = cmd
+        self.spi.write(self.cmd_buf)
         self.cs(1)
 
     def write_data(self, buf):
-        self.spi.init(baudrate=self.rate, polarity=0, phase=0)
-        self.cs(1)
+        self.begin()
         self.dc(1)
         self.cs(0)
         self.spi.write(buf)
-        self.cs(1)
\ No newline at end of file
+        self.cs(1)
+
+    def write_cmds(self, cmds):
+        # the whole sequence under one CS assertion
+        self.begin()
+        self.dc(0)
+        self.cs(0)
+        self._stream_cmds(cmds)
+        self.cs(1)
+
+    def write_window(self, x0, x1, p0, p1, buf):
+        # window setup and pixel data back to back, D/C# is sampled per
+        # byte so it can switch while CS stays asserted
+        q = self.cmd_queue
+        q[0] = SET_COL_ADDR
+        q[1] = x0
+        q[2] = x1
+        q[3] = SET_PAGE_ADDR
+        q[4] = p0
+        q[5] = p1
+        self.begin()
+        self.dc(0)
+        self.cs(0)
+        self.spi.write(self.cmd_views[6])
+        self.dc(1)
+        self.spi.write(buf)
+        self.cs(1)
+
+    def _stream_cmds(self, cmds):
+        q = self.cmd_queue
+        n = 0
+        for cmd in cmds:
+            if n == len(q):
+                self.spi.write(q)
+                n = 0
+            q[n] = cmd
+            n += 1
+        if n:
+            self.spi.write(self.cmd_views[n])
@@ -1,6 +1,6 @@
 """ SST - Super Star Trekking
 
-Version 02
+Version 11
 James M. Reneau Ph.D.
 http://www.picohhg.com
 
@@ -12,39 +12,35 @@ V
 00		2023-04-30	jmr		original coding
 01		2023-05-08	jmr		changed button and removed Empty object
 02		2023-05-09	jmr		added quit
+03		2026-10-18	jmr		status labels and scan numbers drawn from the text cache
+04		2026-10-18	jmr		phaser and heading dials use rotary acceleration
+05		2026-10-18	jmr		headings and moves use the trig tables
+06		2026-10-18	jmr		help and about wrapped lazily as they scroll
+07		2026-10-18	jmr		fixed texts moved to the sst.txt string table
+08		2026-10-18	jmr		run(ctx) with the menu's display and input, no globals
+09		2026-10-18	jmr		the string table is closed even when the game fails
+10		2026-10-18	jmr		about shows Static.VERSION instead of a copy in sst.txt
+11		2026-10-18	jmr		console headings and distances made whole, moves set x and y together
 """
 import sys
-if sys.implementation.name == 'micropython':
-    from machine import Pin
-    from machine import I2C
-    from rotaryIRQ import RotaryIRQ
-    from ssd1306 import SSD1306_I2C
-    from button import Button
-    
-    # Hardware GPIO Pins used for Raspberry PI Pico
-    I2CSDA = 16
-    I2CSCL = 17
-    ROTARY_CLOCK = 7
-    ROTARY_DATA = 6
-    BUTTON = 26
-    
-    i2c = I2C(0, sda=Pin(I2CSDA), scl=Pin(I2CSCL), freq=400000)
-    oled = SSD1306_I2C(128, 64, i2c)
-    rotary = RotaryIRQ(ROTARY_CLOCK, ROTARY_DATA)
-    button = Button(BUTTON)
-else:
-    oled = False
-    rotary = False
-    button = False
-
 import time
 import math
 import random
+import trig
 from choosers import ChooseList
 from choosers import ChooseRoundNumber
 from choosers import ChooseFaceNumber
 from choosers import TextScroll
 from choosers import MessageBox
+from choosers import ChooserBaseClass
+from strtable import StringTable
+from context import Context
+
+textCache = ChooserBaseClass.textCache
+
+## long and fixed texts are read from sst.str as they are shown
+strings = StringTable("sst")
+ChooserBaseClass.strings = strings
 
 class Static():
     
@@ -95,45 +91,23 @@ class Static():
     MNE_ENERGY = 12345		## maximum energy available to mine
     MNE_TIME = 3			## maximum time to mine a planet
     
-    ABOUT = [
-        "Welcome to SST for the Raspberry PI PICO.",
-        VERSION,
-        "c) J.M.Reneau",
-        "Your mission is to explore brave new worlds and to eradicate the Klingon menace from the known universe.",
-        "The Universe is made of a grid of 8x8 sectors divided up into 8x8 coordinates.",
-        "Use the spinner to select a command or value and then press the spinner to execute.",
-        "About:",
-        "I remember playing SST on the Pr1me computer at Morehead State University in the '80s. It was probably the FORTRAN SST from Austin but the code has been lost for decades.",
-        "This game is close to what I can remember from playing it all those years ago with many subtle and not so subtle differences.",
-        "Have fun.",
-        "c) J.M.Reneau - All Rights Reserved. jim@renejm.com"
-        ]
+    ABOUT = strings.id("ABOUT")
 
     COMMANDS = ["LRS", "SRS", "MAP", "FSC", "IMP", "WRP", "PHA", "PHO", "DOK", "MNE", "HAI", "WAI", "SD!", "HELP"]
 
-    HELP = [
-        "HELP - Captian's Manual",
-        "Command Reference",
-        "LRS - Long Range Scanners show the current and surrounding sectors as a three digit number. The first"
-            " is the number of Klingons, second Bases, and third stars.",
-        "SRS - Short Range Scanners show the current sector and position of bases (squares), stars with planets"
-            " (solar system), stars, Klingons, and the Enterprise.",
-        "MAP - Show map of klingons, bases, and stars based on composite LRS and SRS scans.",
-        "FSC - Fire Solutions Calculator shows the heading and distance to all objects in the sector.",
-        "IMP - IMPulse drive to move within a 10 coordinate area.  You will be asked for heading and distance"
-            " (in coordinates). You can not navigare into an occupied coordinate or off of the edge of the universe.",
-        "WRP - WaRP drive to move from sector to sector. You will be asked for heading and distance (in in sectors)."
-            " If you navigate into an obstical or the edge of the universe, you will be placed near it.",
-        "PHA - PHAser - Fire energy beam at Klingons in sector. You may only fire 1000 units or 1/4 of the reserves,"
-            " whichever is less.",
-        "PHO - PHOton - Fire a photon torpedo in a speciied direction. Be careful not to hit unintended objects.",
-        "DOK - DOcKing - You may dock with an adjacent star base to top off yor energy reserves and torpedo racks.",
-        "MNE - MiNE a Planet - You may send an away party down to the planet to mine dilithium to add to the ship's"
-            " energy reserves.",
-        "HAI - HAIl - Communicate with... (Not implemented)",
-        "HELP - Read this helpful summary.",
-        "SD! - SELF DESTRUCT! When all is lost you may end the game the cowards way."
-        ]
+    HELP = strings.id("HELP")
+    ACCEPT = strings.id("ACCEPT")
+    SELFDESTRUCT = strings.id("SELFDESTRUCT")
+    IMP_FULL = strings.id("IMP_FULL")
+    IMP_OUT = strings.id("IMP_OUT")
+    WRP_OUT = strings.id("WRP_OUT")
+    DOK_NONE = strings.id("DOK_NONE")
+    MNE_NOPLANET = strings.id("MNE_NOPLANET")
+    MNE_NONE = strings.id("MNE_NONE")
+    HAI = strings.id("HAI")
+    DEAD = strings.id("DEAD")
+    WON = strings.id("WON")
+    OVER = strings.id("OVER")
     
     @staticmethod
     def goodxy(x, y):
@@ -161,18 +135,7 @@ class Static():
         dy = y1-y0	# +down, -up
         d = ((dx)**2 + (dy)**2)**.5
         if d > 0:
-            if dy <= 0 and dx >= 0:
-                # quad 0 0-3
-                h = math.asin(dx/d)*180/math.pi
-            elif dy > 0 and dx >=0:
-                # quad 1 3-6
-                h = 180 - math.asin(dx/d)*180/math.pi
-            elif dy > 0 and dx < 0:
-                # quad 3 6-9
-                h = 180 + math.asin(abs(dx)/d)*180/math.pi
-            else:
-                # quad 4 9-12
-                h = 360 - math.asin(abs(dx)/d)*180/math.pi
+            h = trig.heading(dx, dy)
         else:
             h = math.inf
         return(d, h)
@@ -234,6 +197,12 @@ class Stuff():
         self._y = value
         self._addLocationIndex()
 
+    def moveTo(self, x, y):
+        ## change x and y together, setting one at a time can pass over another object's spot
+        self._delLocationIndex()
+        self._x = x
+        self._y = y
+        self._addLocationIndex()
         
     def name(self):
         return Static.NAMES[self.type]
@@ -260,16 +229,15 @@ class Klingon(Stuff):
         
     def randomMove(self, days):
         ## klingons move a little when we do longer things
-        a = random.random() * 2 * math.pi
+        a = random.randrange(360)
         d = Static.halfRandomInt(round(Static.KLINGON_MOVE * days))
         if d >0:
-            x = int(self.x + math.sin(a) * d)
-            y = int(self.y + math.cos(a) * d)
+            x = self.x + trig.mul(d, trig.sin(a))
+            y = self.y + trig.mul(d, trig.cos(a))
             if x >=0 and x <= Static.MAXX and y >=0 and y <= Static.MAXY:
                 if not self.universe.getObjAt(x,y):
                     print("K moved from", self.x, self.y, "to", x, y)
-                    self.x = x
-                    self.y = y
+                    self.moveTo(x, y)
     
 class Star(Stuff):
     """ create a star with random minable planets """
@@ -386,7 +354,10 @@ class Universe():
         
 class Game():
 
-    def __init__(self):            
+    def __init__(self, ctx):
+        self.oled = ctx.oled
+        self.rotary = ctx.rotary
+        self.button = ctx.button
         self.game_on = True
         
     def tick(self, days):
@@ -411,7 +382,7 @@ class Game():
     def display_status(self):
         #### STANDARD DISPLAY
         if sys.implementation.name == 'micropython':
-            oled.fill(0)
+            self.oled.fill(0)
         #
         if self.universe.enterprise.e < Static.ENERGY_YELLOW:
             status = "YELLOW"
@@ -420,39 +391,43 @@ class Game():
         else:
             status="Green"
         if sys.implementation.name == 'micropython':
-            oled.text(status,0,10)
+            textCache.text(self.oled,status,0,10)
         else:
             print("Status:", status)
         #    
         sd = round(self.stardate,1)
         if sys.implementation.name == 'micropython':
-            oled.text(str(sd),0,20)
+            self.oled.text(str(sd),0,20)
         else:
             print("Star Date:", sd)
         #
         loc = Static.xyToString(self.universe.enterprise.x, self.universe.enterprise.y)
         if sys.implementation.name == 'micropython':
-            oled.text(loc,0,30)
+            self.oled.text(loc,0,30)
         else:
             print("Location:", loc)
         #
         if sys.implementation.name == 'micropython':
-            oled.text("e " + str(round(self.universe.enterprise.e)),0,40)
+            textCache.text(self.oled,"e ",0,40)
+            self.oled.text(str(round(self.universe.enterprise.e)),16,40)
         else:
             print("Energy:", str(self.universe.enterprise.e))
         #
         if sys.implementation.name == 'micropython':
-            oled.text("pho " + str(self.universe.enterprise.pho),0,50)
+            textCache.text(self.oled,"pho ",0,50)
+            self.oled.text(str(self.universe.enterprise.pho),32,50)
         else:
             print("Torpedos:", str(self.universe.enterprise.pho))
         #
         if sys.implementation.name == 'micropython':
-            oled.text("KGS " + str(self.universe_counts[Static.KLINGON]),64,10)
+            textCache.text(self.oled,"KGS ",64,10)
+            self.oled.text(str(self.universe_counts[Static.KLINGON]),96,10)
         else:
             print("Klingons:", str(self.universe_counts[Static.KLINGON]))
         #
         if sys.implementation.name == 'micropython':
-            oled.text("Bases " + str(self.universe_counts[Static.BASE]),64,20)
+            textCache.text(self.oled,"Bases ",64,20)
+            self.oled.text(str(self.universe_counts[Static.BASE]),112,20)
         else:
             print("Bases:", str(self.universe_counts[Static.BASE]))
             
@@ -462,11 +437,11 @@ class Game():
             ty = 0
             dx = 8
             dy = 7
-            oled.fill(0)
+            self.oled.fill(0)
             ## show numbers
             for n in range(8):
-                oled.text(str(n), tx + n*dx + dx, ty)
-                oled.text(str(n), tx, ty + n*dy + dy)
+                textCache.text(self.oled, str(n), tx + n*dx + dx, ty)
+                textCache.text(self.oled, str(n), tx, ty + n*dy + dy)
             ##
             for x in range(Static.SECX):
                 for y in range(Static.SECY):
@@ -477,45 +452,45 @@ class Game():
                     r = ty + y*dy + dy
                     if not u:
                         ## empty
-                        oled.pixel(c+3, r+3, 1)
+                        self.oled.pixel(c+3, r+3, 1)
                     elif u.type == Static.ENTERPRISE:
                         ## THIS SHIP
-                        oled.pixel(c, r+3, 1)
-                        oled.vline(c+1, r+2, 3, 1) 
-                        oled.vline(c+2, r+1, 5, 1) 
-                        oled.vline(c+3, r+2, 3, 1) 
-                        oled.pixel(c+4, r+3, 1)
-                        oled.hline(c+4, r, 3, 1)
-                        oled.hline(c+4, r+1, 3, 1)
-                        oled.hline(c+4, r+5, 3, 1)
-                        oled.hline(c+4, r+6, 3, 1)
+                        self.oled.pixel(c, r+3, 1)
+                        self.oled.vline(c+1, r+2, 3, 1) 
+                        self.oled.vline(c+2, r+1, 5, 1) 
+                        self.oled.vline(c+3, r+2, 3, 1) 
+                        self.oled.pixel(c+4, r+3, 1)
+                        self.oled.hline(c+4, r, 3, 1)
+                        self.oled.hline(c+4, r+1, 3, 1)
+                        self.oled.hline(c+4, r+5, 3, 1)
+                        self.oled.hline(c+4, r+6, 3, 1)
                     elif u.type == Static.STAR:
                         if u.hasPlanet:
-                            oled.hline(c+2, r+1, 3, 1)
-                            oled.hline(c+2, r+5, 3, 1)
-                            oled.vline(c+1, r+2, 3, 1)
-                            oled.vline(c+5, r+2, 3, 1)
-                            oled.pixel(c+3, r+3, 1)
+                            self.oled.hline(c+2, r+1, 3, 1)
+                            self.oled.hline(c+2, r+5, 3, 1)
+                            self.oled.vline(c+1, r+2, 3, 1)
+                            self.oled.vline(c+5, r+2, 3, 1)
+                            self.oled.pixel(c+3, r+3, 1)
                         else:
-                            oled.pixel(c+3, r+1)
-                            oled.hline(c+2, r+2, 3, 1)
-                            oled.hline(c+1, r+3, 5, 1)
-                            oled.hline(c+2, r+4, 3, 1)
-                            oled.pixel(c+3, r+5)
+                            self.oled.pixel(c+3, r+1)
+                            self.oled.hline(c+2, r+2, 3, 1)
+                            self.oled.hline(c+1, r+3, 5, 1)
+                            self.oled.hline(c+2, r+4, 3, 1)
+                            self.oled.pixel(c+3, r+5)
                     elif u.type == Static.BASE:
-                        oled.hline(c, r,7,1)
-                        oled.hline(c, r+6,7,1)
-                        oled.vline(c, r+1,6,1)
-                        oled.vline(c+6, r+1,6,1)
+                        self.oled.hline(c, r,7,1)
+                        self.oled.hline(c, r+6,7,1)
+                        self.oled.vline(c, r+1,6,1)
+                        self.oled.vline(c+6, r+1,6,1)
                     elif u.type == Static.KLINGON:
-                        oled.vline(c, r+3, 4, 1)
-                        oled.vline(c+1, r+3, 4, 1)
-                        oled.vline(c+2, r+2, 4, 1)
-                        oled.vline(c+3, r, 5, 1)
-                        oled.vline(c+4, r+2, 4, 1)
-                        oled.vline(c+5, r+3, 4, 1)
-                        oled.vline(c+6, r+3, 4, 1)
-            ChooseList(oled, rotary, button, ["OK"], 0, 0, "").get()
+                        self.oled.vline(c, r+3, 4, 1)
+                        self.oled.vline(c+1, r+3, 4, 1)
+                        self.oled.vline(c+2, r+2, 4, 1)
+                        self.oled.vline(c+3, r, 5, 1)
+                        self.oled.vline(c+4, r+2, 4, 1)
+                        self.oled.vline(c+5, r+3, 4, 1)
+                        self.oled.vline(c+6, r+3, 4, 1)
+            ChooseList(self.oled, self.rotary, self.button, ["OK"], 0, 0, "").get()
         else:
             # terminal
             print("  01234567")
@@ -557,19 +532,19 @@ class Game():
         dy = (-Static.SECY, 0, Static.SECY)
         
         if sys.implementation.name == 'micropython':
-            oled.fill(0)
+            self.oled.fill(0)
             c = (int(2*8), int(6.5*8), int(11*8))
             r = (15, 30, 45)
-            oled.text(_score(self.universe.enterprise.x+dx[0], self.universe.enterprise.y+dy[0]), c[0], r[0])
-            oled.text(_score(self.universe.enterprise.x+dx[0], self.universe.enterprise.y+dy[1]), c[0], r[1])
-            oled.text(_score(self.universe.enterprise.x+dx[0], self.universe.enterprise.y+dy[2]), c[0], r[2])
-            oled.text(_score(self.universe.enterprise.x+dx[1], self.universe.enterprise.y+dy[0]), c[1], r[0])
-            oled.text(_score(self.universe.enterprise.x+dx[1], self.universe.enterprise.y+dy[1]), c[1], r[1])
-            oled.text(_score(self.universe.enterprise.x+dx[1], self.universe.enterprise.y+dy[2]), c[1], r[2])
-            oled.text(_score(self.universe.enterprise.x+dx[2], self.universe.enterprise.y+dy[0]), c[2], r[0])
-            oled.text(_score(self.universe.enterprise.x+dx[2], self.universe.enterprise.y+dy[1]), c[2], r[1])
-            oled.text(_score(self.universe.enterprise.x+dx[2], self.universe.enterprise.y+dy[2]), c[2], r[2])
-            ChooseList(oled, rotary, button, ["OK"], 0, 0, "").get()
+            self.oled.text(_score(self.universe.enterprise.x+dx[0], self.universe.enterprise.y+dy[0]), c[0], r[0])
+            self.oled.text(_score(self.universe.enterprise.x+dx[0], self.universe.enterprise.y+dy[1]), c[0], r[1])
+            self.oled.text(_score(self.universe.enterprise.x+dx[0], self.universe.enterprise.y+dy[2]), c[0], r[2])
+            self.oled.text(_score(self.universe.enterprise.x+dx[1], self.universe.enterprise.y+dy[0]), c[1], r[0])
+            self.oled.text(_score(self.universe.enterprise.x+dx[1], self.universe.enterprise.y+dy[1]), c[1], r[1])
+            self.oled.text(_score(self.universe.enterprise.x+dx[1], self.universe.enterprise.y+dy[2]), c[1], r[2])
+            self.oled.text(_score(self.universe.enterprise.x+dx[2], self.universe.enterprise.y+dy[0]), c[2], r[0])
+            self.oled.text(_score(self.universe.enterprise.x+dx[2], self.universe.enterprise.y+dy[1]), c[2], r[1])
+            self.oled.text(_score(self.universe.enterprise.x+dx[2], self.universe.enterprise.y+dy[2]), c[2], r[2])
+            ChooseList(self.oled, self.rotary, self.button, ["OK"], 0, 0, "").get()
         else:
             print(_score(self.universe.enterprise.x+dx[0], self.universe.enterprise.y+dy[0]),
                 _score(self.universe.enterprise.x+dx[1], self.universe.enterprise.y+dy[0]),
@@ -612,43 +587,39 @@ class Game():
                         " at " + str(ux%8) + "," + str(uy%8) +
                         " is at heading " + str(round(h,0)) +
                         " and distance " + str(round(d,1)) + '.')
-        TextScroll(oled, rotary, button, text).display()
+        TextScroll(self.oled, self.rotary, self.button, text).display()
         
     def imp(self, heading, dist):
         # impluse drive
-        y = round(math.cos((heading-180) / 180 * math.pi) * dist + self.universe.enterprise.y)
-        x = round(math.sin((heading) / 180 * math.pi) * dist + self.universe.enterprise.x)
+        ## the console choosers return floats, the trig tables take whole numbers
+        heading = int(heading)
+        dist = int(round(dist))
+        y = self.universe.enterprise.y - trig.mul(dist, trig.cos(heading))
+        x = self.universe.enterprise.x + trig.mul(dist, trig.sin(heading))
         #print("IMP", heading, self.universe.enterprise.x,self.universe.enterprise.y, "--", x, y)
         if Static.goodxy(x,y):
             if self.universe.getObjAt(x,y):
-                TextScroll(oled, rotary, button, [
-                    "IMP - Order belayed.",
-                    "Destination coordinates are not empty."
-                    ]).display()
+                TextScroll(self.oled, self.rotary, self.button, Static.IMP_FULL).display()
             else:
-                self.universe.enterprise.x, self.universe.enterprise.y = self.universe.findSpaceNear(x, y)
+                self.universe.enterprise.moveTo(*self.universe.findSpaceNear(x, y))
                 self.universe.enterprise.e = self.universe.enterprise.e - Static.halfRandom(Static.IMP_E * dist)
                 self.tick(Static.halfRandom(Static.IMP_TIME * dist))
         else:
-            TextScroll(oled, rotary, button, [
-                "IMP - Order belayed.",
-                "Destination out of known universe."
-                ]).display()
+            TextScroll(self.oled, self.rotary, self.button, Static.IMP_OUT).display()
         
     def wrp(self, heading, dist):
         # warp drive - Bends space so you bounce on the edge and dont land on anythong
-        y = round(math.cos((heading-180) / 180 * math.pi) * dist * Static.SECX + self.universe.enterprise.y)
-        x = round(math.sin(heading / 180 * math.pi) * dist * Static.SECY + self.universe.enterprise.x)
+        ## dist is in sectors, it can have a fraction
+        heading = int(heading)
+        y = self.universe.enterprise.y - trig.mul(round(dist * Static.SECX), trig.cos(heading))
+        x = self.universe.enterprise.x + trig.mul(round(dist * Static.SECY), trig.sin(heading))
         ###print("WRP", heading, self.universe.enterprise.x,self.universe.enterprise.y, "--", x, y)
         if Static.goodxy(x,y):
-            self.universe.enterprise.x, self.universe.enterprise.y = self.universe.findSpaceNear(x, y)
+            self.universe.enterprise.moveTo(*self.universe.findSpaceNear(x, y))
             self.universe.enterprise.e = self.universe.enterprise.e - Static.halfRandom(Static.WRP_E * dist)
             self.tick(Static.halfRandom(Static.WRP_TIME*dist))
         else:
-            TextScroll(oled, rotary, button, [
-                "WRP - Order belayed.",
-                "Destination out of known universe."
-                ]).display()
+            TextScroll(self.oled, self.rotary, self.button, Static.WRP_OUT).display()
         
     def pho(self, heading):
         text = ["PHO"]
@@ -656,16 +627,18 @@ class Game():
             text.append("You don't have any torpedos to fire.")
         else:
             self.universe.enterprise.pho = self.universe.enterprise.pho - 1
-            dx = math.sin(heading / 180 * math.pi)
-            dy = math.cos((heading-180) / 180 * math.pi)
-            x = self.universe.enterprise.x
-            y = self.universe.enterprise.y
+            ## track in fixed point
+            heading = int(heading)
+            dx = trig.sin(heading)
+            dy = -trig.cos(heading)
+            x = self.universe.enterprise.x << trig.SHIFT
+            y = self.universe.enterprise.y << trig.SHIFT
             text.append("Track:")
             for t in range(Static.PHO_DIST):
                 x = x + dx
                 y = y + dy
-                rx = round(x)
-                ry = round(y)
+                rx = trig.toInt(x)
+                ry = trig.toInt(y)
                 text[1] = text[1] + ' (' + str(rx%Static.SECX) + "," + str(ry%Static.SECY) + ')'
                 if rx < 0 or rx >= Static.MAXX or ry < 0 or ry >= Static.MAXY:
                     text.append("Photon Torpedo has left known space.")
@@ -690,7 +663,7 @@ class Game():
                     u.remove()
                     self.game_on = False
                     break
-        TextScroll(oled, rotary, button, text).display()
+        TextScroll(self.oled, self.rotary, self.button, text).display()
 
     def pha(self):
         text = ["PHA"]
@@ -703,9 +676,9 @@ class Game():
                 u = self.universe.getObjAt(ux, uy)
                 if u and u.type == Static.KLINGON:
                     avail = int(min(self.universe.enterprise.e/2, Static.PHA_MAXE))
-                    e =  ChooseFaceNumber(oled, rotary, button,
+                    e =  ChooseFaceNumber(self.oled, self.rotary, self.button,
                         "PHA to ("+str(ux%Static.SECX)+','+str(uy%Static.SECY) + ')'
-                        , 0, avail, int(avail/11)).get()
+                        , 0, avail, max(1, avail//100), accel=8).get()
                     self.universe.enterprise.e = self.universe.enterprise.e - e
                     d, h =  Static.DistHead(ex, ey, ux, uy)
                     e = e * (4/d)
@@ -716,9 +689,17 @@ class Game():
                     else:
                         text.append("Klingon at (" + str(ux%Static.SECX) + ',' + str(uy%Static.SECY) + ') Damaged by ' +
                             str(round(e)) + ' units.')
-        TextScroll(oled, rotary, button, text).display()
+        TextScroll(self.oled, self.rotary, self.button, text).display()
                 
         
+    def about(self):
+        ## the about text with the version as its second line, read as it scrolls
+        text = strings.text(Static.ABOUT)
+        yield text[0]
+        yield Static.VERSION
+        for i in range(1, len(text)):
+            yield text[i]
+        
     def run(self):
         ## init run
         self.stardate = 2500 + random.random() * 50
@@ -734,10 +715,9 @@ class Game():
         
         # main run loop
         while True:
-            startcmd = MessageBox(oled, rotary, button, ["SST", "Do you accept",
-                "command of the","USS Enterprise?"],['ACCEPT', 'ABOUT', 'QUIT']).get()
+            startcmd = MessageBox(self.oled, self.rotary, self.button, Static.ACCEPT, ['ACCEPT', 'ABOUT', 'QUIT']).get()
             if startcmd=="ABOUT":
-                TextScroll(oled, rotary, button, Static.ABOUT).display()
+                TextScroll(self.oled, self.rotary, self.button, self.about()).display()
             if startcmd=="QUIT":
                 break
             elif startcmd=="ACCEPT":
@@ -746,9 +726,9 @@ class Game():
                     self.sector_counts = self.universe.countSector(self.universe.enterprise.x, self.universe.enterprise.y)
                     self.display_status()
                     
-                    cmd = ChooseList(oled, rotary, button, Static.COMMANDS, 0, 0, "").get()
+                    cmd = ChooseList(self.oled, self.rotary, self.button, Static.COMMANDS, 0, 0, "").get()
                     if cmd == "SD!":
-                        if MessageBox(oled, rotary, button, ["SST", "Self Destruct?"]).get() == 'YES':
+                        if MessageBox(self.oled, self.rotary, self.button, Static.SELFDESTRUCT).get() == 'YES':
                             self.game_on = False
                     elif cmd == "LRS":
                         self.lrs()
@@ -756,23 +736,23 @@ class Game():
                         self.srs()
                     elif cmd == "MAP":
                         #show pre-processed map text 
-                        map = TextScroll(oled, rotary, button, [])
+                        map = TextScroll(self.oled, self.rotary, self.button, [])
                         map.text = self.map()
                         map.display()
                     elif cmd == "FSC":
                         self.fsc()
                     elif cmd == "IMP":
-                        heading =  ChooseRoundNumber(oled, rotary, button, "IMP Heading", 0, 360, 5, 8).get()
-                        dist =  ChooseFaceNumber(oled, rotary, button, "Distance (coord)", 0, 10, 1).get()
+                        heading =  ChooseRoundNumber(self.oled, self.rotary, self.button, "IMP Heading", 0, 360, 5, 8, accel=4).get()
+                        dist =  ChooseFaceNumber(self.oled, self.rotary, self.button, "Distance (coord)", 0, 10, 1).get()
                         self.imp(heading, dist)
                     elif cmd == "WRP":
-                        heading =  ChooseRoundNumber(oled, rotary, button, "WRP Heading", 0, 360, 5, 8).get()
-                        dist =  ChooseFaceNumber(oled, rotary, button, "Distance (sect)", 0, 8, .25, 8).get()
+                        heading =  ChooseRoundNumber(self.oled, self.rotary, self.button, "WRP Heading", 0, 360, 5, 8, accel=4).get()
+                        dist =  ChooseFaceNumber(self.oled, self.rotary, self.button, "Distance (sect)", 0, 8, .25, 8).get()
                         self.wrp(heading, dist)
                     elif cmd == "PHA":
                         self.pha()
                     elif cmd == "PHO":
-                        heading =  ChooseRoundNumber(oled, rotary, button, "PHO Heading", 0, 360, 5, 8).get()
+                        heading =  ChooseRoundNumber(self.oled, self.rotary, self.button, "PHO Heading", 0, 360, 5, 8, accel=4).get()
                         self.pho(heading)
                     elif cmd == "DOK":
                         obj = self.universe.isAdjacent(self.universe.enterprise.x, self.universe.enterprise.y, Static.BASE)
@@ -780,14 +760,12 @@ class Game():
                             self.universe.enterprise.e = Static.ENERGY_MAX
                             self.universe.enterprise.pho = Static.PHO_MAX
                             self.tick(Static.halfRandom(Static.DOK_TIME))
-                            TextScroll(oled, rotary, button, [
+                            TextScroll(self.oled, self.rotary, self.button, [
                                 "DOK - The tanks have been filled to capacity with dilithium and the torpedo racks are full.",
                                 "The base at " + Static.xyToString(obj.x, obj.y) + " said 'Good luck captian.'"
                                 ]).display()
                         else:
-                            TextScroll(oled, rotary, button, [
-                                "DOK - You are not adjcent to a star base.",
-                                ]).display()
+                            TextScroll(self.oled, self.rotary, self.button, Static.DOK_NONE).display()
                     elif cmd == "MNE":
                         obj = self.universe.isAdjacent(self.universe.enterprise.x, self.universe.enterprise.y, Static.STAR)
                         if obj:
@@ -801,26 +779,20 @@ class Game():
                                     obj.hasPlanet = False
                                 self.tick(Static.halfRandom(Static.MNE_TIME))
                                 #
-                                TextScroll(oled, rotary, button, [
+                                TextScroll(self.oled, self.rotary, self.button, [
                                     "MNE - You were able to mine the star at " + Static.xyToString(obj.x, obj.y) + " for " + str(e)+" units of dilithium."
                                     ]).display()
                             else:
-                                TextScroll(oled, rotary, button, [
-                                    "MNE - The star you are adjcent to does not have a planet.",
-                                    ]).display()
+                                TextScroll(self.oled, self.rotary, self.button, Static.MNE_NOPLANET).display()
                         else:
-                            TextScroll(oled, rotary, button, [
-                                "MNE - You are not adjcent to a star.",
-                                ]).display()
+                            TextScroll(self.oled, self.rotary, self.button, Static.MNE_NONE).display()
                     elif cmd == "HAI":
-                        TextScroll(oled, rotary, button, [
-                            "HAI - Communications Not Installed.",
-                            ]).display()
+                        TextScroll(self.oled, self.rotary, self.button, Static.HAI).display()
                     elif cmd == "WAI":
-                        days =  ChooseFaceNumber(oled, rotary, button, "Wait - Repair", 0, 5, .25).get()
+                        days =  ChooseFaceNumber(self.oled, self.rotary, self.button, "Wait - Repair", 0, 5, .25).get()
                         self.tick(days)
                     elif cmd== "HELP":
-                        TextScroll(oled, rotary, button, Static.HELP ).display()
+                        TextScroll(self.oled, self.rotary, self.button, Static.HELP).display()
 
                     ## each move causes tick to happen
                     self.tick(1/12)
@@ -832,7 +804,7 @@ class Game():
                             e = k.e * .25
                             k.e = k.e - e
                             self.universe.enterprise.e = self.universe.enterprise.e- e
-                            TextScroll(oled, rotary, button, [
+                            TextScroll(self.oled, self.rotary, self.button, [
                                 "Klingon at (" + str(k.x%Static.SECX) + ',' + str(k.y%Static.SECY) + ') did ' +
                                 str(round(e)) + ' damage to the Enterprise with a disruptor.'
                                 ]).display()
@@ -847,13 +819,13 @@ class Game():
                                     k.e = k.e - e
                                     obj.e = obj.e- e
                                     if obj.e <= 0:
-                                        TextScroll(oled, rotary, button, [
+                                        TextScroll(self.oled, self.rotary, self.button, [
                                             "SUBSPACE COMM:",
                                             "Base at " + Static.xyToString(obj.x, obj.y) + " has been destroyed."
                                             ]).display()
                                         obj.remove()
                                     else:
-                                        TextScroll(oled, rotary, button, [
+                                        TextScroll(self.oled, self.rotary, self.button, [
                                             "SUBSPACE COMM:",
                                             "Base at " + Static.xyToString(obj.x, obj.y) + " is under attcack. Please send assistance."
                                             ]).display()
@@ -861,24 +833,25 @@ class Game():
                 
                     ## check condition after move
                     if self.universe.enterprise.e <= 0:
-                        TextScroll(oled, rotary, button, [
-                            "You have been relieved of duty, because you are dead.",
-                            "The ship has no energy left to run the drives, shield, or life support.",
-                            ]).display()
+                        TextScroll(self.oled, self.rotary, self.button, Static.DEAD).display()
                         self.game_on = False
 
                     self.universe_counts = self.universe.countSpace()
                     ## check for klingon eradication
                     if self.universe_counts[Static.KLINGON] == 0:
-                        TextScroll(oled, rotary, button, [
-                            "Congratulations, You have successfuly exterminated a proud race and made the known"
-                                " universe safe again.",
-                            ]).display()
+                        TextScroll(self.oled, self.rotary, self.button, Static.WON).display()
                         self.game_on = False                       
 
                 
-                TextScroll(oled, rotary, button, [
-                    "Game Over.",
-                    ]).display()
+                TextScroll(self.oled, self.rotary, self.button, Static.OVER).display()
                     
-g = Game().run()
+def run(ctx):
+    ChooserBaseClass.strings = strings
+    try:
+        Game(ctx).run()
+    finally:
+        ChooserBaseClass.strings = None
+        strings.close()
+
+if __name__ == "__main__":
+    run(Context.create())
@@ -0,0 +1,216 @@
+""" strtable - Long texts kept in a string table on flash and read a paragraph at a time.
+
+Version 01
+James M. Reneau Ph.D.
+http://www.picohhg.com
+
+This work is licensed under the Creative Commons Attribution-ShareAlike 2.0 Generic License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/2.0/ or send
+a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+
+The texts of a game are written in a source file (sst.txt) as named sections, one paragraph per
+line.  Lines starting with ## are comments and blank lines at the end of a section are dropped.
+
+    @HELP
+    HELP - Captian's Manual
+    LRS - Long Range Scan ...
+
+build() turns the source into a table (sst.str).  A StringTable keeps the table file open (until close()) and
+reads a paragraph by seeking to its offsets and reading it into one reusable buffer, so only
+the text being shown is in memory.  The table keeps the size and sha256 of the source it was
+built from.  When the table is missing, or the source on the Pico no longer matches it, it is
+built again from the source when it is opened.  A table without its source is used as it is.
+On a workstation "python3 strtable.py sst.txt theoracle.txt" builds the tables to copy to the
+Pico.
+
+File (integers little endian): "ST", format 1, 0, texts (uint16), paragraphs (uint16), source
+size (uint32), source sha256 (32 bytes), first paragraph of each text and the end (uint16),
+offset in the blob of each paragraph and the end (uint32), the UTF-8 blob, then the text names
+separated by new lines.
+
+    strings = StringTable("sst")
+    HELP = strings.id("HELP")
+    TextScroll(oled, rotary, button, strings.text(HELP)).display()
+
+V
+00		2026-10-18	jmr		original coding
+01		2026-10-18	jmr		tables keep the size and sha256 of their source and are rebuilt when it changes
+"""
+
+import sys
+import hashlib
+
+FORMAT = 1
+HEADER = 44
+
+def stamp(filename):
+    """ size and sha256 digest of a file, read through one small buffer """
+    h = hashlib.sha256()
+    buf = bytearray(256)
+    mv = memoryview(buf)
+    size = 0
+    with open(filename, "rb") as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            h.update(mv[0:n])
+            size += n
+    return size.to_bytes(4, "little") + h.digest()
+
+def parse(filename):
+    """ read a source file, return a list of (name, [paragraphs]) """
+    texts = []
+    with open(filename, "r") as f:
+        for line in f:
+            line = line.rstrip("\r\n")
+            if line.startswith("##"):
+                continue
+            if line.startswith("@"):
+                texts.append((line[1:].strip(), []))
+            elif texts:
+                texts[-1][1].append(line)
+    for name, paras in texts:
+        while paras and not paras[-1]:
+            paras.pop()
+    return texts
+
+def build(source, table):
+    """ write the table for the source file """
+    texts = parse(source)
+    firsts = bytearray()
+    offsets = bytearray()
+    blob = bytearray()
+    n = 0
+    for name, paras in texts:
+        firsts += n.to_bytes(2, "little")
+        for p in paras:
+            offsets += len(blob).to_bytes(4, "little")
+            blob += p.encode()
+            n += 1
+    firsts += n.to_bytes(2, "little")
+    offsets += len(blob).to_bytes(4, "little")
+    with open(table, "wb") as f:
+        f.write(b"ST" + bytes([FORMAT, 0]) + len(texts).to_bytes(2, "little") + n.to_bytes(2, "little"))
+        f.write(stamp(source))
+        f.write(firsts)
+        f.write(offsets)
+        f.write(blob)
+        f.write("\n".join([name for name, paras in texts]).encode())
+    return len(texts)
+
+class Text():
+    """ Text - the paragraphs of one text, read from the table as they are indexed.  TextScroll
+    wraps it like a list. """
+
+    def __init__(self, table, first, end):
+        self.table = table
+        self.first = first
+        self.end = end
+
+    def __len__(self):
+        return self.end - self.first
+
+    def __getitem__(self, i):
+        if i < 0 or i >= self.end - self.first:
+            raise IndexError
+        return self.table.paragraph(self.first + i)
+
+class StringTable():
+
+    def __init__(self, name, size=128):
+        """ open name.str, building it from name.txt when it is missing or out of date
+        Parameters:
+        :size: starting size of the paragraph buffer, it grows to the longest paragraph read
+        """
+        filename = name + ".str"
+        source = name + ".txt"
+        self.filename = filename
+        self.buf = bytearray(max(size, HEADER))
+        self.mv = memoryview(self.buf)
+        try:
+            sourceStamp = stamp(source)
+        except OSError:
+            sourceStamp = None ## only the table is on the Pico
+        try:
+            self.f = open(filename, "rb")
+            self.read(0, HEADER)
+            if sourceStamp is not None and (self.buf[2] != FORMAT or self.buf[8:HEADER] != sourceStamp):
+                self.close()
+        except OSError:
+            self.f = None
+        if self.f is None:
+            build(source, filename)
+        self.read(0, HEADER)
+        if self.buf[0:2] != b"ST" or self.buf[2] != FORMAT:
+            raise ValueError("not a string table " + filename)
+        self.texts = int.from_bytes(self.buf[4:6], "little")
+        self.paras = int.from_bytes(self.buf[6:8], "little")
+        self.offsets = HEADER + (self.texts + 1) * 2 ## start of the paragraph offsets
+        self.blob = self.offsets + (self.paras + 1) * 4 ## start of the blob
+        ## names are only needed to look up ids
+        end = self.offset(self.paras)
+        self.f.seek(self.blob + end)
+        self.names = str(self.f.read(), "utf-8").split("\n")
+
+    def read(self, pos, n):
+        ## n bytes at pos into the buffer
+        if self.f is None:
+            self.f = open(self.filename, "rb")
+        if n > len(self.buf):
+            self.buf = bytearray(n)
+            self.mv = memoryview(self.buf)
+        self.f.seek(pos)
+        self.f.readinto(self.mv[0:n])
+        return self.mv[0:n]
+
+    def offset(self, k):
+        return int.from_bytes(self.read(self.offsets + k * 4, 4), "little")
+
+    def __len__(self):
+        return self.texts
+
+    def id(self, name):
+        """ number of the first text called name """
+        return self.names.index(name)
+
+    def count(self, name):
+        """ number of texts in a row called name, starting with the first """
+        i = self.names.index(name)
+        n = 1
+        while i + n < self.texts and self.names[i + n] == name:
+            n += 1
+        return n
+
+    def bounds(self, t):
+        ## first paragraph of text t and of the one after it
+        b = self.read(HEADER + t * 2, 4)
+        return int.from_bytes(b[0:2], "little"), int.from_bytes(b[2:4], "little")
+
+    def paragraph(self, k):
+        """ paragraph k of the table as a string """
+        b = self.read(self.offsets + k * 4, 8)
+        start = int.from_bytes(b[0:4], "little")
+        end = int.from_bytes(b[4:8], "little")
+        return str(self.read(self.blob + start, end - start), "utf-8")
+
+    def text(self, t):
+        """ text t as a Text, its paragraphs are read when they are used """
+        first, end = self.bounds(t)
+        return Text(self, first, end)
+
+    def lines(self, t):
+        """ text t as a list of strings (for short texts) """
+        first, end = self.bounds(t)
+        return [self.paragraph(k) for k in range(first, end)]
+
+    def close(self):
+        """ close the file, it is opened again by the next read """
+        if self.f:
+            self.f.close()
+            self.f = None
+
+if __name__ == "__main__":
+    for source in sys.argv[1:]:
+        table = source.rsplit(".", 1)[0] + ".str"
+        print(table, build(source, table), "texts")
@@ -1,6 +1,6 @@
 """ Symbols - Draw non character symbols on a feramebuf
 
-Version 00
+Version 01
 James M. Reneau Ph.D.
 http://www.picohhg.com
 
@@ -8,17 +8,36 @@ This work is licensed under the Creative Commons Attribution-ShareAlike 2.0 Gene
 To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/2.0/ or send
 a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
 
-There is probably a much better way to do this.  Storing the pixels in byte arrays and blitting
-but this works for now and gets it all in one place to be reimplemented sometime.
+The glyphs are stored as packed MONO_VLSB column bytes.  Each one is turned into a small
+Sprite (a FrameBuffer that knows its size) the first time it is drawn and is then drawn with a
+single blit.  An inverted copy is cached for drawing in colour 0.
 
 V
 00		2023-05-22	jmr		original coding
+01		2026-10-18	jmr		glyphs stored as bytes and blitted from a sprite cache
 
 """
 
 import framebuf
 from micropython import const
 
+class Sprite(framebuf.FrameBuffer):
+    """ Sprite - a MONO_VLSB FrameBuffer that remembers its size so displays can track what a blit
+    changed. """
+    
+    def __init__(self, buffer, width, height):
+        self.buffer = buffer
+        self.width = width
+        self.height = height
+        super().__init__(buffer, width, height, framebuf.MONO_VLSB)
+        
+    def inverted(self):
+        ## copy with every pixel flipped
+        buf = bytearray(self.buffer)
+        for i in range(len(buf)):
+            buf[i] ^= 0xFF
+        return Sprite(buf, self.width, self.height)
+
 class Symbols():
     
     ## 8x8
@@ -33,126 +52,43 @@ class Symbols():
     DIAMOND = const(102)
     SPADE = const(103)
     
+    ## (width, height, MONO_VLSB column bytes - one row of bytes per 8 pixel page)
+    GLYPHS = {
+        ENTER: (8, 8, b"\xf8\xc0\xa0\xa0\x90\x0c\x07\x00"),
+        SHIFTUP: (8, 8, b"\x88\xcc\x66\x33\x66\xcc\x88\x00"),
+        SHIFTDOWN: (8, 8, b"\x11\x33\x66\xcc\x66\x33\x11\x00"),
+        BACKSPACE: (8, 8, b"\x08\x1c\x36\x63\x08\x08\x14\x00"),
+        CLUB: (10, 10, b"\x30\x78\x78\x36\xcf\x0f\x36\x78\x78\x30"
+            b"\x00\x00\x00\x00\x03\x03\x00\x00\x00\x00"),
+        HEART: (10, 10, b"\x0c\x1e\x7f\xfe\xfc\xfc\xfe\x7f\x1e\x0c"
+            b"\x00\x00\x00\x00\x03\x03\x00\x00\x00\x00"),
+        DIAMOND: (10, 10, b"\x30\x78\xfc\xfe\xff\xff\xfe\xfc\x78\x30"
+            b"\x00\x00\x00\x01\x03\x03\x01\x00\x00\x00"),
+        SPADE: (10, 10, b"\x10\x78\x7c\x3e\xff\xff\x3e\x7c\x78\x10"
+            b"\x00\x00\x00\x00\x03\x03\x00\x00\x00\x00"),
+        }
+    
+    ## (symbol, fg) -> Sprite, shared by every Symbols object
+    sprites = {}
+    
     def __init__(self, display):
         self.display = display
+        
+    @staticmethod
+    def sprite(symbol, fg=1):
+        """ return the cached sprite for a symbol, for fg 0 the sprite is inverted """
+        key = (symbol, fg)
+        s = Symbols.sprites.get(key)
+        if s is None:
+            if fg:
+                w, h, data = Symbols.GLYPHS[symbol]
+                s = Sprite(bytearray(data), w, h)
+            else:
+                s = Symbols.sprite(symbol, 1).inverted()
+            Symbols.sprites[key] = s
+        return s
     
     def draw(self, x, y, symbol, fg=1):
-        if symbol==Symbols.CLUB:
-            self.__drawClub(x, y, fg)    
-        elif symbol==Symbols.HEART:
-            self.__drawHeart(x, y, fg)    
-        elif symbol==Symbols.SPADE:
-            self.__drawSpade(x, y, fg)    
-        elif symbol==Symbols.DIAMOND:
-            self.__drawDiamond(x, y, fg)    
-        elif symbol==Symbols.ENTER:
-            self.__drawEnter(x, y, fg)    
-        elif symbol==Symbols.SHIFTUP:
-            self.__drawShiftUp(x, y, fg)
-        elif symbol==Symbols.SHIFTDOWN:
-            self.__drawShiftDown(x, y, fg)
-        elif symbol==Symbols.BACKSPACE:
-            self.__drawBackspace(x, y, fg)     
-
-    def __drawClub(self, x, y, fg):
-        ## draw a Club (10x10)
-        self.display.vline(x+0, y+4, 2, fg)
-        self.display.vline(x+1, y+3, 4, fg)
-        self.display.vline(x+2, y+3, 4, fg)
-        self.display.vline(x+3, y+1, 2, fg)
-        self.display.vline(x+3, y+4, 2, fg)
-        self.display.vline(x+4, y+0, 4, fg)
-        self.display.vline(x+4, y+6, 4, fg)
-        self.display.vline(x+5, y+0, 4, fg)
-        self.display.vline(x+5, y+8, 2, fg)
-        self.display.vline(x+6, y+1, 2, fg)
-        self.display.vline(x+6, y+4, 2, fg)
-        self.display.vline(x+7, y+3, 4, fg)
-        self.display.vline(x+8, y+3, 4, fg)
-        self.display.vline(x+9, y+4, 2, fg)
-        
-    def __drawSpade(self, x, y, fg):
-        ## draw a Spade (10x10)
-        self.display.vline(x+0, y+4, 1, fg)
-        self.display.vline(x+1, y+3, 4, fg)
-        self.display.vline(x+2, y+2, 5, fg)
-        self.display.vline(x+3, y+1, 5, fg)
-        self.display.vline(x+4, y+0, 10, fg)
-        self.display.vline(x+5, y+0, 10, fg)
-        self.display.vline(x+6, y+1, 5, fg)
-        self.display.vline(x+7, y+2, 5, fg)
-        self.display.vline(x+8, y+3, 4, fg)
-        self.display.vline(x+9, y+4, 1, fg)
-
-    def __drawHeart(self, x, y, fg):
-        ## draw a Heart (10x10)
-        self.display.vline(x+0, y+2, 2, fg)
-        self.display.vline(x+1, y+1, 4, fg)
-        self.display.vline(x+2, y+0, 7, fg)
-        self.display.vline(x+3, y+1, 7, fg)
-        self.display.vline(x+4, y+2, 8, fg)
-        self.display.vline(x+5, y+2, 8, fg)
-        self.display.vline(x+6, y+1, 7, fg)
-        self.display.vline(x+7, y+0, 7, fg)
-        self.display.vline(x+8, y+1, 4, fg)            
-        self.display.vline(x+9, y+2, 2, fg)
-        
-    def __drawDiamond(self, x, y, fg):
-        ## draw a Diamond (10x10)
-        self.display.vline(x+0, y+4, 2, fg)
-        self.display.vline(x+1, y+3, 4, fg)
-        self.display.vline(x+2, y+2, 6, fg)
-        self.display.vline(x+3, y+1, 8, fg)
-        self.display.vline(x+4, y+0, 10, fg)
-        self.display.vline(x+5, y+0, 10, fg)
-        self.display.vline(x+6, y+1, 8, fg)
-        self.display.vline(x+7, y+2, 6, fg)
-        self.display.vline(x+8, y+3, 4, fg)
-        self.display.vline(x+9, y+4, 2, fg)
-        
-    def __drawEnter(self, x, y, fg):
-        ## draw Enter Key (8x8)
-        self.display.vline(x+0, y+3, 5, fg)
-        self.display.vline(x+1, y+6, 2, fg)
-        self.display.pixel(x+2, y+5, fg)
-        self.display.pixel(x+2, y+7, fg)
-        self.display.pixel(x+3, y+5, fg)
-        self.display.pixel(x+3, y+7, fg)
-        self.display.pixel(x+4, y+4, fg)
-        self.display.pixel(x+4, y+7, fg)
-        self.display.vline(x+5, y+2, 2, fg)
-        self.display.vline(x+6, y+0, 3, fg)
-                
-    def __drawBackspace(self, x, y, fg):
-        ## draw Enter Key (8x8)
-        self.display.pixel(x+0, y+3, fg)
-        self.display.vline(x+1, y+2, 3, fg)
-        self.display.vline(x+2, y+1, 2, fg)
-        self.display.vline(x+2, y+4, 2, fg)
-        self.display.vline(x+3, y+0, 2, fg)
-        self.display.vline(x+3, y+5, 2, fg)
-        self.display.pixel(x+4, y+3, fg)
-        self.display.pixel(x+5, y+3, fg)
-        self.display.pixel(x+6, y+2, fg)
-        self.display.pixel(x+6, y+4, fg)
-
-    def __drawShiftUp(self, x, y, fg):
-        for n in range(2):
-            self.display.pixel(x+3, y+4*n+0, fg)
-            self.display.hline(x+2, y+4*n+1, 3, fg)
-            self.display.hline(x+1, y+4*n+2, 2, fg)
-            self.display.hline(x+4, y+4*n+2, 2, fg)
-            self.display.hline(x+0, y+4*n+3, 2, fg)
-            self.display.hline(x+5, y+4*n+3, 2, fg)
-        
-
-    def __drawShiftdown(self, x, y, fg):
-        for n in range(2):
-            self.display.pixel(x+3, y+4*n+3, fg)
-            self.display.hline(x+2, y+4*n+2, 3, fg)
-            self.display.hline(x+1, y+4*n+1, 2, fg)
-            self.display.hline(x+4, y+4*n+1, 2, fg)
-            self.display.hline(x+0, y+4*n+0, 2, fg)
-            self.display.hline(x+5, y+4*n+0, 2, fg)
-        
-
+        if symbol in Symbols.GLYPHS:
+            ## the background of the sprite is the key colour and is not drawn
+            self.display.blit(Symbols.sprite(symbol, fg), x, y, 0 if fg else 1)
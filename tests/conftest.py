@@ -0,0 +1,13 @@
+import os
+import sys
+
+## the modules are flat in the folder above
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+## framebuf, micropython and machine for CPython on a virtual clock, the modules keep their
+## console paths
+import emulator
+emulator.install(device=False)
+
+## a demo to run by hand on the Pico or a console, not a pytest module
+collect_ignore = ["choosers_test.py"]
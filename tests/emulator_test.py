@@ -0,0 +1,7 @@
+""" Host stand-ins for the MicroPython modules. """
+
+import micropython
+
+def test_mem_info_runs_on_the_host(capsys):
+    micropython.mem_info()
+    assert "GC: total: 0, used:" in capsys.readouterr().out
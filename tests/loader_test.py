@@ -0,0 +1,37 @@
+""" Cross compiled modules are only used while they match their source and this MicroPython. """
+
+import sys
+
+from loader import Loader
+
+def mpy(tmp_path, name, version=6, flags=0):
+    (tmp_path / "mpy" / (name + ".mpy")).write_bytes(b"M" + bytes([version, flags]) + bytes(8))
+
+def compiled(tmp_path, monkeypatch):
+    ## two modules built from the sources on the Pico, running MicroPython with .mpy version 6 on armv6m
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys.implementation, "_mpy", 6 | 3 << 10, raising=False)
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    (tmp_path / "mpy").mkdir()
+    loader = Loader()
+    lines = []
+    for name in ("alpha", "beta"):
+        (tmp_path / (name + ".py")).write_text("X = 1\n")
+        lines.append(name + " " + loader.sha256(name + ".py") + "\n")
+    (tmp_path / "mpy" / "manifest.txt").write_text("".join(lines))
+    return loader
+
+def test_matching_mpy_is_used(tmp_path, monkeypatch):
+    loader = compiled(tmp_path, monkeypatch)
+    mpy(tmp_path, "alpha", flags=3 << 2)
+    mpy(tmp_path, "beta")
+    assert loader.validate() == 2
+    assert sys.path[0] == "mpy"
+
+def test_other_version_or_arch_is_removed(tmp_path, monkeypatch):
+    loader = compiled(tmp_path, monkeypatch)
+    mpy(tmp_path, "alpha", version=5)
+    mpy(tmp_path, "beta", flags=2 << 2)
+    assert loader.validate() == 0
+    assert loader.stale == ["alpha", "beta"]
+    assert sorted((tmp_path / "mpy").iterdir()) == [tmp_path / "mpy" / "manifest.txt"]
@@ -0,0 +1,86 @@
+""" The NumPy FrameBuffer draws the same bytes as the pure Python one. """
+
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from emulator import framebuf
+from emulator import npframebuf
+
+def pair(width, height, rnd=None):
+    ## the same random MONO_VLSB buffer under both FrameBuffers
+    size = ((height + 7) // 8) * width
+    data = bytes(rnd.getrandbits(8) for i in range(size)) if rnd else bytes(size)
+    a = bytearray(data)
+    b = bytearray(data)
+    return (a, framebuf.FrameBuffer(a, width, height, framebuf.MONO_VLSB),
+        b, npframebuf.FrameBuffer(b, width, height, npframebuf.MONO_VLSB))
+
+def coord(rnd, size):
+    ## mostly inside, sometimes clipped
+    return rnd.randint(-size // 2, size + size // 2)
+
+def operations(rnd, width, height, n):
+    ## (name, args) for n random calls
+    ops = []
+    for i in range(n):
+        ## a fill clears what came before, so it is rare
+        kind = "fill" if rnd.randint(0, 40) == 0 else rnd.choice(("fill_rect", "line", "text", "blit",
+            "scroll", "pixel", "hline", "vline", "rect"))
+        c = rnd.randint(0, 1)
+        if kind == "fill_rect" or kind == "rect":
+            args = (coord(rnd, width), coord(rnd, height), rnd.randint(-2, width), rnd.randint(-2, height), c)
+        elif kind == "line":
+            args = (coord(rnd, width), coord(rnd, height), coord(rnd, width), coord(rnd, height), c)
+        elif kind == "text":
+            s = "".join(rnd.choice("AZaz09 !~\x7f\xe9") for j in range(rnd.randint(0, 6)))
+            args = (s, coord(rnd, width), coord(rnd, height), c)
+        elif kind == "blit":
+            w = rnd.randint(1, 20)
+            h = rnd.randint(1, 20)
+            args = ((w, h, rnd.getrandbits(32)), coord(rnd, width), coord(rnd, height), rnd.choice((-1, 0, 1)))
+        elif kind == "scroll":
+            args = (rnd.randint(-width - 2, width + 2) // rnd.choice((1, 8)),
+                rnd.randint(-height - 2, height + 2) // rnd.choice((1, 8)))
+        elif kind == "pixel":
+            args = (coord(rnd, width), coord(rnd, height), c)
+        elif kind == "hline" or kind == "vline":
+            args = (coord(rnd, width), coord(rnd, height), rnd.randint(-2, width), c)
+        else:
+            args = (c,)
+        ops.append((kind, args))
+    return ops
+
+def apply(fb, module, kind, args):
+    if kind == "blit":
+        (w, h, seed), x, y, key = args
+        a, py, b, np = pair(w, h, random.Random(seed))
+        fb.blit(py if module is framebuf else np, x, y, key)
+    else:
+        getattr(fb, kind)(*args)
+
+@pytest.mark.parametrize("width,height", [(128, 64), (37, 21), (8, 5)])
+@pytest.mark.parametrize("seed", range(4))
+def test_random_calls_match(width, height, seed):
+    rnd = random.Random(seed * 1000 + width)
+    a, py, b, np = pair(width, height, rnd)
+    for kind, args in operations(rnd, width, height, 150):
+        apply(py, framebuf, kind, args)
+        apply(np, npframebuf, kind, args)
+        assert a == b, kind + str(args)
+    for x in range(-1, width + 1):
+        for y in range(-1, height + 1, 3):
+            assert py.pixel(x, y) == np.pixel(x, y)
+
+def test_blit_palette_matches():
+    a, py, b, np = pair(40, 16)
+    sa, spy, sb, snp = pair(9, 9, random.Random(5))
+    pa, ppy, pb, pnp = pair(2, 1)
+    for pal in (ppy, pnp):
+        pal.pixel(0, 0, 1)
+        pal.pixel(1, 0, 0)
+    py.blit(spy, 3, 4, -1, ppy)
+    np.blit(snp, 3, 4, -1, pnp)
+    assert a == b
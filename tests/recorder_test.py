@@ -0,0 +1,102 @@
+""" A session recorded by a Recorder plays back the same through a Replay. """
+
+import random
+import time
+
+from recorder import Recorder
+from recorder import Replay
+from siminput import Script
+from siminput import ScriptEnd
+from siminput import SimRotary
+from siminput import SimButton
+from siminput import SimBus
+
+SESSION = "rotate 2, wait 300, press, rotate -3, wait 70000, press, move 200, press"
+
+def drive(rotary, button):
+    ## poll like a chooser, the rotary value and a random number at each press
+    seen = []
+    try:
+        while True:
+            v = rotary.value()
+            if button.pressed():
+                seen.append((v, random.randint(0, 1000)))
+            time.sleep_ms(5)
+    except ScriptEnd:
+        pass
+    return seen
+
+def test_round_trip(tmp_path):
+    filename = str(tmp_path / "session.rec")
+    script = Script(SESSION)
+    rotary = SimRotary(script)
+    button = SimButton(script)
+    rec = Recorder(filename, app=3, seed=1234)
+    rec.attachRotary(rotary)
+    rec.attachButton(button)
+    recorded = drive(rotary, button)
+    rec.close()
+    assert rec.dropped == 0
+    assert [v for v, r in recorded] == [2, -1, 199]
+
+    for realtime in (False, True):
+        replay = Replay(filename)
+        assert replay.app == 3
+        assert replay.seed == 1234
+        replay.start(realtime)
+        assert drive(replay.rotary, replay.button) == recorded
+
+def test_realtime_keeps_the_gaps(tmp_path):
+    filename = str(tmp_path / "session.rec")
+    script = Script(SESSION)
+    rotary = SimRotary(script)
+    button = SimButton(script)
+    rec = Recorder(filename, seed=1)
+    rec.attachRotary(rotary)
+    rec.attachButton(button)
+    start = time.ticks_ms()
+    drive(rotary, button)
+    took = time.ticks_diff(time.ticks_ms(), start)
+    rec.close()
+    replay = Replay(filename)
+    replay.start(True)
+    start = time.ticks_ms()
+    drive(replay.rotary, replay.button)
+    ## a gap over 65535 ms is split into WAIT records and still adds up
+    assert abs(time.ticks_diff(time.ticks_ms(), start) - took) < 100
+
+def chooser(rotary, button, bus):
+    ## a chooser's loop, the frames drawn and when they were drawn
+    frames = []
+    v = None
+    start = time.ticks_ms()
+    try:
+        while True:
+            newv = rotary.value()
+            if newv != v:
+                v = newv
+                frames.append((v, time.ticks_diff(time.ticks_ms(), start)))
+            if button.pressed():
+                frames.append(("press", time.ticks_diff(time.ticks_ms(), start)))
+            bus.wait(100)
+    except ScriptEnd:
+        pass
+    return frames
+
+def test_fast_spin_replays_at_its_own_pace(tmp_path):
+    filename = str(tmp_path / "session.rec")
+    ## four detents 10 ms apart, then a press
+    script = Script("wait 30, move 1, wait 10, move 1, wait 10, move 1, wait 10, move 1, wait 40, press")
+    rotary = SimRotary(script)
+    button = SimButton(script)
+    rec = Recorder(filename, seed=1)
+    rec.attachRotary(rotary)
+    rec.attachButton(button)
+    recorded = chooser(rotary, button, SimBus(script))
+    rec.close()
+    replay = Replay(filename)
+    replay.start(True)
+    replayed = chooser(replay.rotary, replay.button, replay.bus)
+    assert [v for v, t in replayed] == [v for v, t in recorded] == [0, 1, 2, 3, 4, "press"]
+    for (v, t), (rv, rt) in zip(recorded, replayed):
+        assert abs(rt - t) <= 1
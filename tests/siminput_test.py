@@ -0,0 +1,74 @@
+""" Script playback through SimRotary and SimButton. """
+
+import time
+
+import pytest
+
+from siminput import Script
+from siminput import ScriptEnd
+from siminput import SimRotary
+from siminput import SimButton
+from siminput import SimBus
+
+def play(text):
+    ## poll like a chooser until the script ends, the rotary value at each press
+    script = Script(text)
+    rotary = SimRotary(script)
+    button = SimButton(script)
+    values = []
+    try:
+        while True:
+            v = rotary.value()
+            if button.pressed():
+                values.append(v)
+            time.sleep_ms(10)
+    except ScriptEnd:
+        pass
+    return values
+
+def test_parse():
+    s = Script("rotate +3, press\nwait 500,move -2")
+    assert s.events == [(Script.ROTATE, 3), (Script.PRESS, 0), (Script.WAIT, 500), (Script.MOVE, -2)]
+    with pytest.raises(ValueError):
+        Script("spin 3")
+
+def test_presses_see_the_turns_before_them():
+    assert play("rotate 3, press, rotate -5, press, move 4, press") == [3, -2, 2]
+
+def test_script_end_on_the_button_poll():
+    script = Script("press")
+    rotary = SimRotary(script)
+    button = SimButton(script)
+    assert button.pressed()
+    assert script.done()
+    ## the rotary keeps reading, the button ends it
+    assert rotary.value() == 0
+    with pytest.raises(ScriptEnd):
+        button.pressed()
+
+def test_wait_holds_the_next_event():
+    script = Script("wait 500, press")
+    button = SimButton(script)
+    start = time.ticks_ms()
+    while not button.pressed():
+        time.sleep_ms(10)
+    assert time.ticks_diff(time.ticks_ms(), start) >= 500
+
+def test_a_poll_plays_every_due_move():
+    script = Script("move 1, move 1, rotate 2, move 1, wait 100, move 5, press")
+    rotary = SimRotary(script)
+    rotary.value()
+    assert rotary.value() == 5
+    ## the wait holds the rest
+    assert rotary.value() == 5
+
+def test_bus_wakes_when_the_next_event_is_due():
+    script = Script("wait 250, press")
+    bus = SimBus(script)
+    button = SimButton(script)
+    start = time.ticks_ms()
+    assert bus.wait(100) is None
+    assert time.ticks_diff(time.ticks_ms(), start) == 100
+    assert bus.wait(1000) is not None
+    assert time.ticks_diff(time.ticks_ms(), start) == 250
+    assert button.pressed()
@@ -0,0 +1,126 @@
+""" show() sends only the changed windows and the panel ends up the same as a full refresh. """
+
+import random
+
+from emulator.machine import I2C
+from emulator.oled import SSD1306_I2C
+
+## arguments that follow a command byte
+ARGS = {0x20: 1, 0x21: 2, 0x22: 2, 0x81: 1, 0xA8: 1, 0xD3: 1, 0xDA: 1, 0xD5: 1, 0xD9: 1, 0xDB: 1,
+    0x8D: 1, 0x26: 6, 0x27: 6, 0x29: 5, 0x2A: 5, 0xA3: 2}
+
+class Panel(I2C):
+    """ the display RAM of an SSD1306 in horizontal addressing mode, fed from the I2C bytes """
+
+    def __init__(self):
+        super().__init__(0)
+        self.ram = bytearray(8 * 128)
+        self.cmd = []
+        self.col0, self.col1, self.page0, self.page1 = 0, 127, 0, 7
+        self.col, self.page = 0, 0
+
+    def writeto(self, addr, buf, stop=True):
+        self.decode(bytes(buf))
+        return super().writeto(addr, buf, stop)
+
+    def writevto(self, addr, vector, stop=True):
+        self.decode(b"".join(bytes(b) for b in vector))
+        return super().writevto(addr, vector, stop)
+
+    def decode(self, b):
+        i = 0
+        while i < len(b):
+            control = b[i]
+            i += 1
+            ## Co=1 one byte follows, Co=0 the rest of the transaction
+            n = 1 if control & 0x80 else len(b) - i
+            for byte in b[i:i + n]:
+                if control & 0x40:
+                    self.data(byte)
+                else:
+                    self.command(byte)
+            i += n
+
+    def command(self, byte):
+        self.cmd.append(byte)
+        if len(self.cmd) <= ARGS.get(self.cmd[0], 0):
+            return
+        if self.cmd[0] == 0x21:
+            self.col0, self.col1 = self.cmd[1], self.cmd[2]
+            self.col = self.col0
+        elif self.cmd[0] == 0x22:
+            self.page0, self.page1 = self.cmd[1], self.cmd[2]
+            self.page = self.page0
+        self.cmd = []
+
+    def data(self, byte):
+        self.ram[self.page * 128 + self.col] = byte
+        self.col += 1
+        if self.col > self.col1:
+            self.col = self.col0
+            self.page = self.page + 1 if self.page < self.page1 else self.page0
+
+    def shown(self, width, height):
+        ## the part of the RAM the panel shows, as the driver's buffer
+        shift = 32 if width == 64 else 0
+        return b"".join(self.ram[p * 128 + shift:p * 128 + shift + width] for p in range(height // 8))
+
+def draw(oled, rnd):
+    ## a few random changes, sometimes none
+    for i in range(rnd.randint(0, 4)):
+        kind = rnd.randint(0, 5)
+        x = rnd.randint(-10, oled.width)
+        y = rnd.randint(-10, oled.height)
+        c = rnd.randint(0, 1)
+        if kind == 0:
+            oled.text("PicoHHG"[:rnd.randint(1, 7)], x, y, c)
+        elif kind == 1:
+            oled.fill_rect(x, y, rnd.randint(1, 40), rnd.randint(1, 20), c)
+        elif kind == 2:
+            oled.line(x, y, rnd.randint(0, oled.width), rnd.randint(0, oled.height), c)
+        elif kind == 3:
+            oled.pixel(x, y, c)
+        elif kind == 4:
+            oled.hline(x, y, rnd.randint(1, oled.width), c)
+        else:
+            oled.fill(c)
+
+def run(width, height, seed):
+    rnd = random.Random(seed)
+    partial = Panel()
+    full = Panel()
+    a = SSD1306_I2C(width, height, partial)
+    b = SSD1306_I2C(width, height, full)
+    sent = 0
+    for frame in range(60):
+        state = rnd.getstate()
+        draw(a, rnd)
+        rnd.setstate(state)
+        draw(b, rnd)
+        a.show()
+        b.show(full=True)
+        sent += a.frame_bytes
+        assert a.buffer == b.buffer
+        assert partial.shown(width, height) == bytes(a.buffer)
+        assert full.shown(width, height) == bytes(b.buffer)
+    return sent
+
+def test_partial_show_matches_full_refresh():
+    sent = 0
+    for seed in range(5):
+        sent += run(128, 64, seed)
+    ## and the dirty windows sent less than full frames would have
+    assert sent < 5 * 60 * 1024
+
+def test_shifted_64_wide_display():
+    for seed in range(3):
+        run(64, 48, seed)
+
+def test_clean_show_sends_nothing():
+    panel = Panel()
+    oled = SSD1306_I2C(128, 64, panel)
+    oled.show()
+    transactions = panel.transactions
+    oled.show()
+    assert oled.frame_bytes == 0
+    assert panel.transactions == transactions
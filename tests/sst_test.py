@@ -0,0 +1,49 @@
+""" Super Trekie plays on the console, where the choosers return floats. """
+
+import builtins
+import importlib
+import os
+import random
+import shutil
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class Done(Exception):
+    pass
+
+def play(monkeypatch, tmp_path, answers):
+    ## run the game from the start menu with the answers typed in, the answers left over
+    shutil.copy(os.path.join(ROOT, "sst.txt"), str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    answers = list(answers)
+    def typed(prompt=""):
+        if not answers:
+            raise Done()
+        return answers.pop(0)
+    monkeypatch.setattr(builtins, "input", typed)
+    monkeypatch.setattr(builtins, "print", lambda *args, **kw: None)
+    sys.modules.pop("sst", None)
+    sst = importlib.import_module("sst")
+    try:
+        from context import Context
+        random.seed(3)
+        with pytest.raises(Done):
+            sst.run(Context())
+    finally:
+        sys.modules.pop("sst", None)
+    return answers
+
+@pytest.mark.parametrize("answers", [
+    ["ACCEPT", "IMP", "45", "3"],
+    ["ACCEPT", "IMP", "200.5", "2.7"],
+    ["ACCEPT", "WRP", "90", "1.5"],
+    ["ACCEPT", "WRP", "272.5", "0.25"],
+    ["ACCEPT", "PHO", "135"],
+    ["ACCEPT", "PHO", "12.5"],
+])
+def test_moves_and_torpedoes_take_console_numbers(monkeypatch, tmp_path, answers):
+    ## every answer is used and the next command is asked for
+    assert play(monkeypatch, tmp_path, answers) == []
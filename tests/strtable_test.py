@@ -0,0 +1,79 @@
+""" String tables built from a source file and read a paragraph at a time. """
+
+from strtable import StringTable
+from strtable import build
+from strtable import parse
+
+SOURCE = """## comments are skipped
+@HELP
+HELP - Captian's Manual
+LRS - Long Range Scan
+Torpedoes été
+
+@FACE
+one
+@FACE
+two
+@EMPTY
+@LONG
+""" + "word " * 100 + "\n"
+
+def table(tmp_path):
+    source = tmp_path / "game.txt"
+    source.write_text(SOURCE, encoding="utf-8")
+    return StringTable(str(tmp_path / "game"), size=16)
+
+def test_parse_drops_comments_and_trailing_blanks(tmp_path):
+    source = tmp_path / "game.txt"
+    source.write_text(SOURCE, encoding="utf-8")
+    texts = parse(str(source))
+    assert [name for name, paras in texts] == ["HELP", "FACE", "FACE", "EMPTY", "LONG"]
+    assert texts[0][1] == ["HELP - Captian's Manual", "LRS - Long Range Scan", "Torpedoes été"]
+    assert texts[3][1] == []
+
+def test_built_on_first_open(tmp_path):
+    strings = table(tmp_path)
+    assert (tmp_path / "game.str").exists()
+    assert len(strings) == 5
+    assert strings.id("HELP") == 0
+    assert strings.id("FACE") == 1
+    assert strings.count("FACE") == 2
+    assert strings.count("LONG") == 1
+
+def test_lookup(tmp_path):
+    strings = table(tmp_path)
+    assert strings.lines(strings.id("HELP")) == parse(str(tmp_path / "game.txt"))[0][1]
+    assert strings.lines(strings.id("FACE") + 1) == ["two"]
+    assert strings.lines(strings.id("EMPTY")) == []
+    ## longer than the buffer it started with
+    assert strings.lines(strings.id("LONG")) == [("word " * 100).rstrip(" ") + " "]
+
+def test_text_reads_as_indexed(tmp_path):
+    strings = table(tmp_path)
+    text = strings.text(strings.id("HELP"))
+    assert len(text) == 3
+    assert text[2] == "Torpedoes été"
+    assert list(text) == strings.lines(0)
+    ## closed tables open again on the next read
+    strings.close()
+    assert text[0] == "HELP - Captian's Manual"
+
+def test_build_count(tmp_path):
+    source = tmp_path / "game.txt"
+    source.write_text(SOURCE, encoding="utf-8")
+    assert build(str(source), str(tmp_path / "other.str")) == 5
+    assert (tmp_path / "other.str").read_bytes() [:2] == b"ST"
+
+def test_rebuilt_when_source_changes(tmp_path):
+    strings = table(tmp_path)
+    strings.close()
+    (tmp_path / "game.txt").write_text(SOURCE + "@MORE\nnew text\n", encoding="utf-8")
+    strings = StringTable(str(tmp_path / "game"), size=16)
+    assert len(strings) == 6
+    assert strings.lines(strings.id("MORE")) == ["new text"]
+
+def test_used_as_is_without_source(tmp_path):
+    table(tmp_path).close()
+    (tmp_path / "game.txt").unlink()
+    strings = StringTable(str(tmp_path / "game"), size=16)
+    assert strings.count("FACE") == 2
@@ -0,0 +1,45 @@
+""" TextCache draws what display.text() draws and keeps the recently used strips in budget. """
+
+from emulator.oled import SSD1306_I2C
+from textcache import TextCache
+
+def test_same_pixels_as_text():
+    cached = SSD1306_I2C(128, 64)
+    plain = SSD1306_I2C(128, 64)
+    cache = TextCache()
+    for oled in (cached, plain):
+        oled.fill(0)
+        oled.fill_rect(0, 20, 128, 12, 1)
+    for s, x, y, c in (("Menu", 3, 0, 1), ("Menu", 3, 9, 1), ("choose...", -4, 22, 0), ("Quit", 100, 60, 1)):
+        cache.text(cached, s, x, y, c)
+        plain.text(s, x, y, c)
+    assert cached.buffer == plain.buffer
+    assert cache.hits == 1
+    assert cache.misses == 3
+
+def test_least_recently_used_is_evicted():
+    oled = SSD1306_I2C(128, 64)
+    cache = TextCache(budget=80)
+    cache.text(oled, "abcd", 0, 0)
+    cache.text(oled, "efgh", 0, 0)
+    assert cache.used == 64
+    cache.text(oled, "abcd", 0, 0)
+    cache.text(oled, "ijkl", 0, 0)
+    assert ("efgh", 1) not in cache.strips
+    assert ("abcd", 1) in cache.strips
+    assert ("ijkl", 1) in cache.strips
+    assert cache.used == 64
+    assert cache.order == [("abcd", 1), ("ijkl", 1)]
+
+def test_budget():
+    oled = SSD1306_I2C(128, 64)
+    cache = TextCache(budget=80)
+    for i in range(50):
+        cache.text(oled, "item " + str(i), 0, 0)
+        assert cache.used <= cache.budget
+        assert cache.used == sum(len(s.buffer) for s in cache.strips.values())
+    ## too big to cache, drawn directly
+    cache.text(oled, "much too long to cache", 0, 0)
+    assert ("much too long to cache", 1) not in cache.strips
+    cache.clear()
+    assert cache.used == 0 and not cache.strips
@@ -0,0 +1,55 @@
+""" ChooseUI repaints only what changed, and everything after the oled is filled.  ChooseList
+checks its options. """
+
+import pytest
+
+from choosers import ChooseList
+from choosers import ChooseUI
+from choosers import ChooserUIButton
+from emulator.oled import SSD1306_I2C
+
+class Counting(ChooserUIButton):
+    ## a button that counts its draws
+    def __init__(self, oled, x):
+        super().__init__(oled, x, 0, "", 10, 10)
+        self.draws = 0
+
+    def draw(self):
+        self.draws += 1
+        super().draw()
+
+def setup():
+    oled = SSD1306_I2C(128, 64)
+    widgets = [Counting(oled, 0), Counting(oled, 20), Counting(oled, 40)]
+    return oled, widgets, ChooseUI(oled, None, None, widgets)
+
+def test_first_paint_draws_every_widget():
+    oled, widgets, ui = setup()
+    ui.paint()
+    assert [w.draws for w in widgets] == [1, 1, 1]
+
+def test_only_changed_widgets_repaint():
+    oled, widgets, ui = setup()
+    ui.paint()
+    frames = len(oled.frames)
+    widgets[1].hasFocus = True
+    ui.paint()
+    assert [w.draws for w in widgets] == [1, 2, 1]
+    ui.paint()
+    assert [w.draws for w in widgets] == [1, 2, 1]
+    assert len(oled.frames) == frames + 1
+
+def test_fill_repaints_every_widget():
+    oled, widgets, ui = setup()
+    ui.paint()
+    oled.fill(0)
+    oled.text("Mark your hand.", 0, 40)
+    ui.paint()
+    assert [w.draws for w in widgets] == [2, 2, 2]
+    ## the widgets are back on the screen
+    assert oled.pixel(0, 0) == 1 and oled.pixel(20, 0) == 1
+
+def test_choose_list_needs_options():
+    oled = SSD1306_I2C(128, 64)
+    with pytest.raises(ValueError):
+        ChooseList(oled, None, None, [], rows=4)
@@ -0,0 +1,42 @@
+""" WrappedText gives the lines chopText gives, however the view moves over the source. """
+
+from choosers import TextScroll
+from choosers import WrappedText
+
+PARAGRAPHS = ["para" + str(i) + " " + "some words to wrap " * (i % 3 + 1) for i in range(12)]
+
+def eager():
+    return TextScroll.chopText(None, PARAGRAPHS)
+
+def test_list_and_generator():
+    assert list(WrappedText(PARAGRAPHS)) == eager()
+    assert list(WrappedText(p for p in PARAGRAPHS)) == eager()
+
+def test_file_back_then_forward(tmp_path):
+    path = tmp_path / "text.txt"
+    path.write_text("\n".join(PARAGRAPHS) + "\n")
+    lines = eager()
+    with open(str(path)) as f:
+        w = WrappedText(f)
+        w.ensure(25)
+        ## back to the start, then on past what was wrapped
+        assert w[0] == lines[0]
+        assert w[3] == lines[3]
+        assert w.ensure(len(lines) + 10) == len(lines)
+        assert w.known == len(lines)
+        assert [w[n] for n in range(len(lines))] == lines
+        ## and backwards over evicted paragraphs
+        assert [w[n] for n in range(len(lines) - 1, -1, -1)] == lines[::-1]
+
+def test_file_scrolled_a_line_at_a_time(tmp_path):
+    path = tmp_path / "text.txt"
+    path.write_text("\n".join(PARAGRAPHS) + "\n")
+    lines = eager()
+    with open(str(path)) as f:
+        w = WrappedText(f)
+        ## a view of 5 rows going down, then up, then down again
+        seen = []
+        for top in list(range(0, 20)) + list(range(20, 0, -1)) + list(range(0, len(lines) - 4)):
+            seen.append([w[n] for n in range(top, top + 5)])
+            assert seen[-1] == lines[top:top + 5]
+        assert len(w) == len(lines)
@@ -0,0 +1,75 @@
+""" TextCache - Pre-rendered text strips drawn with a blit.
+
+Version 00
+James M. Reneau Ph.D.
+http://www.picohhg.com
+
+This work is licensed under the Creative Commons Attribution-ShareAlike 2.0 Generic License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/2.0/ or send
+a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+
+Strings that are drawn over and over (menu items, command names, labels) are rendered once into
+a small Sprite keyed by the string and colour and blitted after that.  The least recently used
+strips are dropped when the cache goes over its memory budget.
+
+V
+00		2026-10-18	jmr		original coding
+"""
+
+from symbols import Sprite
+
+class TextCache():
+    
+    def __init__(self, budget=2048):
+        self.budget = budget ## bytes of strip buffers to keep
+        self.used = 0
+        self.hits = 0
+        self.misses = 0
+        self.strips = {} ## (string, colour) -> Sprite
+        self.order = [] ## keys, least recently used first
+        
+    def text(self, display, s, x, y, c=1):
+        """ draw s on the display like display.text(s, x, y, c) """
+        if not s:
+            return
+        key = (s, c)
+        strip = self.strips.get(key)
+        if strip is None:
+            self.misses += 1
+            size = len(s) * 8
+            if size > self.budget:
+                display.text(s, x, y, c)
+                return
+            while self.used + size > self.budget:
+                self.evict()
+            strip = self.render(s, c)
+            self.strips[key] = strip
+            self.order.append(key)
+            self.used += size
+        else:
+            self.hits += 1
+            if self.order[-1] != key:
+                self.order.remove(key)
+                self.order.append(key)
+        ## the strip background is the key colour and is not drawn
+        display.blit(strip, x, y, 0 if c else 1)
+        
+    def render(self, s, c):
+        strip = Sprite(bytearray(len(s) * 8), len(s) * 8, 8)
+        strip.text(s, 0, 0, 1)
+        if not c:
+            strip = strip.inverted()
+        return strip
+    
+    def evict(self):
+        key = self.order.pop(0)
+        strip = self.strips.pop(key)
+        self.used -= len(strip.buffer)
+        
+    def clear(self):
+        self.strips = {}
+        self.order = []
+        self.used = 0
+        
+    def stats(self):
+        return "hit " + str(self.hits) + " miss " + str(self.misses) + " " + str(self.used) + "/" + str(self.budget)
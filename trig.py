@@ -0,0 +1,106 @@
+""" trig - Integer degree sine, cosine and atan2 from lookup tables.
+
+Version 00
+James M. Reneau Ph.D.
+http://www.picohhg.com
+
+This work is licensed under the Creative Commons Attribution-ShareAlike 2.0 Generic License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/2.0/ or send
+a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
+
+The RP2040 has no FPU so math.sin and friends are slow.  sin() and cos() take whole degrees
+and return fixed point numbers with SHIFT fraction bits (ONE is 1.0), read from a quarter wave
+table.  atan2() and heading() return whole degrees from an octant table.  Angles are measured
+like the screen: 0 is to the right and they turn clockwise because y grows down.  heading() is
+the compass kind, 0 is up.
+
+    x, y = trig.polar(64, 32, 20, 45) ## point 20 pixels from (64, 32) at 45 degrees
+    dx = trig.mul(10, trig.sin(30)) ## 5
+
+V
+00		2026-10-18	jmr		original coding
+"""
+
+from array import array
+
+## plain ints (not const) so the choosers still import on a console
+SHIFT = 14
+ONE = 16384
+_HALF = 8192
+
+## sin of 0..90 degrees times ONE
+_SIN = array('h', [
+    0, 286, 572, 857, 1143, 1428, 1713, 1997, 2280, 2563, 2845, 3126,
+    3406, 3686, 3964, 4240, 4516, 4790, 5063, 5334, 5604, 5872, 6138, 6402,
+    6664, 6924, 7182, 7438, 7692, 7943, 8192, 8438, 8682, 8923, 9162, 9397,
+    9630, 9860, 10087, 10311, 10531, 10749, 10963, 11174, 11381, 11585, 11786, 11982,
+    12176, 12365, 12551, 12733, 12911, 13085, 13255, 13421, 13583, 13741, 13894, 14044,
+    14189, 14330, 14466, 14598, 14726, 14849, 14968, 15082, 15191, 15296, 15396, 15491,
+    15582, 15668, 15749, 15826, 15897, 15964, 16026, 16083, 16135, 16182, 16225, 16262,
+    16294, 16322, 16344, 16362, 16374, 16382, 16384])
+
+## atan(t / 64) in tenths of a degree for t 0..64
+_ATAN = array('h', [
+    0, 9, 18, 27, 36, 45, 54, 62, 71, 80, 89, 98,
+    106, 115, 123, 132, 140, 149, 157, 165, 174, 182, 190, 198,
+    206, 213, 221, 229, 236, 244, 251, 258, 266, 273, 280, 287,
+    294, 300, 307, 314, 320, 326, 333, 339, 345, 351, 357, 363,
+    369, 374, 380, 386, 391, 396, 402, 407, 412, 417, 422, 427,
+    432, 436, 441, 445, 450])
+
+def sin(deg):
+    ## sine of whole degrees, times ONE
+    deg %= 360
+    if deg < 90:
+        return _SIN[deg]
+    if deg < 180:
+        return _SIN[180 - deg]
+    if deg < 270:
+        return -_SIN[deg - 180]
+    return -_SIN[360 - deg]
+
+def cos(deg):
+    ## cosine of whole degrees, times ONE
+    return sin(deg + 90)
+
+def mul(n, f):
+    ## n times a fixed point f, rounded to an int
+    return (n * f + _HALF) >> SHIFT
+
+def toInt(f):
+    ## a fixed point number rounded to an int
+    return (f + _HALF) >> SHIFT
+
+def polar(cx, cy, r, deg):
+    ## the point r from (cx, cy) at deg degrees
+    return (cx + mul(r, cos(deg)), cy + mul(r, sin(deg)))
+
+def atan2(y, x):
+    ## angle of (x, y) in whole degrees 0..359, 0 for (0, 0)
+    ax = abs(x)
+    ay = abs(y)
+    if ax == 0 and ay == 0:
+        return 0
+    ## angle within the octant in tenths, the ratio is looked up in 1/64 steps with the
+    ## remainder interpolated
+    if ay <= ax:
+        n = ay << 6
+        d = ax
+    else:
+        n = ax << 6
+        d = ay
+    t = n // d
+    a = _ATAN[t]
+    if t < 64:
+        a += (_ATAN[t + 1] - a) * (n - t * d) // d
+    if ay > ax:
+        a = 900 - a
+    if x < 0:
+        a = 1800 - a
+    if y < 0:
+        a = 3600 - a
+    return ((a + 5) // 10) % 360
+
+def heading(dx, dy):
+    ## compass heading of (dx, dy), 0 is up (dy negative) and it turns clockwise
+    return atan2(dx, -dy)